@@ -1,3 +1,5 @@
+import importlib
+
 # Hacky ophyd and pyepics hotfixes
 import epics.ca
 from ophyd.device import Device
@@ -33,3 +35,15 @@ except AttributeError:
 
 del epics
 del make_new_bts
+
+
+def __getattr__(name):
+    # Import submodules on first access, e.g. pcdsdevices.device_types
+    try:
+        return importlib.import_module(f'.{name}', __name__)
+    except ModuleNotFoundError as ex:
+        if ex.name != f'{__name__}.{name}':
+            raise
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}'
+        ) from None
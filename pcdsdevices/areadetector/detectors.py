@@ -21,9 +21,10 @@ from pcdsutils.ext_scripts import get_hutch_name
 
 from pcdsdevices.variety import set_metadata
 
-from .plugins import (ColorConvPlugin, HDF5FileStore, HDF5Plugin, ImagePlugin,
-                      JPEGPlugin, NetCDFPlugin, NexusPlugin, OverlayPlugin,
-                      ProcessPlugin, ROIPlugin, StatsPlugin, TIFFPlugin,
+from .plugins import (AsynPortIndex, ColorConvPlugin, HDF5FileStore,
+                      HDF5Plugin, ImagePlugin, JPEGPlugin, NetCDFPlugin,
+                      NexusPlugin, OverlayPlugin, ProcessPlugin, ROIPlugin,
+                      RunInfoResolver, StatsPlugin, TIFFPlugin,
                       TransformPlugin)
 
 logger = logging.getLogger(__name__)
@@ -38,6 +39,19 @@ class PCDSAreaDetectorBase(DetectorBase):
     """Standard area detector with no plugins."""
     cam = ADComponent(cam.CamBase, '')
 
+    @property
+    def asyn_port_index(self) -> AsynPortIndex:
+        """The monitored asyn port topology of this detector's plugins."""
+        return AsynPortIndex.for_root(self)
+
+    def get_plugin_by_asyn_port(self, port_name):
+        """Get the plugin which has the given asyn port name."""
+        return self.asyn_port_index.get_plugin(port_name)
+
+    def get_asyn_port_dictionary(self):
+        """Return port name : component map."""
+        return self.asyn_port_index.get_port_map()
+
     def get_plugin_graph_edges(self, *, use_names=True, include_cam=False):
         """
         Get a list of (source, destination) ports for all plugin chains.
@@ -53,9 +67,10 @@ class PCDSAreaDetectorBase(DetectorBase):
             method does not include it in the list.
         """
 
-        cam_port = self.cam.port_name.get()
-        graph, port_map = self.get_asyn_digraph()
-        port_edges = [(src, dest) for src, dest in graph.edges
+        port_index = self.asyn_port_index
+        cam_port = port_index.get_port(self.cam)
+        port_map = port_index.get_port_map()
+        port_edges = [(src, dest) for src, dest in port_index.get_edges()
                       if src != cam_port or include_cam]
         if use_names:
             port_edges = [(port_map[src].name, port_map[dest].name)
@@ -168,6 +183,8 @@ class PCDSHDF5BlueskyTriggerable(SingleTrigger, PCDSAreaDetectorBase):
     ):
         super().__init__(*args, **kwargs)
         self.hutch_name = get_hutch_name()
+        # Look up the experiment and run number ahead of the first stage
+        RunInfoResolver.for_hutch(self.hutch_name).refresh()
         self.always_acquire = always_acquire
         self.num_images_per_point = 1
         self.hdf51.write_path_template = write_path
@@ -3,6 +3,7 @@ PCDS plugins and Overrides for AreaDetector Plugins.
 """
 import datetime
 import logging
+import threading
 import time
 
 import numpy as np
@@ -19,6 +20,190 @@ from pcdsutils.ext_scripts import get_current_experiment, get_run_number
 
 logger = logging.getLogger(__name__)
 
+_port_index_lock = threading.Lock()
+
+
+class AsynPortIndex:
+    """
+    Monitored index of the asyn port topology below one area detector.
+
+    The port name of every device and the source port of every plugin are
+    read once, then kept current through subscriptions, so that finding a
+    plugin by port, the source of a plugin, or the full pipeline leading to
+    a plugin are dictionary lookups rather than a series of gets.
+
+    Use `AsynPortIndex.for_root` to share one index between all the plugins
+    of a detector.
+
+    Parameters
+    ----------
+    root : ADBase
+        The detector (or lone plugin) whose subdevices are indexed.
+    """
+    def __init__(self, root):
+        self.root = root
+        self._lock = threading.RLock()
+        self._built = False
+        self._devices = {}
+        self._ports = {}
+        self._sources = {}
+        self._pipelines = {}
+        self._unresolved = []
+
+    @classmethod
+    def for_root(cls, root):
+        """Get the index shared by everything below ``root``."""
+        with _port_index_lock:
+            index = getattr(root, '_asyn_port_index', None)
+            if index is None:
+                index = cls(root)
+                root._asyn_port_index = index
+        return index
+
+    def _build(self):
+        """Subscribe to and read all port signals, once."""
+        with self._lock:
+            if self._built:
+                return
+            self._built = True
+            devices = [self.root] + [
+                dev for _, dev in self.root.walk_subdevices(include_lazy=True)
+            ]
+            for dev in devices:
+                port_sig = getattr(dev, 'port_name', None)
+                if isinstance(port_sig, OphydObject):
+                    port_sig.subscribe(self._port_changed, run=False)
+                    try:
+                        self._set_port(dev, port_sig.get())
+                    except Exception as ex:
+                        logger.debug('Could not read port of %s: %s',
+                                     dev.name, ex)
+                        self._unresolved.append(dev)
+                source_sig = getattr(dev, 'nd_array_port', None)
+                if isinstance(source_sig, OphydObject):
+                    source_sig.subscribe(self._source_changed, run=False)
+                    try:
+                        self._sources[dev] = source_sig.get()
+                    except Exception as ex:
+                        # Read on first use instead
+                        logger.debug('Could not read source port of %s: %s',
+                                     dev.name, ex)
+
+    def _set_port(self, device, port):
+        old_port = self._ports.get(device)
+        if old_port is not None and self._devices.get(old_port) is device:
+            del self._devices[old_port]
+        self._ports[device] = port
+        self._devices[port] = device
+        self._pipelines.clear()
+
+    def _port_changed(self, *args, value, obj, **kwargs):
+        with self._lock:
+            self._set_port(obj.parent, value)
+
+    def _source_changed(self, *args, value, obj, **kwargs):
+        with self._lock:
+            self._sources[obj.parent] = value
+            self._pipelines.clear()
+
+    def get_plugin(self, port_name):
+        """
+        Get the device with the given asyn port name.
+
+        Parameters
+        ----------
+        port_name : str
+            The port name to search for
+
+        Returns
+        -------
+        ret : ADBase or None
+            Either the requested plugin or None if not found
+        """
+        self._build()
+        with self._lock:
+            if port_name not in self._devices and self._unresolved:
+                # Devices that were not connected at build time
+                for dev in list(self._unresolved):
+                    self._set_port(dev, dev.port_name.get())
+                    self._unresolved.remove(dev)
+            return self._devices.get(port_name)
+
+    def get_port(self, device):
+        """Get the asyn port name of ``device``."""
+        self._build()
+        with self._lock:
+            if device not in self._ports:
+                self._set_port(device, device.port_name.get())
+            return self._ports[device]
+
+    def get_source_port(self, plugin):
+        """Get the asyn port name that ``plugin`` receives arrays from."""
+        self._build()
+        with self._lock:
+            if plugin not in self._sources:
+                self._sources[plugin] = plugin.nd_array_port.get()
+            return self._sources[plugin]
+
+    def get_port_map(self):
+        """
+        Return port name : component map
+
+        Returns
+        -------
+        port_map : dict
+            Mapping between port_name and ADBase objects
+        """
+        self._build()
+        with self._lock:
+            return dict(self._devices)
+
+    def get_edges(self):
+        """
+        Get a list of (source, destination) port names for all plugins.
+        """
+        self._build()
+        with self._lock:
+            return [(self._sources[dev], port)
+                    for port, dev in self._devices.items()
+                    if dev in self._sources]
+
+    def get_pipeline(self, plugin):
+        """
+        Get the chain of devices that feed arrays into ``plugin``.
+
+        Returns
+        -------
+        pipeline : tuple
+            The devices from the most upstream source to ``plugin``.  The
+            first element is None if the upstream source is not known.
+        """
+        self._build()
+        with self._lock:
+            pipeline = self._pipelines.get(plugin)
+            if pipeline is not None:
+                return pipeline
+
+            chain = [plugin]
+            current = plugin
+            while True:
+                parent = self.get_plugin(self.get_source_port(current))
+                # Check the class, the property itself would recurse
+                if (parent is None
+                        or not hasattr(type(parent), '_asyn_pipeline')):
+                    chain.append(parent)
+                    break
+                if parent is self.root or parent in chain:
+                    # The root, or a plugin loop, ends the chain
+                    chain.extend([parent, None])
+                    break
+                chain.append(parent)
+                current = parent
+
+            pipeline = tuple(reversed(chain))
+            self._pipelines[plugin] = pipeline
+            return pipeline
+
 
 class PluginBase(ophyd.plugins.PluginBase, ADBase):
     """
@@ -30,12 +215,13 @@ class PluginBase(ophyd.plugins.PluginBase, ADBase):
     @property
     def source_plugin(self):
         # The PluginBase object that is the asyn source for this plugin.
-        source_port = self.nd_array_port.get()
-        if source_port == 'CAM' or not hasattr(
-                self.root, 'get_plugin_by_asyn_port'):
+        if not hasattr(self.root, 'get_plugin_by_asyn_port'):
+            return None
+        port_index = AsynPortIndex.for_root(self.root)
+        source_port = port_index.get_source_port(self)
+        if source_port == 'CAM':
             return None
-        source_plugin = self.root.get_plugin_by_asyn_port(source_port)
-        return source_plugin
+        return port_index.get_plugin(source_port)
 
     @property
     def _asyn_pipeline_configuration_names(self):
@@ -46,13 +232,10 @@ class PluginBase(ophyd.plugins.PluginBase, ADBase):
 
     @property
     def _asyn_pipeline(self):
-        parent = None
         # Add a check to make sure root has this attr, otherwise return None
         if hasattr(self.root, 'get_plugin_by_asyn_port') and self.root != self:
-            parent = self.root.get_plugin_by_asyn_port(self.nd_array_port.get())
-            if hasattr(parent, '_asyn_pipeline'):
-                return parent._asyn_pipeline + (self, )
-        return (parent, self)
+            return AsynPortIndex.for_root(self.root).get_pipeline(self)
+        return (None, self)
 
     def describe_configuration(self):
         # Use the overridden describe_configuration defined above
@@ -81,32 +264,180 @@ class PluginBase(ophyd.plugins.PluginBase, ADBase):
         """The total number of pixels, calculated from array_size."""
         array_size = list(self.array_size.get())
         dimensions = int(self.ndimensions.get())
+        return self._count_pixels(array_size, dimensions)
+
+    @staticmethod
+    def _image_shape(array_size, dimensions):
+        """
+        The array shape from sizes ordered as ``(depth, height, width)``.
 
-        if dimensions == 0:
+        Only the last ``dimensions`` sizes are used, and unused sizes of 0
+        are dropped.
+        """
+        if dimensions <= 0:
+            return ()
+        return tuple(int(dim) for dim in array_size[-dimensions:] if dim)
+
+    @classmethod
+    def _count_pixels(cls, array_size, dimensions):
+        """The total number of pixels in the last ``dimensions`` sizes."""
+        shape = cls._image_shape(array_size, dimensions)
+        if not shape:
             return 0
+        return int(np.prod(shape))
 
-        pixels = array_size[0]
-        for dim in array_size[1:dimensions]:
-            if dim:
-                pixels *= dim
 
-        return int(pixels)
+class ImagePlugin(ophyd.plugins.ImagePlugin, PluginBase):
+    """
+    Image plugin with cached image geometry and an optional frame buffer.
 
+    The image shape is cached on first use and only recalculated after one
+    of the array size or dimension PVs posts a new value, so reading
+    ``image`` costs a single get of the array data, which is reshaped
+    without a copy.
+
+    After `start_frame_buffer`, the array data is monitored and each new
+    frame is copied into one preallocated buffer, so ``image`` no longer
+    waits on a get.  ``image`` returns a copy of this buffer, which is
+    safe to keep while later frames arrive.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._geometry_lock = threading.Lock()
+        self._geometry = None
+        self._geometry_version = 0
+        self._geometry_monitored = False
+        self._geometry_thread = None
+        self._frame_lock = threading.Lock()
+        self._frame_buffer = None
+        self._frame_cid = None
+        self.frame_count = 0
 
-class ImagePlugin(ophyd.plugins.ImagePlugin, PluginBase):
     @property
     def image(self):
         """Overriden image method to add in some corrections."""
+        if self._frame_cid is not None:
+            with self._frame_lock:
+                if self._frame_buffer is not None:
+                    return self._frame_buffer.copy()
+
+        shape, pixel_count = self.image_geometry
+        image = self.array_data.get(count=pixel_count)
+        return np.asarray(image).reshape(shape)
+
+    @property
+    def image_geometry(self):
+        """
+        The image shape and pixel count, cached until the size PVs change.
+
+        Returns
+        -------
+        shape : tuple of int
+            The shape of the image array.
+        pixel_count : int
+            The number of pixels to request from the array data.
+        """
+        self._monitor_geometry()
+        with self._geometry_lock:
+            geometry = self._geometry
+            version = self._geometry_version
+        if geometry is not None:
+            return geometry
+
         array_size = [int(val) for val in self.array_size.get()]
-        if array_size == [0, 0, 0]:
+        shape = self._image_shape(array_size, int(self.ndimensions.get()))
+        if not shape:
             raise RuntimeError('Invalid image; ensure array_callbacks are on')
 
-        if array_size[-1] == 0:
-            array_size = array_size[:-1]
+        geometry = (shape, int(np.prod(shape)))
+        with self._geometry_lock:
+            # Don't cache a geometry that was invalidated while reading
+            if version == self._geometry_version:
+                self._geometry = geometry
+        return geometry
+
+    def _monitor_geometry(self):
+        """Subscribe to the size PVs, so that changes clear the cache."""
+        if self._geometry_monitored:
+            return
+        self._geometry_monitored = True
+        signals = [getattr(self.array_size, attr)
+                   for attr in self.array_size.component_names]
+        for sig in signals + [self.ndimensions]:
+            sig.subscribe(self._invalidate_geometry, run=False)
+
+    def _invalidate_geometry(self, *args, **kwargs):
+        with self._geometry_lock:
+            self._geometry = None
+            self._geometry_version += 1
+
+    def _resolve_geometry(self):
+        """Read the image geometry, logging rather than raising failures."""
+        try:
+            return self.image_geometry
+        except Exception as ex:
+            logger.debug('Could not read the geometry of %s: %s',
+                         self.name, ex)
+            return None
 
-        pixel_count = self.array_pixels
-        image = self.array_data.get(count=pixel_count)
-        return np.array(image).reshape(array_size)
+    def _resolve_geometry_thread(self):
+        """Read the geometry away from the monitor callback thread."""
+        try:
+            self._resolve_geometry()
+        finally:
+            with self._geometry_lock:
+                self._geometry_thread = None
+
+    def start_frame_buffer(self):
+        """Monitor the array data and copy each frame into a reused buffer."""
+        self._resolve_geometry()
+        if self._frame_cid is None:
+            self._frame_cid = self.array_data.subscribe(self._new_frame,
+                                                        run=False)
+
+    def stop_frame_buffer(self):
+        """Stop monitoring the array data and release the frame buffer."""
+        if self._frame_cid is not None:
+            self.array_data.unsubscribe(self._frame_cid)
+            self._frame_cid = None
+        with self._frame_lock:
+            self._frame_buffer = None
+
+    def _new_frame(self, *args, value, **kwargs):
+        """Array data callback, copy the frame into the frame buffer."""
+        with self._geometry_lock:
+            geometry = self._geometry
+            thread = None
+            if geometry is None and self._geometry_thread is None:
+                thread = threading.Thread(
+                    target=self._resolve_geometry_thread, daemon=True,
+                    name=f'{self.name}_geometry',
+                )
+                self._geometry_thread = thread
+        if geometry is None:
+            # Don't block the monitor thread on gets of the size PVs, skip
+            # this frame and read the new geometry in the background
+            logger.debug('Skipping frame from %s with unknown geometry',
+                         self.name)
+            if thread is not None:
+                thread.start()
+            return
+        shape, pixel_count = geometry
+        frame = np.asarray(value).reshape(-1)
+        if frame.size < pixel_count or np.prod(shape) != pixel_count:
+            logger.debug('Skipping frame from %s with %d pixels, expected '
+                         '%s', self.name, frame.size, shape)
+            return
+
+        with self._frame_lock:
+            buffer = self._frame_buffer
+            if (buffer is None or buffer.shape != shape
+                    or buffer.dtype != frame.dtype):
+                # Only reallocate when the geometry or data type changes
+                buffer = np.empty(shape, dtype=frame.dtype)
+                self._frame_buffer = buffer
+            np.copyto(buffer.reshape(-1), frame[:pixel_count])
+            self.frame_count += 1
 
 
 class StatsPlugin(ophyd.plugins.StatsPlugin, PluginBase):
@@ -170,6 +501,174 @@ class MagickPlugin(ophyd.plugins.MagickPlugin, FilePlugin):
     pass
 
 
+_run_info_lock = threading.Lock()
+_run_info_resolvers = {}
+
+
+class RunInfoResolver:
+    """
+    Background lookup of the current experiment and run number of a hutch.
+
+    The lookups shell out to external scripts that can take seconds, so
+    they are run in a daemon thread.  The experiment rarely changes, so it
+    is only looked up again once it is older than ``ttl`` seconds, and the
+    last one found is used until then.  The run number changes with every
+    run and is looked up again on every refresh.
+
+    `get` starts a refresh and can wait a bounded time for the fresh run
+    number, falling back to the last one looked up.
+
+    Use `RunInfoResolver.for_hutch` to share one resolver per hutch.
+
+    Parameters
+    ----------
+    hutch : str
+        The hutch to look up the experiment and run number for.
+    ttl : float, optional
+        Seconds before a refresh looks up the experiment again.
+    timeout : float, optional
+        Timeout for each external lookup.
+    run_timeout : float, optional
+        Seconds that ``get(wait=True)`` waits for a fresh run number.
+    """
+    def __init__(self, hutch, ttl=60.0, timeout=5.0, run_timeout=1.0):
+        self.hutch = hutch
+        self.ttl = ttl
+        self.timeout = timeout
+        self.run_timeout = run_timeout
+        self._lock = threading.Lock()
+        self._done = threading.Condition(self._lock)
+        self._experiment = None
+        self._experiment_updated = None
+        self._run_number = None
+        self._requested = 0
+        self._run_completed = 0
+        self._completed = 0
+        self._thread = None
+
+    @classmethod
+    def for_hutch(cls, hutch):
+        """Get the resolver shared by all devices in ``hutch``."""
+        with _run_info_lock:
+            resolver = _run_info_resolvers.get(hutch)
+            if resolver is None:
+                resolver = cls(hutch)
+                _run_info_resolvers[hutch] = resolver
+        return resolver
+
+    def _experiment_expired(self):
+        return (
+            self._experiment_updated is None
+            or time.monotonic() - self._experiment_updated > self.ttl
+        )
+
+    def _lookup(self, func, *args, **kwargs):
+        try:
+            return func(*args, live=False, timeout=self.timeout, **kwargs)
+        except Exception as ex:
+            logger.debug('Run information lookup for %s failed: %s',
+                         self.hutch, ex)
+            return None
+
+    def _refresh(self):
+        """Serve refresh requests until none are left."""
+        while True:
+            with self._lock:
+                if self._completed >= self._requested:
+                    self._thread = None
+                    return
+                request = self._requested
+                lookup_experiment = self._experiment_expired()
+            run_number = self._lookup(get_run_number, hutch=self.hutch)
+            with self._lock:
+                if run_number is not None:
+                    self._run_number = run_number
+                # Don't hold up staging on the experiment lookup
+                self._run_completed = request
+                self._done.notify_all()
+            experiment = None
+            if lookup_experiment:
+                experiment = self._lookup(get_current_experiment, self.hutch)
+            with self._lock:
+                if experiment is not None:
+                    self._experiment = experiment
+                    self._experiment_updated = time.monotonic()
+                self._completed = request
+                self._done.notify_all()
+
+    def _request_refresh(self):
+        """Queue a refresh and return its request number."""
+        with self._lock:
+            self._requested += 1
+            request = self._requested
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._refresh,
+                    name=f'run_info_{self.hutch}',
+                    daemon=True,
+                )
+                self._thread.start()
+        return request
+
+    def _wait_for(self, request, timeout=None, run_only=False):
+        def done():
+            if run_only:
+                return self._run_completed >= request
+            return self._completed >= request
+
+        with self._done:
+            return self._done.wait_for(done, timeout=timeout)
+
+    def refresh(self, wait=False):
+        """
+        Look up the run information in the background.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Block until the lookup has finished.
+        """
+        request = self._request_refresh()
+        if wait:
+            self._wait_for(request)
+
+    def get(self, wait=False):
+        """
+        Get the run information, refreshing the run number.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Wait up to ``run_timeout`` seconds for the fresh run number, and
+            for the experiment if none was found yet.  Otherwise, or if the
+            lookup takes longer, the last values looked up are used.
+
+        Returns
+        -------
+        info : tuple or None
+            (experiment, run_number), or None if either has not been found
+            yet.
+        """
+        request = self._request_refresh()
+        if wait:
+            deadline = time.monotonic() + self.run_timeout
+            fresh = self._wait_for(request, timeout=self.run_timeout,
+                                   run_only=True)
+            with self._lock:
+                missing_experiment = self._experiment is None
+            if fresh and missing_experiment:
+                # Nothing to fall back on, also wait for the experiment
+                self._wait_for(request,
+                               timeout=max(deadline - time.monotonic(), 0))
+            elif not fresh:
+                logger.debug('Run number lookup for %s is slow, using the '
+                             'cached run number', self.hutch)
+        with self._lock:
+            if self._experiment is None or self._run_number is None:
+                return None
+            return self._experiment, self._run_number
+
+
 class HDF5FileStore(FileStoreHDF5IterativeWrite, HDF5Plugin_V31):
     """
     HDF5 Plugin to use for interactive/in-scan saving at LCLS.
@@ -179,20 +678,22 @@ class HDF5FileStore(FileStoreHDF5IterativeWrite, HDF5Plugin_V31):
     filestore/databroker at LCLS.
     """
     def make_filename(self) -> str:
-        """Select a filename that makes SLAC scientists happy"""
-        try:
-            run_number = get_run_number(
-                hutch=self.parent.hutch_name,
-                live=False,
-                timeout=5,
-            )
-            experiment = get_current_experiment(
-                self.parent.hutch_name,
-                live=False,
-                timeout=5,
-            )
+        """
+        Select a filename that makes SLAC scientists happy
+
+        The experiment and run number come from the hutch's
+        `RunInfoResolver`, which waits a short bounded time for the current
+        run number and otherwise uses the cached one.  If nothing is cached
+        yet, the plugin name is used instead.
+        """
+        hutch = getattr(self.parent, 'hutch_name', None)
+        run_info = None
+        if hutch is not None:
+            run_info = RunInfoResolver.for_hutch(hutch).get(wait=True)
+        if run_info is not None:
+            experiment, run_number = run_info
             filename = f'{experiment}_run{run_number}_{time.time():.0f}'
-        except Exception:
+        else:
             filename = f'{self.name}_{time.time():.0f}'
         formatter = datetime.datetime.now().strftime
         return (
@@ -29,10 +29,11 @@ from .interface import (BaseInterface, FltMvInterface, LightpathInOutCptMixin,
 from .pmps import TwinCATStatePMPS
 from .pv_positioner import PVPositionerNoInterrupt
 from .sensors import TwinCATTempSensor
-from .signal import (InternalSignal, MultiDerivedSignal, MultiDerivedSignalRO,
-                     PytmcSignal)
+from .signal import (BitwiseOrReducer, InternalSignal, MultiDerivedSignal,
+                     MultiDerivedSignalRO, PytmcSignal)
 from .type_hints import OphydDataType, SignalToValue
-from .utils import get_status_float, get_status_value
+from .utils import (coalesce, dynamic_class_cache, get_status_float,
+                    get_status_value)
 from .valve import VCN, VVC
 from .variety import set_metadata
 
@@ -96,7 +97,10 @@ class Filter(InOutPositioner):
         super().__init__(prefix, name=name, **kwargs)
 
     @state.sub_value
+    @coalesce()
     def _state_update(self, *args, value, **kwargs):
+        # The state can chatter while the blade moves, and only the latest
+        # value matters for the status summary
         self._status_state = value
         self._status_update()
 
@@ -443,24 +447,53 @@ class FeeAtt(AttBase, PVPositionerPC, LightpathInOutCptMixin):
         super().__init__(prefix, name=name, **kwargs)
 
 
+def _make_att_class(n_filters, base_with_3rd_harmonic, name):
+    """Generate the subclass with ``n_filters`` filters."""
+    att_ns = {}
+    for n in range(1, n_filters + 1):
+        comp = Cpt(Filter, f':{n:02}')
+        att_ns[f'filter{n}'] = comp
+
+    if issubclass(base_with_3rd_harmonic, LightpathInOutCptMixin):
+        att_ns['lightpath_cpts'] = [
+            f'filter{i}' for i in range(1, n_filters + 1)
+        ]
+    cls_name = f'{name}{n_filters}'
+    cls = type(cls_name, (base_with_3rd_harmonic,), att_ns)
+    cls.num_att = n_filters
+    return cls
+
+
+class _AttClasses(dict):
+    """
+    Mapping of filter count to attenuator subclass.
+
+    Subclasses are only generated the first time a filter count is
+    requested. Entries may be replaced, e.g. with fake devices in tests.
+    """
+    def __init__(self, max_filters, base_with_3rd_harmonic, name):
+        super().__init__()
+        self.max_filters = max_filters
+        self.base_with_3rd_harmonic = base_with_3rd_harmonic
+        self.name = name
+
+    def __missing__(self, n_filters):
+        if not 1 <= n_filters <= self.max_filters:
+            raise KeyError(n_filters)
+        cls = dynamic_class_cache.get_or_create(
+            (self.base_with_3rd_harmonic, self.name, n_filters),
+            functools.partial(
+                _make_att_class, n_filters, self.base_with_3rd_harmonic,
+                self.name,
+            ),
+        )
+        self[n_filters] = cls
+        return cls
+
+
 def _make_att_classes(max_filters, base_with_3rd_harmonic, name):
-    """Generate all possible subclasses."""
-    att_classes = {}
-    for i in range(1, max_filters + 1):
-        att_ns = {}
-        for n in range(1, i + 1):
-            comp = Cpt(Filter, f':{n:02}')
-            att_ns[f'filter{n}'] = comp
-
-        if issubclass(base_with_3rd_harmonic, LightpathInOutCptMixin):
-            att_ns['lightpath_cpts'] = [
-                f'filter{i}' for i in range(1, i + 1)
-            ]
-        cls_name = f'{name}{i}'
-        cls = type(cls_name, (base_with_3rd_harmonic,), att_ns)
-        cls.num_att = i
-        att_classes[i] = cls
-    return att_classes
+    """Prepare all possible subclasses, to be generated on first use."""
+    return _AttClasses(max_filters, base_with_3rd_harmonic, name)
 
 
 _att_classes = _make_att_classes(
@@ -1413,6 +1446,37 @@ class AT3K2(AttenuatorSXR_LadderTwoBladeLBD):
     blade_03 = None
 
 
+class _BladeErrorBitmaskSignal(MultiDerivedSignalRO):
+    """
+    Bitmask of the AT2L0 blades with errors, 1=error, 0=no error.
+
+    Each blade has 5 error signals, see ``AT2L0._get_blade_error_attrs``.
+    The first blade is not reported, and the last blade is the lowest bit.
+    Updates from one signal are applied incrementally.
+    """
+    _reducer_factory = BitwiseOrReducer
+    signals_per_blade = 5
+    blade_count = 19
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._blade_bits = {}
+        for index, signal in enumerate(self._signals):
+            blade = index // self.signals_per_blade + 1
+            # first blade errors not reported in bit array
+            self._blade_bits[signal] = (
+                1 << (self.blade_count - blade) if blade > 1 else 0
+            )
+
+    def _reducer_input(self, signal: Signal, value: OphydDataType) -> int:
+        # sort out .motor from .motor.plc signals
+        if ("motor" in signal.name) ^ ("plc" in signal.name):
+            value = int(signal.metadata["severity"])
+        if value in (0, ""):
+            return 0
+        return self._blade_bits[signal]
+
+
 class AT2L0(FltMvInterface, PVPositionerPC, LightpathMixin):
     """
     AT2L0 solid attenuator variant from the LCLS-II XTES project.
@@ -1477,40 +1541,8 @@ class AT2L0(FltMvInterface, PVPositionerPC, LightpathMixin):
     )
     set_metadata(error_summary, dict(variety='text-multiline'))
 
-    def _check_errors_bitmask(
-        self, mds: MultiDerivedSignal, items: SignalToValue
-    ) -> int:
-        """check for errors, return an array of binaries 1=error, 0=no error"""
-        errors = []
-        blade_errors = []
-        for sig, value in items.items():
-            if ("motor" in sig.name) ^ ("plc" in sig.name):
-                value = int(sig.metadata["severity"])
-
-            if value not in (0, ""):
-                blade_errors.append(1)
-            else:
-                blade_errors.append(0)
-
-        step = 5
-        # first blade errors not reported in bit array
-        start_index = step
-        end_index = 2*step
-        for _ in range(1, 19):
-            error_count = sum(blade_errors[start_index:end_index])
-            errors.append(1 if error_count >= 1 else 0)
-            start_index += step
-            end_index += step
-
-        decimal_value = 0
-        for next_bit in errors:
-            decimal_value = decimal_value * 2 + next_bit
-
-        return decimal_value
-
     error_summary_bitmask = Cpt(
-        MultiDerivedSignalRO,
-        calculate_on_get=_check_errors_bitmask,
+        _BladeErrorBitmaskSignal,
         attrs=list(_get_blade_error_attrs()),
         doc='summarize errors at any time on any blade via a bitmask',
     )
@@ -11,7 +11,7 @@ from ophyd.sim import fake_device_cache, make_fake_device
 
 from .interface import BaseInterface, FltMvInterface
 from .pv_positioner import PVPositionerDone
-from .signal import AvgSignal
+from .signal import AvgSignal, RollingStatSignal
 from .utils import re_arg
 
 logger = logging.getLogger(__name__)
@@ -28,6 +28,12 @@ class BeamStats(BaseInterface, Device):
                 doc='BEAM_OWNER ID')
 
     mj_avg = Cpt(AvgSignal, 'mj', averages=120, kind='normal')
+    mj_std = Cpt(RollingStatSignal, 'mj_avg', stat='std', kind='omitted',
+                 doc='Standard deviation of the averaged pulse energy [mJ]')
+    mj_min = Cpt(RollingStatSignal, 'mj_avg', stat='min', kind='omitted',
+                 doc='Minimum of the averaged pulse energy [mJ]')
+    mj_max = Cpt(RollingStatSignal, 'mj_avg', stat='max', kind='omitted',
+                 doc='Maximum of the averaged pulse energy [mJ]')
     mj_buffersize = Cpt(AttributeSignal, 'mj_avg.averages', kind='config')
 
     tab_component_names = True
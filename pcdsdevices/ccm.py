@@ -542,6 +542,13 @@ class CCMEnergy(FltMvInterface, PseudoPositioner, CCMConstantsMixin):
 
     tab_component_names = True
 
+    # Set to True to interpolate energy_to_alio from a precomputed table
+    use_alio_table: bool = False
+    # Number of points in the table, spaced evenly in wavelength
+    alio_table_points: int = 100001
+
+    _alio_table: typing.Optional[tuple[tuple, np.ndarray, np.ndarray]] = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # Alias the constants signals onto the main energy pseudomotor
@@ -584,10 +591,10 @@ class CCMEnergy(FltMvInterface, PseudoPositioner, CCMConstantsMixin):
         self.theta_deg.put(theta * 180/np.pi, force=True)
         self.wavelength.put(wavelength, force=True)
 
-        res_delta = 1e-4
-        ref1 = self.alio_to_energy(value - res_delta/2)
-        ref2 = self.alio_to_energy(value + res_delta/2)
-        self.resolution.put(abs((ref1 - ref2) / res_delta), force=True)
+        # dE/dalio = dE/dtheta * dtheta/dalio, where E = hc / (2d sin(theta))
+        energy = wavelength_to_energy(wavelength)
+        slope = alio_to_theta_slope(value, 0, self.gr_val, self.gd_val)
+        self.resolution.put(abs(energy / np.tan(theta) * slope), force=True)
 
     def forward(self, pseudo_pos: namedtuple) -> namedtuple:
         """
@@ -615,18 +622,28 @@ class CCMEnergy(FltMvInterface, PseudoPositioner, CCMConstantsMixin):
         """
         Converts energy to alio.
 
+        If ``use_alio_table`` is set, energies inside the energy limits are
+        interpolated from a table of exact values instead.
+
         Parameters
         ----------
-        energy : float
+        energy : float or np.ndarray
             The photon energy (color) in keV.
 
         Returns
         -------
-        alio : float
+        alio : float or np.ndarray
             The alio position in mm
         """
         self.warn_invalid_constants(only_new=True)
         wavelength = energy_to_wavelength(energy)
+        if self.use_alio_table:
+            _, table_wavelength, table_alio = self._get_alio_table()
+            if np.all(
+                (wavelength >= table_wavelength[0])
+                & (wavelength <= table_wavelength[-1])
+            ):
+                return np.interp(wavelength, table_wavelength, table_alio)
         theta = wavelength_to_theta(wavelength, self.dspacing_val)
         alio = theta_to_alio(
             theta,
@@ -636,18 +653,57 @@ class CCMEnergy(FltMvInterface, PseudoPositioner, CCMConstantsMixin):
         )
         return alio
 
+    def _get_alio_table(self) -> tuple[tuple, np.ndarray, np.ndarray]:
+        """
+        Get the wavelength to alio table for the current constants.
+
+        The table spans the energy limits and is only rebuilt when the
+        constants, limits, or table size change.
+
+        Returns
+        -------
+        table : tuple
+            The key the table was built for, the increasing wavelengths in
+            A, and the matching alio positions in mm.
+        """
+        low, high = sorted(self.energy.limits)
+        key = (
+            self.theta0_rad_val,
+            self.dspacing_val,
+            self.gr_val,
+            self.gd_val,
+            low,
+            high,
+            self.alio_table_points,
+        )
+        table = self._alio_table
+        if table is None or table[0] != key:
+            wavelength = np.linspace(
+                energy_to_wavelength(high),
+                energy_to_wavelength(low),
+                self.alio_table_points,
+            )
+            alio = theta_to_alio(
+                wavelength_to_theta(wavelength, self.dspacing_val),
+                self.theta0_rad_val,
+                self.gr_val,
+                self.gd_val,
+            )
+            table = self._alio_table = (key, wavelength, alio)
+        return table
+
     def alio_to_energy(self, alio: float) -> float:
         """
         Converts alio to energy.
 
         Parameters
         ----------
-        alio : float
+        alio : float or np.ndarray
             The alio position in mm
 
         Returns
         -------
-        energy : float
+        energy : float or np.ndarray
             The photon energy (color) in keV.
         """
         self.warn_invalid_constants(only_new=True)
@@ -1140,6 +1196,7 @@ class CCM(BaseInterface, GroupDevice, LightpathMixin, CCMConstantsMixin):
 
 
 # Calculations between alio position and energy, with all intermediates.
+# These all accept either single values or arrays of values.
 def theta_to_alio(theta: float, theta0: float, gr: float, gd: float) -> float:
     """
     Converts theta angle (rad) to alio position (mm).
@@ -1159,7 +1216,7 @@ def theta_to_alio(theta: float, theta0: float, gr: float, gd: float) -> float:
     x = f(Delta_Theta) = D * tan(Delta_Theta)+(R/cos(Delta_Theda))-R
     Note that for ∆θ = 0, x = R
     """
-    t_rad = theta - theta0
+    t_rad = np.asarray(theta) - theta0
     return gr * (1 / np.cos(t_rad) - 1) + gd * np.tan(t_rad)
 
 
@@ -1171,14 +1228,31 @@ def alio_to_theta(alio: float, theta0: float, gr: float, gd: float) -> float:
     theta_angle = f(x) = 2arctan * [(sqrt(x^2 + D^2 + 2Rx) - D)/(2R + x)]
     Note that for x = −R, θ = 2 arctan(−R/D)
     """
+    alio = np.asarray(alio)
     return theta0 + 2 * np.arctan(
         (np.sqrt(alio ** 2 + gd ** 2 + 2 * gr * alio) - gd) / (2 * gr + alio)
     )
 
 
+def alio_to_theta_slope(
+    alio: float,
+    theta0: float,
+    gr: float,
+    gd: float,
+) -> float:
+    """
+    The derivative of theta (rad) with respect to alio position (mm).
+
+    Differentiating the formula in `theta_to_alio` gives
+    dx/d(Delta_Theta) = (R * sin(Delta_Theta) + D) / cos(Delta_Theta)^2
+    """
+    t_rad = alio_to_theta(alio, 0, gr, gd)
+    return np.cos(t_rad) ** 2 / (gr * np.sin(t_rad) + gd)
+
+
 def wavelength_to_theta(wavelength: float, dspacing: float) -> float:
     """Converts wavelength (A) to theta angle (rad)."""
-    return np.arcsin(wavelength/2/dspacing)
+    return np.arcsin(np.asarray(wavelength)/2/dspacing)
 
 
 def theta_to_wavelength(theta: float, dspacing: float) -> float:
@@ -1188,9 +1262,9 @@ def theta_to_wavelength(theta: float, dspacing: float) -> float:
 
 def energy_to_wavelength(energy: float) -> float:
     """Converts photon energy (keV) to wavelength (A)."""
-    return 12.39842/energy
+    return 12.39842/np.asarray(energy)
 
 
 def wavelength_to_energy(wavelength: float) -> float:
     """Converts wavelength (A) to photon energy (keV)."""
-    return 12.39842/wavelength
+    return 12.39842/np.asarray(wavelength)
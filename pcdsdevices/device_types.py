@@ -1,51 +1,103 @@
-# flake8: NOQA
-from .analog_signals import Acromag, AcromagChannel
-from .areadetector.detectors import PCDSAreaDetector
-from .atm import ArrivalTimeMonitor
-from .attenuator import Attenuator
-from .beam_stats import BeamStats
-from .ccm import CCM
-from .dc_devices import ICT
-from .dccm import DCCM
-from .epics_motor import (IMS, PMC100, BeckhoffAxis, DelayNewport, EpicsMotor,
-                          Motor, Newport)
-from .evr import Trigger
-from .gauge import GaugeSet
-from .gbs import GratingBeamSplitterTarget
-from .gon import BaseGon, Goniometer, GonWithDetArm, Kappa, SamPhi, XYZStage
-from .inout import Reflaser, TTReflaser
-from .ipm import IPM, IPM_IPIMB, BeckhoffIntensityProfileTarget, IPM_Wave8
-from .jet import BeckhoffJet
-from .lasers.ek9000 import El3174AiCh, EnvironmentalMonitor, SimpleShutter
-from .lasers.elliptec import Ell6, Ell9, EllBase, EllLinear, EllRotation
-from .lasers.qmini import QminiSpectrometer
-from .lasers.rfof import (CycleRfofRx, CycleRfofTx, ItechRfofAll,
-                          ItechRfofErrors, ItechRfofRx, ItechRfofStatus,
-                          ItechRfofTx)
-from .lasers.thorlabsWFS import ThorlabsWfs40
-from .lasers.zoomtelescope import ZoomTelescope
-from .lens import XFLS, Prefocus
-from .lic import LaserInCoupling
-from .light_control import LightControl
-from .lodcm import XCSLODCM, XPPLODCM
-from .mirror import OffsetMirror, PointingMirror
-from .movablestand import MovableStand
-from .mpod import MPOD, MPODChannelHV, MPODChannelLV
-from .mpod_apalis import (MPODApalisModule4Channel, MPODApalisModule8Channel,
-                          MPODApalisModule16Channel, MPODApalisModule24Channel)
-from .mps import MPS
-from .pim import PIM, PPM, XPIM, PIMWithBoth, PIMWithFocus, PIMWithLED
-from .pseudopos import DelayBase, DelayMotor
-from .pulsepicker import PulsePicker
-from .pump import IonPump
-from .ref import ReflaserL2SI
-from .sample_delivery import (HPLC, PCM, CoolerShaker, FlowIntegrator,
-                              GasManifold, Selector)
-from .sensors import RTD, TwinCATThermocouple
-from .sequencer import EventSequencer
-from .slits import Slits
-from .spectrometer import Gen1VonHamos4Crystal, Kmono, VonHamos4Crystal
-from .timetool import Timetool, TimetoolWithNav
-from .valve import GateValve, Stopper
-from .wfs import (WaveFrontSensorTarget, WaveFrontSensorTargetCool,
-                  WaveFrontSensorTargetFDQ)
+"""
+The device classes referenced by happi and hutch-python.
+
+The classes are imported from their modules on first access, so that using
+a few of them does not require importing every module in the package.
+"""
+import importlib
+
+_lazy_imports = {
+    '.analog_signals': ('Acromag', 'AcromagChannel'),
+    '.areadetector.detectors': ('PCDSAreaDetector',),
+    '.atm': ('ArrivalTimeMonitor',),
+    '.attenuator': ('Attenuator',),
+    '.beam_stats': ('BeamStats',),
+    '.ccm': ('CCM',),
+    '.dc_devices': ('ICT',),
+    '.dccm': ('DCCM',),
+    '.epics_motor': (
+        'IMS', 'PMC100', 'BeckhoffAxis', 'DelayNewport', 'EpicsMotor', 'Motor',
+        'Newport',
+    ),
+    '.evr': ('Trigger',),
+    '.gauge': ('GaugeSet',),
+    '.gbs': ('GratingBeamSplitterTarget',),
+    '.gon': (
+        'BaseGon', 'Goniometer', 'GonWithDetArm', 'Kappa', 'SamPhi',
+        'XYZStage',
+    ),
+    '.inout': ('Reflaser', 'TTReflaser'),
+    '.ipm': (
+        'IPM', 'IPM_IPIMB', 'BeckhoffIntensityProfileTarget', 'IPM_Wave8',
+    ),
+    '.jet': ('BeckhoffJet',),
+    '.lasers.ek9000': ('El3174AiCh', 'EnvironmentalMonitor', 'SimpleShutter'),
+    '.lasers.elliptec': (
+        'Ell6', 'Ell9', 'EllBase', 'EllLinear', 'EllRotation',
+    ),
+    '.lasers.qmini': ('QminiSpectrometer',),
+    '.lasers.rfof': (
+        'CycleRfofRx', 'CycleRfofTx', 'ItechRfofAll', 'ItechRfofErrors',
+        'ItechRfofRx', 'ItechRfofStatus', 'ItechRfofTx',
+    ),
+    '.lasers.thorlabsWFS': ('ThorlabsWfs40',),
+    '.lasers.zoomtelescope': ('ZoomTelescope',),
+    '.lens': ('XFLS', 'Prefocus'),
+    '.lic': ('LaserInCoupling',),
+    '.light_control': ('LightControl',),
+    '.lodcm': ('XCSLODCM', 'XPPLODCM'),
+    '.mirror': ('OffsetMirror', 'PointingMirror'),
+    '.movablestand': ('MovableStand',),
+    '.mpod': ('MPOD', 'MPODChannelHV', 'MPODChannelLV'),
+    '.mpod_apalis': (
+        'MPODApalisModule4Channel', 'MPODApalisModule8Channel',
+        'MPODApalisModule16Channel', 'MPODApalisModule24Channel',
+    ),
+    '.mps': ('MPS',),
+    '.pim': (
+        'PIM', 'PPM', 'XPIM', 'PIMWithBoth', 'PIMWithFocus', 'PIMWithLED',
+    ),
+    '.pseudopos': ('DelayBase', 'DelayMotor'),
+    '.pulsepicker': ('PulsePicker',),
+    '.pump': ('IonPump',),
+    '.ref': ('ReflaserL2SI',),
+    '.sample_delivery': (
+        'HPLC', 'PCM', 'CoolerShaker', 'FlowIntegrator', 'GasManifold',
+        'Selector',
+    ),
+    '.sensors': ('RTD', 'TwinCATThermocouple'),
+    '.sequencer': ('EventSequencer',),
+    '.slits': ('Slits',),
+    '.spectrometer': ('Gen1VonHamos4Crystal', 'Kmono', 'VonHamos4Crystal'),
+    '.timetool': ('Timetool', 'TimetoolWithNav'),
+    '.valve': ('GateValve', 'Stopper'),
+    '.wfs': (
+        'WaveFrontSensorTarget', 'WaveFrontSensorTargetCool',
+        'WaveFrontSensorTargetFDQ',
+    ),
+}
+
+_name_to_module = {
+    name: module
+    for module, names in _lazy_imports.items()
+    for name in names
+}
+
+__all__ = sorted(_name_to_module)
+
+
+def __getattr__(name):
+    try:
+        module = _name_to_module[name]
+    except KeyError:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}'
+        ) from None
+    value = getattr(importlib.import_module(module, __package__), name)
+    # Cache it so that we are only called once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,11 +2,19 @@
 Module for digitizers such as the Wave8.
 """
 
+import collections
+import dataclasses
 import logging
+import os
+import queue
+import threading
+import time
+from typing import Optional, Union
 
+import numpy as np
 from ophyd import Component as Cpt
 from ophyd import Device
-from ophyd.signal import EpicsSignal, EpicsSignalRO
+from ophyd.signal import EpicsSignal, EpicsSignalRO, Signal
 
 from pcdsdevices.variety import set_metadata
 
@@ -15,6 +23,361 @@ from .interface import BaseInterface
 logger = logging.getLogger(__name__)
 
 
+class MemmapWaveformSink:
+    """
+    Write waveforms into preallocated ``.npy`` ring buffers.
+
+    Each signal gets a ``<name>.npy`` file of shape (shots, length) and a
+    ``<name>_timestamp.npy`` file in ``directory``, created on the first
+    waveform so that the length and dtype match the data.  Once ``shots``
+    waveforms have been written, the oldest are overwritten.  The files can
+    be read back with ``np.load(..., mmap_mode='r')``, and ``counts`` holds
+    the total number of waveforms written for each signal, from which the
+    position of the newest waveform is ``(count - 1) % shots``.
+
+    Parameters
+    ----------
+    directory : str
+        Directory to create the files in.
+    shots : int, optional
+        Number of waveforms held per signal.
+    """
+    def __init__(self, directory: str, shots: int = 1000):
+        self.directory = directory
+        self.shots = shots
+        self.counts = collections.Counter()
+        self._data = {}
+        self._timestamps = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, name: str, value: np.ndarray, timestamp: float) -> None:
+        """Write one waveform, raising ValueError if its length changed."""
+        data = self._data.get(name)
+        if data is None:
+            data = np.lib.format.open_memmap(
+                os.path.join(self.directory, f'{name}.npy'), mode='w+',
+                dtype=value.dtype, shape=(self.shots, value.size),
+            )
+            self._data[name] = data
+            self._timestamps[name] = np.lib.format.open_memmap(
+                os.path.join(self.directory, f'{name}_timestamp.npy'),
+                mode='w+', dtype=np.float64, shape=(self.shots,),
+            )
+        if value.size != data.shape[1]:
+            raise ValueError(
+                f'{name} waveform has {value.size} samples, expected '
+                f'{data.shape[1]}'
+            )
+        index = self.counts[name] % self.shots
+        data[index] = value
+        self._timestamps[name][index] = timestamp
+        self.counts[name] += 1
+
+    def close(self) -> None:
+        """Flush the ring buffers to disk."""
+        for arr in list(self._data.values()) + list(self._timestamps.values()):
+            arr.flush()
+        self._data.clear()
+        self._timestamps.clear()
+
+
+class HDF5WaveformSink:
+    """
+    Append waveforms to chunked, resizable HDF5 datasets.
+
+    Each signal gets a ``<name>/data`` dataset of shape (shots, length) and
+    a ``<name>/timestamp`` dataset, created on the first waveform.  The
+    datasets grow one chunk at a time and are trimmed to the number of
+    waveforms written on close.  Requires ``h5py``, which is an optional
+    dependency, installed with ``pip install pcdsdevices[hdf5]``.
+
+    Parameters
+    ----------
+    filename : str
+        HDF5 file to create.
+    chunk_shots : int, optional
+        Number of waveforms per chunk.
+    compression : str, optional
+        HDF5 compression filter, such as ``'lzf'``, or None.
+    """
+    def __init__(self, filename: str, chunk_shots: int = 64,
+                 compression: Optional[str] = None):
+        try:
+            # h5py is an optional dependency, see the hdf5 extra
+            import h5py
+        except ImportError:
+            raise RuntimeError('h5py is required to capture to HDF5, '
+                               'install pcdsdevices[hdf5]') from None
+        self.filename = filename
+        self.chunk_shots = chunk_shots
+        self.compression = compression
+        self.counts = collections.Counter()
+        self._file = h5py.File(filename, 'w')
+
+    def write(self, name: str, value: np.ndarray, timestamp: float) -> None:
+        """Append one waveform, raising ValueError if its length changed."""
+        if name not in self._file:
+            group = self._file.create_group(name)
+            group.create_dataset(
+                'data', shape=(0, value.size), maxshape=(None, value.size),
+                dtype=value.dtype, chunks=(self.chunk_shots, value.size),
+                compression=self.compression,
+            )
+            group.create_dataset(
+                'timestamp', shape=(0,), maxshape=(None,), dtype=np.float64,
+                chunks=(self.chunk_shots,),
+            )
+        data = self._file[name]['data']
+        timestamps = self._file[name]['timestamp']
+        if value.size != data.shape[1]:
+            raise ValueError(
+                f'{name} waveform has {value.size} samples, expected '
+                f'{data.shape[1]}'
+            )
+        index = self.counts[name]
+        if index >= data.shape[0]:
+            # Grow by a whole chunk at a time
+            data.resize(index + self.chunk_shots, axis=0)
+            timestamps.resize(index + self.chunk_shots, axis=0)
+        data[index] = value
+        timestamps[index] = timestamp
+        self.counts[name] += 1
+
+    def close(self) -> None:
+        """Trim the datasets to the waveforms written and close the file."""
+        for name, count in self.counts.items():
+            self._file[name]['data'].resize(count, axis=0)
+            self._file[name]['timestamp'].resize(count, axis=0)
+        self._file.close()
+
+
+@dataclasses.dataclass(frozen=True)
+class CaptureStats:
+    """
+    Summary of a waveform capture.
+
+    Attributes
+    ----------
+    shots : dict of str to int
+        Waveforms written, per signal.
+    dropped : dict of str to int
+        Waveforms dropped because the write queue was full, per signal.
+    rejected : dict of str to int
+        Waveforms that could not be written, such as after a change of
+        waveform length, per signal.
+    bytes_written : int
+        Total waveform bytes written.
+    elapsed : float
+        Seconds since the capture started, or its total duration once
+        stopped.
+    """
+    shots: dict[str, int]
+    dropped: dict[str, int]
+    rejected: dict[str, int]
+    bytes_written: int
+    elapsed: float
+
+    @property
+    def total_shots(self) -> int:
+        """Waveforms written over all signals."""
+        return sum(self.shots.values())
+
+    @property
+    def shots_per_second(self) -> float:
+        """Sustained write rate in waveforms per second."""
+        return self.total_shots / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """Sustained write rate in MB per second."""
+        if not self.elapsed:
+            return 0.0
+        return self.bytes_written / self.elapsed / 1e6
+
+
+class WaveformCapture:
+    """
+    Record every update of waveform signals to disk.
+
+    Subscribes to each signal and queues each new waveform for a dedicated
+    writer thread, which hands them to ``sink``.  Subscription callbacks
+    never wait on the disk: if the writer falls ``queue_size`` waveforms
+    behind, new waveforms are dropped and counted.
+
+    Parameters
+    ----------
+    signals : dict of str to Signal
+        The waveform signals to record, by the name to record them under.
+    sink : MemmapWaveformSink or HDF5WaveformSink
+        Where to write the waveforms.  Any object with ``write(name, value,
+        timestamp)`` and ``close()`` methods will do.
+    queue_size : int, optional
+        Maximum number of waveforms waiting to be written.
+    """
+    def __init__(self, signals: dict[str, Signal],
+                 sink: Union[MemmapWaveformSink, HDF5WaveformSink],
+                 queue_size: int = 1024):
+        self.signals = dict(signals)
+        self.sink = sink
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._cids = {}
+        self._thread = None
+        self._shots = collections.Counter()
+        self._dropped = collections.Counter()
+        self._rejected = collections.Counter()
+        self._bytes_written = 0
+        self._started = None
+        self._stopped = None
+
+    @property
+    def running(self) -> bool:
+        """True while waveforms are being recorded."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the writer thread and subscribe to the waveforms."""
+        if self._thread is not None:
+            raise RuntimeError('Waveform capture has already been started')
+        self._started = time.monotonic()
+        self._thread = threading.Thread(
+            target=self._write_loop, name='waveform_capture', daemon=True,
+        )
+        self._thread.start()
+        for name, sig in self.signals.items():
+            self._cids[name] = sig.subscribe(
+                self._make_callback(name), run=False,
+            )
+
+    def stop(self, timeout: Optional[float] = None) -> CaptureStats:
+        """
+        Unsubscribe, write out the queued waveforms and close the sink.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time to wait for the queued waveforms to be written.
+
+        Returns
+        -------
+        stats : CaptureStats
+            The final capture statistics.
+        """
+        for name, cid in self._cids.items():
+            self.signals[name].unsubscribe(cid)
+        self._cids.clear()
+        if self._thread is not None:
+            # The sentinel waits for room, it must not be dropped
+            self._queue.put(None)
+            self._thread.join(timeout=timeout)
+        return self.stats()
+
+    def stats(self) -> CaptureStats:
+        """The capture statistics so far."""
+        with self._lock:
+            end = self._stopped or time.monotonic()
+            return CaptureStats(
+                shots=dict(self._shots),
+                dropped=dict(self._dropped),
+                rejected=dict(self._rejected),
+                bytes_written=self._bytes_written,
+                elapsed=end - self._started if self._started else 0.0,
+            )
+
+    def _make_callback(self, name):
+        def queue_waveform(*args, value, timestamp=None, **kwargs):
+            if timestamp is None:
+                timestamp = time.time()
+            try:
+                self._queue.put_nowait((name, value, timestamp))
+            except queue.Full:
+                with self._lock:
+                    self._dropped[name] += 1
+        return queue_waveform
+
+    def _write_loop(self):
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                name, value, timestamp = item
+                value = np.asarray(value)
+                try:
+                    self.sink.write(name, value.reshape(-1), timestamp)
+                except Exception as ex:
+                    logger.debug('Could not write %s waveform: %s', name, ex)
+                    with self._lock:
+                        self._rejected[name] += 1
+                    continue
+                with self._lock:
+                    self._shots[name] += 1
+                    self._bytes_written += value.nbytes
+        finally:
+            try:
+                self.sink.close()
+            finally:
+                with self._lock:
+                    self._stopped = time.monotonic()
+
+
+class WaveformCaptureMixin:
+    """
+    Mixin for digitizers to record their waveforms to disk.
+
+    Subclasses list their waveform components in ``waveform_attrs``.
+    """
+    waveform_attrs: tuple[str, ...] = ()
+    tab_whitelist = ['capture_waveforms']
+
+    def capture_waveforms(
+        self,
+        path: str,
+        attrs: Optional[list[str]] = None,
+        fmt: str = 'memmap',
+        shots: int = 1000,
+        queue_size: int = 1024,
+    ) -> WaveformCapture:
+        """
+        Start recording every update of the waveform signals.
+
+        Call ``stop`` on the returned `WaveformCapture` to finish.
+
+        Parameters
+        ----------
+        path : str
+            Directory for ``'memmap'`` ring buffers, or the HDF5 file name
+            for ``'hdf5'``.
+        attrs : list of str, optional
+            Waveform components to record, defaults to ``waveform_attrs``.
+        fmt : {'memmap', 'hdf5'}, optional
+            Record into preallocated ``.npy`` rings of ``shots`` waveforms,
+            or append to chunked HDF5 datasets.
+        shots : int, optional
+            Waveforms held per signal by the ``'memmap'`` rings.
+        queue_size : int, optional
+            Waveforms that may wait to be written before new ones are
+            dropped.
+
+        Returns
+        -------
+        capture : WaveformCapture
+            The running capture.
+        """
+        attrs = list(attrs or self.waveform_attrs)
+        signals = {attr: getattr(self, attr) for attr in attrs}
+        if fmt == 'memmap':
+            sink = MemmapWaveformSink(path, shots=shots)
+        elif fmt == 'hdf5':
+            sink = HDF5WaveformSink(path)
+        else:
+            raise ValueError(f"Unknown capture format {fmt!r}, expected "
+                             "'memmap' or 'hdf5'")
+        capture = WaveformCapture(signals, sink, queue_size=queue_size)
+        capture.start()
+        return capture
+
+
 class Wave8V2SystemRegs(BaseInterface, Device):
     """
     Class for Wave8 system registers.
@@ -543,11 +906,12 @@ class Wave8V2XpmMsg(BaseInterface, Device):
                        write_pv=':XpmMsg:TxId', kind='config')
 
 
-class Wave8V2Simple(BaseInterface, Device):
+class Wave8V2Simple(WaveformCaptureMixin, BaseInterface, Device):
     """
     Simple class for viewing Wave8 waveforms, and stopping/starting
     acquisition.
     """
+    waveform_attrs = ('ch0', 'ch1', 'ch2', 'ch3', 'ch4', 'ch5', 'ch6', 'ch7')
 
     run_start = Cpt(EpicsSignal, ':SeqStartRun.PROC', kind='normal')
     set_metadata(run_start, dict(variety='command-proc', value=1))
@@ -609,7 +973,7 @@ class Wave8V2(Wave8V2Simple):
     xpm_msg = Cpt(Wave8V2XpmMsg, ':TrEvent')
 
 
-class QadcBase(BaseInterface, Device):
+class QadcBase(WaveformCaptureMixin, BaseInterface, Device):
     """
     Base class common to all qadc digitizers.
     """
@@ -626,6 +990,8 @@ class Qadc(QadcBase):
     """
     Class for older qadc, based on Abaco FMC126.
     """
+    waveform_attrs = ('out', 'rawdata')
+
     gain0_i = Cpt(EpicsSignal, ":GAIN0_I", kind="omitted")
     gain0_ni = Cpt(EpicsSignal, ":GAIN0_NI", kind="omitted")
     gain1_i = Cpt(EpicsSignal, ":GAIN1_I", kind="omitted")
@@ -686,6 +1052,8 @@ class Qadc134(QadcBase):
     """
     Class for the Abaco FMC134 digitizer card.
     """
+    waveform_attrs = ('out0', 'out1', 'rawdata0', 'rawdata1')
+
     sparsification = Cpt(Qadc134Sparsification, '', kind='omitted')
 
     full_en = Cpt(EpicsSignal, ":FULL_EN_RBV", write_pv=":FULL_EN",
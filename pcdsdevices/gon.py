@@ -1,6 +1,7 @@
 """
 Module for goniometers and sample stages used with them.
 """
+import dataclasses
 import logging
 
 import numpy as np
@@ -289,6 +290,179 @@ class KappaMoveAbort(ValueError):
     pass
 
 
+def kappa_to_spherical(eta, kappa, phi, kappa_ang=50, flipped=False):
+    """
+    Convert native kappa coordinates to spherical coordinates.
+
+    All arguments may be arrays, which are broadcast against each other so
+    that a whole trajectory can be converted in one call.
+
+    Parameters
+    ----------
+    eta : number or array
+        Eta motor position.
+    kappa : number or array
+        Kappa motor position.
+    phi : number or array
+        Phi motor position.
+    kappa_ang : number, optional
+        The angle of the kappa motor relative to the eta motor, in degrees.
+    flipped : bool or array of bool, optional
+        Use the branch for a flipped kappa, i.e. one past 180 degrees.
+
+    Returns
+    -------
+    coordinates : tuple
+        Spherical coordinates (e_eta, e_chi, e_phi).
+    """
+    eta = np.asarray(eta, dtype=float)
+    kappa = np.asarray(kappa, dtype=float)
+    phi = np.asarray(phi, dtype=float)
+
+    kappa_ang = kappa_ang * np.pi / 180
+    delta = np.arctan(np.tan(kappa * np.pi / 180 / 2)
+                      * np.cos(kappa_ang))
+
+    e_eta = -eta * np.pi / 180 - delta
+    e_chi = 2 * np.arcsin(np.sin(kappa * np.pi / 180 / 2)
+                          * np.sin(kappa_ang))
+    e_phi = -phi * np.pi / 180 - delta
+
+    # Phase shift for flipped kappa
+    e_eta = np.where(flipped, np.pi - e_eta, e_eta)
+    e_chi = e_chi + np.zeros_like(e_eta)
+    e_phi = np.where(flipped, phi * np.pi / 180 - delta, e_phi)
+
+    e_eta = e_eta * 180 / np.pi
+    e_chi = e_chi * 180 / np.pi
+    e_phi = e_phi * 180 / np.pi
+    return e_eta[()], e_chi[()], e_phi[()]
+
+
+def spherical_to_kappa(e_eta, e_chi, e_phi, kappa_ang=50, flipped=False):
+    """
+    Convert spherical coordinates to the native kappa coordinates.
+
+    All arguments may be arrays, which are broadcast against each other so
+    that a whole trajectory can be converted in one call. Coordinates that
+    the kappa cannot reach come back as NaN.
+
+    Parameters
+    ----------
+    e_eta : number or array
+        e_eta pseudo motor's spherical coordinate
+    e_chi : number or array
+        e_chi pseudo motor's spherical coordinate
+    e_phi : number or array
+        e_phi pseudo motor's spherical coordinate
+    kappa_ang : number, optional
+        The angle of the kappa motor relative to the eta motor, in degrees.
+    flipped : bool or array of bool, optional
+        Use the branch for a flipped kappa, i.e. one past 180 degrees.
+
+    Returns
+    -------
+    coordinates : tuple
+        Native kappa coordinates (eta, kappa, phi).
+    """
+    e_eta = np.asarray(e_eta, dtype=float)
+    e_chi = np.asarray(e_chi, dtype=float)
+    e_phi = np.asarray(e_phi, dtype=float)
+
+    kappa_ang = kappa_ang * np.pi / 180
+    with np.errstate(invalid='ignore'):
+        delta = np.arcsin(-np.tan(e_chi * np.pi / 180 / 2)
+                          / np.tan(kappa_ang))
+        k_eta = -(e_eta * np.pi / 180 - delta)
+        k_kap = 2 * np.arcsin(np.sin(e_chi * np.pi / 180 / 2)
+                              / np.sin(kappa_ang))
+    k_phi = e_phi * np.pi / 180 - delta
+
+    # Phase shift for flipped kappa
+    k_eta = np.where(flipped, -k_eta - np.pi, k_eta)
+    k_kap = np.where(flipped, 2 * np.pi - k_kap, k_kap + np.zeros_like(k_eta))
+    k_phi = np.where(flipped, -e_phi * np.pi / 180 - delta, k_phi)
+
+    k_eta = k_eta * 180 / np.pi
+    k_kap = k_kap * 180 / np.pi
+    k_phi = -k_phi * 180 / np.pi
+    return k_eta[()], k_kap[()], k_phi[()]
+
+
+@dataclasses.dataclass(frozen=True)
+class KappaTrajectory:
+    """
+    Real motor setpoints precomputed for a Kappa scan.
+
+    Made by `Kappa.plan_trajectory`. Each row of the arrays is one point of
+    the scan, with the columns in (eta, kappa, phi) order, or (e_eta, e_chi,
+    e_phi) order for ``spherical``.
+
+    Attributes
+    ----------
+    spherical : np.ndarray
+        The requested spherical coordinates.
+    real : np.ndarray
+        The real motor setpoints. Unreachable points are NaN.
+    steps : np.ndarray
+        How far each motor moves to reach each point from the previous one,
+        or from the start position for the first point.
+    max_step : np.ndarray
+        The largest step each motor may make without confirmation.
+    out_of_limits : np.ndarray
+        Where a setpoint is outside of the motor's limits.
+    branch_flip : np.ndarray
+        Which points can only be reached with the kappa on the other branch.
+    flipped : bool
+        Whether the setpoints were calculated for a flipped kappa.
+    """
+    spherical: np.ndarray
+    real: np.ndarray
+    steps: np.ndarray
+    max_step: np.ndarray
+    out_of_limits: np.ndarray
+    branch_flip: np.ndarray
+    flipped: bool
+
+    @property
+    def eta(self) -> np.ndarray:
+        return self.real[:, 0]
+
+    @property
+    def kappa(self) -> np.ndarray:
+        return self.real[:, 1]
+
+    @property
+    def phi(self) -> np.ndarray:
+        return self.real[:, 2]
+
+    @property
+    def over_step(self) -> np.ndarray:
+        """Where a motor step is larger than its max step."""
+        return self.steps > self.max_step
+
+    @property
+    def confirm_points(self) -> np.ndarray:
+        """Indices of the points that would ask for confirmation."""
+        return np.flatnonzero(self.over_step.any(axis=1))
+
+    @property
+    def unreachable_points(self) -> np.ndarray:
+        """Indices of the points the kappa cannot reach."""
+        return np.flatnonzero(~np.isfinite(self.real).all(axis=1))
+
+    @property
+    def branch_flips(self) -> np.ndarray:
+        """Indices of the points that need the kappa on the other branch."""
+        return np.flatnonzero(self.branch_flip)
+
+    @property
+    def valid(self) -> bool:
+        """True if every point is reachable and within the limits."""
+        return not (self.unreachable_points.size
+                    or self.out_of_limits.any())
+
+
 class Kappa(BaseInterface, PseudoPositioner, GroupDevice):
     """
     Kappa stage, control the Kappa diffractometer in spherical coordinates.
@@ -376,7 +550,8 @@ class Kappa(BaseInterface, PseudoPositioner, GroupDevice):
     # Only stage the motors involved in the coordinate transform
     stage_group = [eta, kappa, phi]
     tab_component_names = True
-    tab_whitelist = ['stop', 'wait', 'k_to_e', 'e_to_k', 'check_motor_step']
+    tab_whitelist = ['stop', 'wait', 'k_to_e', 'e_to_k', 'check_motor_step',
+                     'plan_trajectory']
 
     def __init__(self, *, name, prefix_x, prefix_y, prefix_z,
                  prefix_eta, prefix_kappa, prefix_phi, eta_max_step=2,
@@ -420,7 +595,12 @@ class Kappa(BaseInterface, PseudoPositioner, GroupDevice):
         e_eta, e_chi, e_phi = self.k_to_e()
         return e_phi
 
-    def k_to_e(self, eta=None, kappa=None, phi=None):
+    @property
+    def kappa_flipped(self):
+        """True if the kappa motor is past 180 degrees."""
+        return self.kappa.position > 180
+
+    def k_to_e(self, eta=None, kappa=None, phi=None, flipped=None):
         """
         Convert from native kappa coordinates to spherical coordinates.
 
@@ -428,12 +608,15 @@ class Kappa(BaseInterface, PseudoPositioner, GroupDevice):
 
         Parameters
         ----------
-        eta : number
+        eta : number or array
             Eta motor position.
-        kappa : number
+        kappa : number or array
             Kappa motor position.
-        phi : number
+        phi : number or array
             Phi motor position.
+        flipped : bool, optional
+            Use the branch for a flipped kappa. Defaults to checking the
+            live kappa position.
 
         Returns
         -------
@@ -446,28 +629,12 @@ class Kappa(BaseInterface, PseudoPositioner, GroupDevice):
             kappa = self.kappa.position
         if phi is None:
             phi = self.phi.position
+        if flipped is None:
+            flipped = self.kappa_flipped
+        return kappa_to_spherical(eta, kappa, phi, kappa_ang=self.kappa_ang,
+                                  flipped=flipped)
 
-        kappa_ang = self.kappa_ang * np.pi / 180
-        delta = np.arctan(np.tan(kappa * np.pi / 180 / 2)
-                          * np.cos(kappa_ang))
-
-        e_eta = -eta * np.pi / 180 - delta
-        e_chi = 2 * np.arcsin(np.sin(kappa * np.pi / 180 / 2)
-                              * np.sin(kappa_ang))
-        e_phi = -phi * np.pi / 180 - delta
-
-        # Phase shift for flipped kappa
-        if self.kappa.position > 180:
-            e_eta = np.pi - e_eta
-            e_chi = e_chi
-            e_phi = phi * np.pi / 180 - delta
-
-        e_eta = e_eta * 180 / np.pi
-        e_chi = e_chi * 180 / np.pi
-        e_phi = e_phi * 180 / np.pi
-        return e_eta, e_chi, e_phi
-
-    def e_to_k(self, e_eta=None, e_chi=None, e_phi=None):
+    def e_to_k(self, e_eta=None, e_chi=None, e_phi=None, flipped=None):
         """
         Convert from spherical coordinates to the native kappa coordinates.
 
@@ -475,43 +642,101 @@ class Kappa(BaseInterface, PseudoPositioner, GroupDevice):
 
         Parameters
         ----------
-        e_eta : number
+        e_eta : number or array
             e_eta pseudo motor's spherical coordinate
-        e_chi : number
+        e_chi : number or array
             e_chi pseudo motor's spherical coordinate
-        e_phi : number
+        e_phi : number or array
             e_phi pseudo motor's spherical coordinate
+        flipped : bool, optional
+            Use the branch for a flipped kappa. Defaults to checking the
+            live kappa position.
 
         Returns
         -------
         coordinates : tuple
             Native kappa coordinates.
         """
-        if e_eta is None:
-            e_eta = self.e_eta_coord
-        if e_chi is None:
-            e_chi = self.e_chi_coord
-        if e_phi is None:
-            e_phi = self.e_phi_coord
-
-        kappa_ang = self.kappa_ang * np.pi / 180
-        delta = np.arcsin(-np.tan(e_chi * np.pi / 180 / 2)
-                          / np.tan(kappa_ang))
-        k_eta = -(e_eta * np.pi / 180 - delta)
-        k_kap = 2 * np.arcsin(np.sin(e_chi * np.pi / 180 / 2)
-                              / np.sin(kappa_ang))
-        k_phi = e_phi * np.pi / 180 - delta
+        if flipped is None:
+            flipped = self.kappa_flipped
+        if e_eta is None or e_chi is None or e_phi is None:
+            current = self.k_to_e(flipped=flipped)
+            if e_eta is None:
+                e_eta = current[0]
+            if e_chi is None:
+                e_chi = current[1]
+            if e_phi is None:
+                e_phi = current[2]
+        return spherical_to_kappa(e_eta, e_chi, e_phi,
+                                  kappa_ang=self.kappa_ang, flipped=flipped)
+
+    def plan_trajectory(self, e_eta, e_chi, e_phi, start=None, flipped=None):
+        """
+        Precompute and check the real motor setpoints for a scan.
 
-        # Phase shift for flipped kappa
-        if self.kappa.position > 180:
-            k_eta = -k_eta - np.pi
-            k_kap = 2 * np.pi - k_kap
-            k_phi = -e_phi * np.pi / 180 - delta
+        Nothing is moved. The returned `KappaTrajectory` holds the setpoints
+        of every point along with the points that would need confirmation,
+        are unreachable, are outside of the motor limits, or could only be
+        reached by flipping the kappa branch, so a scan can be checked
+        before it starts.
 
-        k_eta = k_eta * 180 / np.pi
-        k_kap = k_kap * 180 / np.pi
-        k_phi = -k_phi * 180 / np.pi
-        return k_eta, k_kap, k_phi
+        Parameters
+        ----------
+        e_eta, e_chi, e_phi : number or array
+            The spherical coordinates of the scan points, broadcast against
+            each other.
+        start : tuple, optional
+            The (eta, kappa, phi) position the scan starts from. Defaults to
+            the current position.
+        flipped : bool, optional
+            Use the branch for a flipped kappa. Defaults to checking the
+            live kappa position.
+
+        Returns
+        -------
+        trajectory : KappaTrajectory
+        """
+        if start is None:
+            start = (self.eta.position, self.kappa.position,
+                     self.phi.position)
+        start = np.asarray(start, dtype=float)
+        if flipped is None:
+            flipped = bool(start[1] > 180)
+        spherical = np.column_stack(
+            np.broadcast_arrays(*(np.atleast_1d(np.asarray(coord, dtype=float))
+                                  for coord in (e_eta, e_chi, e_phi)))
+        )
+        limits = [motor.limits for motor in (self.eta, self.kappa, self.phi)]
+
+        def setpoints(flipped):
+            real = np.column_stack(
+                spherical_to_kappa(*spherical.T, kappa_ang=self.kappa_ang,
+                                   flipped=flipped)
+            )
+            out_of_limits = np.zeros(real.shape, dtype=bool)
+            for index, (low, high) in enumerate(limits):
+                if low < high:
+                    with np.errstate(invalid='ignore'):
+                        out_of_limits[:, index] = ((real[:, index] < low)
+                                                   | (real[:, index] > high))
+            usable = np.isfinite(real).all(axis=1)
+            usable &= ~out_of_limits.any(axis=1)
+            return real, out_of_limits, usable
+
+        real, out_of_limits, usable = setpoints(flipped)
+        _, _, other_usable = setpoints(not flipped)
+        steps = np.abs(np.diff(np.vstack([start, real]), axis=0))
+        max_step = np.array([self.eta_max_step, self.kappa_max_step,
+                             self.phi_max_step], dtype=float)
+        return KappaTrajectory(
+            spherical=spherical,
+            real=real,
+            steps=steps,
+            max_step=max_step,
+            out_of_limits=out_of_limits,
+            branch_flip=~usable & other_usable,
+            flipped=flipped,
+        )
 
     @pseudo_position_argument
     def forward(self, pseudo_pos):
@@ -604,9 +829,12 @@ class Kappa(BaseInterface, PseudoPositioner, GroupDevice):
            `True` if motor step is smaller than the respective max step and/or
            the user has confirmed yes.
         """
-        eta_step = abs(eta - self.eta.position)
-        kappa_step = abs(kappa - self.kappa.position)
-        phi_step = abs(phi - self.phi.position)
+        eta_pos = self.eta.position
+        kappa_pos = self.kappa.position
+        phi_pos = self.phi.position
+        eta_step = abs(eta - eta_pos)
+        kappa_step = abs(kappa - kappa_pos)
+        phi_step = abs(phi - phi_pos)
 
         is_eta_above_max = eta_step > self.eta_max_step
         is_kappa_above_max = kappa_step > self.kappa_max_step
@@ -616,10 +844,11 @@ class Kappa(BaseInterface, PseudoPositioner, GroupDevice):
             d_str = '\nDo you really intend to do the following motions?\n'
             t = PrettyTable(['Motor', 'Current position', 'to',
                              'Target position'])
-            t.add_row(['eta', self.eta.position, '-->', eta])
-            t.add_row(['kappa', self.kappa.position, '-->', kappa])
-            t.add_row(['phi', self.phi.position, '-->', phi])
-            e_eta, e_chi, e_phi = self.k_to_e(eta=eta, kappa=kappa, phi=phi)
+            t.add_row(['eta', eta_pos, '-->', eta])
+            t.add_row(['kappa', kappa_pos, '-->', kappa])
+            t.add_row(['phi', phi_pos, '-->', phi])
+            e_eta, e_chi, e_phi = self.k_to_e(eta=eta, kappa=kappa, phi=phi,
+                                              flipped=kappa_pos > 180)
             t.add_row(['e_eta', self.e_eta.position, '-->', e_eta])
             t.add_row(['e_chi', self.e_chi.position, '-->', e_chi])
             t.add_row(['e_phi', self.e_phi.position, '-->', e_phi])
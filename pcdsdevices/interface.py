@@ -1,6 +1,7 @@
 """
 Module for defining bell-and-whistles movement features.
 """
+import dataclasses
 import functools
 import logging
 import numbers
@@ -11,11 +12,13 @@ import signal
 import subprocess
 import time
 import typing
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait as futures_wait
 from contextlib import contextmanager
 from pathlib import Path
 from threading import Event
 from types import MethodType, SimpleNamespace
-from typing import Optional
+from typing import Any, Optional
 from weakref import WeakSet
 
 import ophyd
@@ -29,6 +32,7 @@ from ophyd.positioner import PositionerBase
 from ophyd.signal import AttributeSignal, Signal
 
 from . import utils
+from .preset_store import SQLitePresetStore, get_preset_store
 from .signal import NotImplementedSignal, SummarySignal
 
 try:
@@ -44,6 +48,14 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 engineering_mode = True
+# Bumped to invalidate the cached tab-completion dir lists
+_tab_completion_generation = 0
+status_batching = True
+
+# Shared deadline in seconds for reading all signals in one status_info
+STATUS_INFO_TIMEOUT = 1.0
+# Maximum number of concurrent signal reads in one status_info
+STATUS_INFO_WORKERS = 16
 
 OphydObject_whitelist = []
 BlueskyInterface_whitelist = []
@@ -102,14 +114,27 @@ class TabCompletionHelperClass(_TabCompletionHelper):
     """
 
     cls: type['BaseInterface']
+    _class_includes: typing.Optional[set[str]] = None
 
     def __init__(self, cls):
         self.cls = cls
+        self._dir_cache = {}
+        self._dir_generation = None
+        self._uses_object_dir = None
         super().__init__()
 
-    def reset(self):
-        """Reset the attribute includes to those annotated in the class."""
-        super().reset()
+    @property
+    def _includes(self) -> set[str]:
+        """The includes, gathered from the class on first use."""
+        if self._class_includes is None:
+            self._class_includes = self._gather_includes()
+        return self._class_includes
+
+    @_includes.setter
+    def _includes(self, includes: set[str]):
+        self._class_includes = includes
+
+    def _gather_includes(self) -> set[str]:
         whitelist = []
         for parent in self.cls.mro():
             whitelist.extend(getattr(parent, 'tab_whitelist', []))
@@ -119,7 +144,65 @@ class TabCompletionHelperClass(_TabCompletionHelper):
                     if getattr(parent, cpt_name).kind != Kind.omitted:
                         whitelist.append(cpt_name)
 
-        self._includes = set(whitelist)
+        return set(whitelist)
+
+    def reset(self):
+        """Reset the attribute includes to those annotated in the class."""
+        self._regex = None
+        self._class_includes = None
+        self._dir_cache.clear()
+
+    def add(self, attr: str):
+        """Add an attribute to the include list."""
+        super().add(attr)
+        self._dir_cache.clear()
+
+    def remove(self, attr: str):
+        """Remove an attribute from the include list."""
+        super().remove(attr)
+        self._dir_cache.clear()
+
+    @property
+    def uses_object_dir(self) -> bool:
+        """
+        True if instances get their unfiltered dir list from ``object``.
+
+        Only then can an instance's dir list be assembled from the cached
+        class dir list and the instance's own attributes.
+        """
+        if self._uses_object_dir is None:
+            mro = self.cls.mro()
+            after = mro[mro.index(BaseInterface) + 1:]
+            owner = next(
+                (parent for parent in after if '__dir__' in vars(parent)),
+                object,
+            )
+            self._uses_object_dir = owner is object
+        return self._uses_object_dir
+
+    def get_class_dir(self, filtered: bool = True) -> list[str]:
+        """
+        Get the dir list of the class, cached until the includes change or
+        :func:`set_engineering_mode` is called.
+
+        Parameters
+        ----------
+        filtered : bool, optional
+            Only include the attributes that match the includes.
+        """
+        if self._dir_generation != _tab_completion_generation:
+            self._dir_cache.clear()
+            self._dir_generation = _tab_completion_generation
+        try:
+            return self._dir_cache[filtered]
+        except KeyError:
+            pass
+        names = dir(self.cls)
+        if filtered:
+            regex = self._regex or self.build_regex()
+            names = [elem for elem in names if regex.fullmatch(elem)]
+        self._dir_cache[filtered] = names
+        return names
 
     def new_instance(self, instance) -> 'TabCompletionHelperInstance':
         """
@@ -149,6 +232,7 @@ class TabCompletionHelperInstance(_TabCompletionHelper):
     class_helper: TabCompletionHelperClass
     instance: 'BaseInterface'
     super_dir: typing.Callable[[], list[str]]
+    _extra_regex: typing.Optional[typing.Pattern] = None
 
     def __init__(self, instance, class_helper):
         assert isinstance(instance, BaseInterface), 'Must mix in BaseInterface'
@@ -163,16 +247,47 @@ class TabCompletionHelperInstance(_TabCompletionHelper):
         super().reset()
         self._includes = set(self.class_helper._includes)
 
+    def build_regex(self) -> typing.Pattern:
+        """Update the regular expressions based on the current includes."""
+        extra = self._includes - self.class_helper._includes
+        self._extra_regex = re.compile("|".join(sorted(extra))) if extra else None
+        return super().build_regex()
+
     def get_filtered_dir_list(self) -> list[str]:
-        """Get the dir list, filtered based on the whitelist."""
+        """
+        Get the dir list, filtered based on the whitelist.
+
+        The class attributes come from the class helper's cached list, so
+        only the instance's own attributes and any includes added to this
+        instance need to be matched here.
+        """
         if self._regex is None:
             self.build_regex()
 
-        return [
+        class_helper = self.class_helper
+        if (
+            not class_helper.uses_object_dir
+            or not self._includes >= class_helper._includes
+        ):
+            return [
+                elem
+                for elem in self.super_dir()
+                if self._regex.fullmatch(elem)
+            ]
+
+        names = set(class_helper.get_class_dir(filtered=True))
+        if self._extra_regex is not None:
+            names.update(
+                elem
+                for elem in class_helper.get_class_dir(filtered=False)
+                if self._extra_regex.fullmatch(elem)
+            )
+        names.update(
             elem
-            for elem in self.super_dir()
+            for elem in vars(self.instance)
             if self._regex.fullmatch(elem)
-        ]
+        )
+        return sorted(names)
 
     def get_dir(self) -> list[str]:
         """Get the dir list based on the engineering mode settings."""
@@ -373,7 +488,22 @@ class BaseInterface:
         def subdevice_filter(info):
             return bool(info['kind'] & Kind.normal)
 
-        return ophydobj_info(self, subdevice_filter=subdevice_filter)
+        if not get_status_batching():
+            return ophydobj_info(self, subdevice_filter=subdevice_filter)
+
+        info, self._status_timing = batched_ophydobj_info(
+            self, subdevice_filter=subdevice_filter
+        )
+        return info
+
+    @property
+    def status_timing(self) -> Optional['StatusInfoTiming']:
+        """
+        Timing breakdown from the most recent batched ``status_info`` call.
+
+        Use ``status_timing.slowest()`` to find the slow PVs.
+        """
+        return getattr(self, '_status_timing', None)
 
     def post_elog_status(self):
         """
@@ -453,25 +583,78 @@ def get_units(signal):
             ...
 
 
-def ophydobj_info(obj, subdevice_filter=None, devices=None):
+def ophydobj_info(obj, subdevice_filter=None, devices=None, values=None):
     if isinstance(obj, Signal):
-        return signal_info(obj)
+        return signal_info(obj, values=values)
     elif isinstance(obj, Device):
         return device_info(obj, subdevice_filter=subdevice_filter,
-                           devices=devices)
+                           devices=devices, values=values)
     elif isinstance(obj, PositionerBase):
         return positionerbase_info(obj)
     else:
         return {}
 
 
-def device_info(device, subdevice_filter=None, devices=None):
+def device_info(device, subdevice_filter=None, devices=None, values=None):
     if devices is None:
         devices = set()
     name = get_name(device, default='device')
     kind = get_kind(device)
     info = dict(name=name, kind=kind, is_device=True)
 
+    if values is None:
+        info.update(device_header_info(device))
+    else:
+        info.update(values.get(device) or {})
+
+    try:
+        # Best-effort try at getting the units
+        info['units'] = get_units(device)
+    except Exception:
+        pass
+
+    if device not in devices:
+        devices.add(device)
+        for cpt_name, cpt in _status_components(device):
+            if values is not None and not _passes_filter(cpt,
+                                                         subdevice_filter):
+                # Skipped while gathering, would be filtered out below
+                continue
+            cpt_info = ophydobj_info(cpt, subdevice_filter=subdevice_filter,
+                                     devices=devices, values=values)
+            if 'position' in info:
+                # Drop some potential duplicate keys for positioners
+                try:
+                    if cpt.name == cpt.parent.name:
+                        continue
+                except AttributeError:
+                    pass
+                if cpt_name in ('readback', 'user_readback'):
+                    continue
+
+            if not callable(subdevice_filter) or subdevice_filter(cpt_info):
+                info[cpt_name] = cpt_info
+    return info
+
+
+def device_header_info(device):
+    """
+    Read the preset state and position that lead a device's status info.
+
+    These are the values that are not plain leaf signals, so they are read
+    separately from the rest of the tree.
+
+    Parameters
+    ----------
+    device : Device
+        The device to read.
+
+    Returns
+    -------
+    header : dict
+        The ``preset`` and ``position`` keys that apply to this device.
+    """
+    info = {}
     try:
         # Show the current preset state if we have one
         # This should be the first key in the ordered dict
@@ -500,61 +683,253 @@ def device_info(device, subdevice_filter=None, devices=None):
                 info['position'] = float(info['position'])
         except Exception:
             ...
+    return info
 
-    try:
-        # Best-effort try at getting the units
-        info['units'] = get_units(device)
-    except Exception:
-        pass
 
-    if device not in devices:
-        devices.add(device)
-        for cpt_name, cpt_desc in device._sig_attrs.items():
-            # Skip lazy signals outright in all cases
-            # Usually these are lazy because they take too long to getattr
-            if cpt_desc.lazy:
-                continue
-            # Skip attribute signals
-            # Indeterminate get times, no real connected bool, etc.
-            if issubclass(cpt_desc.cls, AttributeSignal):
-                continue
-            # Skip not implemented signals
-            # They never have interesting information
-            if issubclass(cpt_desc.cls, NotImplementedSignal):
-                continue
-            try:
-                cpt = getattr(device, cpt_name)
-            except AttributeError:
-                # Why are we ever in this block?
-                logger.debug(f'Getattr {name}.{cpt_name} failed.',
-                             exc_info=True)
-                continue
-            cpt_info = ophydobj_info(cpt, subdevice_filter=subdevice_filter,
-                                     devices=devices)
-            if 'position' in info:
-                # Drop some potential duplicate keys for positioners
-                try:
-                    if cpt.name == cpt.parent.name:
-                        continue
-                except AttributeError:
-                    pass
-                if cpt_name in ('readback', 'user_readback'):
-                    continue
+def _status_components(device):
+    """
+    Yield the (attr, component) pairs that are included in status displays.
+    """
+    for cpt_name, cpt_desc in device._sig_attrs.items():
+        # Skip lazy signals outright in all cases
+        # Usually these are lazy because they take too long to getattr
+        if cpt_desc.lazy:
+            continue
+        # Skip attribute signals
+        # Indeterminate get times, no real connected bool, etc.
+        if issubclass(cpt_desc.cls, AttributeSignal):
+            continue
+        # Skip not implemented signals
+        # They never have interesting information
+        if issubclass(cpt_desc.cls, NotImplementedSignal):
+            continue
+        try:
+            cpt = getattr(device, cpt_name)
+        except AttributeError:
+            # Why are we ever in this block?
+            logger.debug(f'Getattr {device.name}.{cpt_name} failed.',
+                         exc_info=True)
+            continue
+        yield cpt_name, cpt
 
-            if not callable(subdevice_filter) or subdevice_filter(cpt_info):
-                info[cpt_name] = cpt_info
-    return info
+
+def _passes_filter(obj, subdevice_filter):
+    """
+    Check a component against ``subdevice_filter`` before reading it.
+
+    The filter only receives the name, kind, and is_device keys here.
+    """
+    if not callable(subdevice_filter):
+        return True
+    partial_info = dict(
+        name=get_name(obj, default='obj'),
+        kind=get_kind(obj),
+        is_device=not isinstance(obj, Signal),
+    )
+    return subdevice_filter(partial_info)
 
 
-def signal_info(signal):
+def signal_info(signal, values=None):
     name = get_name(signal, default='signal')
     kind = get_kind(signal)
-    value = get_value(signal)
+    if values is None:
+        value = get_value(signal)
+    else:
+        value = values.get(signal)
     units = get_units(signal)
     return dict(name=name, kind=kind, is_device=False, value=value,
                 units=units)
 
 
+@dataclasses.dataclass
+class StatusInfoTiming:
+    """
+    Timing breakdown for one batched ``status_info`` collection.
+
+    All times are in seconds.
+    """
+    #: Time spent walking the device tree to find the signals
+    gather: float = 0.0
+    #: Wall-clock time spent reading all of the signals
+    read: float = 0.0
+    #: Time spent building the nested status dictionary
+    assemble: float = 0.0
+    #: Time taken by each individual signal read, by signal name
+    signals: dict[str, float] = dataclasses.field(default_factory=dict)
+    #: Names of the signals that did not finish before the deadline
+    timed_out: list[str] = dataclasses.field(default_factory=list)
+
+    @property
+    def total(self) -> float:
+        """The total time spent on the collection."""
+        return self.gather + self.read + self.assemble
+
+    def slowest(self, count: int = 10) -> list[tuple[str, float]]:
+        """
+        Return the ``count`` slowest signal reads, slowest first.
+        """
+        return sorted(
+            self.signals.items(), key=lambda item: item[1], reverse=True
+        )[:count]
+
+
+def gather_status_signals(obj, subdevice_filter=None, devices=None):
+    """
+    Find every signal that ``ophydobj_info`` would read for ``obj``.
+
+    Parameters
+    ----------
+    obj : OphydObject
+        The signal or device to search.
+    subdevice_filter : callable, optional
+        The same filter that will be passed to ``ophydobj_info``.
+        Components that it rejects are not searched.
+    devices : set, optional
+        Devices that have already been searched, used to avoid cycles.
+
+    Returns
+    -------
+    signals : list of Signal
+        Every leaf signal in the tree, in the order they will be displayed.
+    """
+    if isinstance(obj, Signal):
+        return [obj]
+    if not isinstance(obj, Device):
+        return []
+    if devices is None:
+        devices = set()
+    if obj in devices:
+        return []
+    devices.add(obj)
+    signals = []
+    for _, cpt in _status_components(obj):
+        if _passes_filter(cpt, subdevice_filter):
+            signals.extend(
+                gather_status_signals(cpt, subdevice_filter, devices)
+            )
+    return signals
+
+
+def read_signals(signals, timeout=None, max_workers=None, reader=None):
+    """
+    Read many signals concurrently, sharing one deadline.
+
+    Signals whose values are kept up to date by monitors return right
+    away, and the rest are fanned out over a pool of threads so that the
+    channel access round trips overlap rather than run back to back.
+
+    Parameters
+    ----------
+    signals : list of Signal
+        The signals to read.
+    timeout : float, optional
+        The deadline for all of the reads. Defaults to
+        ``STATUS_INFO_TIMEOUT``.
+    max_workers : int, optional
+        The maximum number of reads in flight at once. Defaults to
+        ``STATUS_INFO_WORKERS``.
+    reader : callable, optional
+        Called with each item of ``signals`` to read it. Defaults to
+        ``get_value``.
+
+    Returns
+    -------
+    values : dict
+        Mapping of signal to value, with ``None`` for reads that failed or
+        did not complete in time.
+    timing : StatusInfoTiming
+        The per-signal read times and the wall-clock time of the batch.
+    """
+    if timeout is None:
+        timeout = STATUS_INFO_TIMEOUT
+    if max_workers is None:
+        max_workers = STATUS_INFO_WORKERS
+    if reader is None:
+        reader = get_value
+    timing = StatusInfoTiming()
+    values = {}
+    signals = list(dict.fromkeys(signals))
+    if not signals:
+        return values, timing
+
+    def timed_get(signal):
+        start = time.monotonic()
+        value = reader(signal)
+        return value, time.monotonic() - start
+
+    start = time.monotonic()
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(signals)),
+        thread_name_prefix='status_info',
+    )
+    try:
+        futures = {executor.submit(timed_get, sig): sig for sig in signals}
+        done, _ = futures_wait(futures, timeout=timeout)
+    finally:
+        # Do not wait for stragglers, they are reported as timed out
+        executor.shutdown(wait=False, cancel_futures=True)
+    timing.read = time.monotonic() - start
+
+    for future, sig in futures.items():
+        name = get_name(sig, default='signal')
+        if future in done and future.exception() is None:
+            values[sig], timing.signals[name] = future.result()
+        else:
+            values[sig] = None
+            timing.signals[name] = timing.read
+            timing.timed_out.append(name)
+    return values, timing
+
+
+def _read_status_item(obj):
+    """Read a leaf signal value or a device's status header."""
+    if isinstance(obj, Signal):
+        return get_value(obj)
+    return device_header_info(obj)
+
+
+def batched_ophydobj_info(obj, subdevice_filter=None, timeout=None):
+    """
+    Batched version of ``ophydobj_info``.
+
+    First gathers every leaf signal in the tree, then reads them all at
+    once with `read_signals`, then assembles the same nested dictionary
+    that ``ophydobj_info`` would have returned. The preset states and
+    positions of the devices in the tree are read in the same batch.
+
+    Parameters
+    ----------
+    obj : OphydObject
+        The signal or device to collect information for.
+    subdevice_filter : callable, optional
+        Passed through to ``ophydobj_info``.
+    timeout : float, optional
+        The shared deadline for reading all of the signals.
+
+    Returns
+    -------
+    info : dict
+        The nested status information dictionary.
+    timing : StatusInfoTiming
+        The timing breakdown for this collection.
+    """
+    start = time.monotonic()
+    devices = set()
+    signals = gather_status_signals(obj, subdevice_filter=subdevice_filter,
+                                    devices=devices)
+    gather_time = time.monotonic() - start
+
+    values, timing = read_signals(signals + list(devices), timeout=timeout,
+                                  reader=_read_status_item)
+    timing.gather = gather_time
+
+    start = time.monotonic()
+    info = ophydobj_info(obj, subdevice_filter=subdevice_filter,
+                         values=values)
+    timing.assemble = time.monotonic() - start
+    return info, timing
+
+
 def positionerbase_info(positioner):
     name = get_name(positioner, default='positioner')
     kind = get_kind(positioner)
@@ -577,7 +952,9 @@ def set_engineering_mode(expert):
     """
 
     global engineering_mode
+    global _tab_completion_generation
     engineering_mode = bool(expert)
+    _tab_completion_generation += 1
 
 
 def get_engineering_mode():
@@ -593,6 +970,38 @@ def get_engineering_mode():
     return engineering_mode
 
 
+def set_status_batching(batch):
+    """
+    Switches how :class:`BaseInterface` collects ``status_info``.
+
+    When batching is enabled, every signal in the device tree is found
+    first and then read concurrently with one shared deadline. When it is
+    disabled, each signal is read one at a time as the tree is walked.
+
+    Parameters
+    ----------
+    batch : bool
+        Set to `True` to enable batching, or :keyword:`False` to disable
+        it. `True` is the starting value.
+    """
+
+    global status_batching
+    status_batching = bool(batch)
+
+
+def get_status_batching():
+    """
+    Get the last value set by :meth:`set_status_batching`.
+
+    Returns
+    -------
+    batch : bool
+        The current batching mode. See :meth:`set_status_batching`.
+    """
+
+    return status_batching
+
+
 class MvInterface(BaseInterface):
     """
     Interface layer to attach to a positioner for motion shortcuts.
@@ -915,7 +1324,8 @@ class FltMvInterface(MvInterface):
         self.set_current_position(position)
 
 
-def setup_preset_paths(defer_loading: bool = False, **paths):
+def setup_preset_paths(defer_loading: bool = False, backend: str = 'yaml',
+                       **paths):
     """
     Prepare the :class:`Presets` class.
 
@@ -930,7 +1340,14 @@ def setup_preset_paths(defer_loading: bool = False, **paths):
     defer_loading : bool, by default False
         (Optional) "defer_loading": bool, whether or not to defer the loading
         of preset files until the first tab completion
+    backend : {'yaml', 'sqlite'}, by default 'yaml'
+        (Optional) How presets are stored in each directory. 'yaml' uses one
+        file per device. 'sqlite' uses one shared ``presets.db`` file per
+        preset type, see :mod:`pcdsdevices.preset_store`.
     """
+    if backend not in ('yaml', 'sqlite'):
+        raise ValueError(f'Unknown preset backend {backend!r}')
+    Presets._backend = backend
     Presets._paths = {}
     for k, v in paths.items():
         Presets._paths[k] = Path(v)
@@ -964,6 +1381,7 @@ class Presets:
 
     _registry = WeakSet()
     _paths = {}
+    _backend = 'yaml'
 
     def __init__(self, device):
         self._device = device
@@ -974,8 +1392,14 @@ class Presets:
         self._mtimes = {}
         self.sync()
 
+    def _store(self, preset_type) -> SQLitePresetStore:
+        """Utility function to get the shared store for the sqlite backend."""
+        return get_preset_store(self._paths[preset_type])
+
     def _path(self, preset_type) -> Path:
         """Utility function to get the preset file :class:`~pathlib.Path`."""
+        if self._backend == 'sqlite':
+            return self._store(preset_type).path
         path = self._paths[preset_type] / (self._device.name + '.yml')
         logger.debug('select presets path %s', path)
         return path
@@ -1069,6 +1493,15 @@ class Presets:
             raise TypeError(
                 f"value must be a real numeric type, not type {type(value)}"
             )
+        if self._backend == 'sqlite':
+            try:
+                self._store(preset_type).update(
+                    self._device.name, name, value=value, comment=comment,
+                    active=active,
+                )
+            except BlockingIOError:
+                self._log_flock_error()
+            return
         try:
             path = self._path(preset_type)
             if not path.exists():
@@ -1108,6 +1541,16 @@ class Presets:
         if not defer_loading:
             logger.debug('filling %s cache', self.name)
             for preset_type in self._paths.keys():
+                if self._backend == 'sqlite':
+                    # Store versions stand in for file modification times
+                    store = self._store(preset_type)
+                    data = store.get(self._device.name)
+                    self._mtimes[preset_type] = store.version(
+                        self._device.name
+                    )
+                    if data:
+                        self._cache[preset_type] = data
+                    continue
                 path = self._path(preset_type)
                 if path.exists():
                     self._mtimes[preset_type] = os.path.getmtime(path)
@@ -1349,6 +1792,13 @@ class Presets:
     def sync_needed(self) -> bool:
         """True if this preset has fallen out of sync with backing files"""
         curr_mtimes = {}
+        if self._backend == 'sqlite':
+            for preset_type in self._paths.keys():
+                curr_mtimes[preset_type] = self._store(preset_type).version(
+                    self._device.name
+                )
+            return not curr_mtimes == self._mtimes
+
         for preset_type in self._paths.keys():
             preset_path = self._path(preset_type)
             if preset_path.exists():
@@ -1749,6 +2199,10 @@ class LightpathMixin(Device):
     lightpath_summary: Signal = Cpt(SummarySignal, name='lightpath_summary',
                                     kind='omitted')
 
+    # Seconds over which to collapse bursts of lightpath_cpts updates into
+    # a single state calculation.  Zero recalculates on every update.
+    lightpath_debounce: float = 0.0
+
     def __init__(self, *args,
                  input_branches=[], output_branches=[], **kwargs):
         self._lightpath_ready = False
@@ -1766,6 +2220,7 @@ class LightpathMixin(Device):
 
     def _init_summary_signal(self) -> None:
         if self.lightpath_cpts and not self._summary_initialized:
+            self.lightpath_summary.debounce = self.lightpath_debounce
             for sig in self.lightpath_cpts:
                 self.lightpath_summary.add_signal_by_attr_name(sig)
 
@@ -1817,18 +2272,48 @@ class LightpathMixin(Device):
         """
         if (not use_cache) or (self._cached_state is None):
             self.log.debug('calculating new LightpathState')
-            kwargs = {sig.name.removeprefix(self.name + '_'): sig.get()
-                      for sig in self.lightpath_summary._signals}
+            kwargs = self._get_lightpath_kwargs(use_cache=False)
             self._cached_state = self.calc_lightpath_state(**kwargs)
 
         return self._cached_state
 
+    def _get_lightpath_kwarg_name(self, sig: Signal) -> str:
+        """Return the ``calc_lightpath_state`` keyword for a summary signal."""
+        return sig.name.removeprefix(self.name + '_')
+
+    def _get_lightpath_kwargs(self, use_cache: bool = True) -> dict[str, Any]:
+        """
+        Collect the ``calc_lightpath_state`` keyword arguments.
+
+        Parameters
+        ----------
+        use_cache : bool, optional
+            If True (default), use the values last seen by
+            ``lightpath_summary`` and only ``get`` the signals that have
+            not reported a value yet.  If False, ``get`` every signal.
+            Any values read here are stored back in the cache.
+        """
+        kwargs = {}
+        for sig, siginfo in self.lightpath_summary._signals.items():
+            value = siginfo.value if use_cache else None
+            if value is None:
+                value = sig.get()
+                siginfo.value = value
+            kwargs[self._get_lightpath_kwarg_name(sig)] = value
+        return kwargs
+
     def _calc_cache_lightpath_state(self, *args, **kwargs) -> None:
         """
         Calculate the lightpath state and cache it.
         Intended for use as a callback subscribed to lightpath_summary
+
+        Uses the values already cached by ``lightpath_summary`` rather than
+        re-reading every signal.
         """
-        self.get_lightpath_state(use_cache=False)
+        self.log.debug('calculating new LightpathState from cache')
+        self._cached_state = self.calc_lightpath_state(
+            **self._get_lightpath_kwargs()
+        )
 
     @property
     def md(self):
@@ -1911,23 +2396,16 @@ class LightpathInOutCptMixin(LightpathMixin):
 
     def _init_summary_signal(self):
         """ Change summary signal to only watch .state signals """
+        self.lightpath_summary.debounce = self.lightpath_debounce
         for sig in self.lightpath_cpts:
             self.lightpath_summary.add_signal_by_attr_name(sig + '.state')
 
         self.lightpath_summary.subscribe(self._calc_cache_lightpath_state)
 
-    def get_lightpath_state(self, use_cache: bool = True) -> LightpathState:
-        if (not use_cache) or (self._cached_state is None):
-            kwargs = {}
-            for sig in self.lightpath_summary._signals:
-                parent = sig.parent or sig.biological_parent
-                sig_name = parent.name.removeprefix(self.name + '_')
-                kwargs[sig_name] = sig.get()
-
-            state = self.calc_lightpath_state(**kwargs)
-            self._cached_state = state
-
-        return self._cached_state
+    def _get_lightpath_kwarg_name(self, sig: Signal) -> str:
+        """ Key on the InOut component rather than its .state signal """
+        parent = sig.parent or sig.biological_parent
+        return parent.name.removeprefix(self.name + '_')
 
     def calc_lightpath_state(self, **lightpath_kwargs):
         in_check = []
@@ -1,8 +1,13 @@
+import dataclasses
+import io
 import json
 import logging
 import os
+import threading
 import time
+from typing import Any, Optional
 
+import numpy as np
 from ophyd import Component as Cpt
 from ophyd import Device, EpicsSignal, EpicsSignalRO
 from ophyd import FormattedComponent as FCpt
@@ -12,6 +17,244 @@ from pcdsdevices.variety import set_metadata
 
 logger = logging.getLogger(__name__)
 
+# Processing steps recorded alongside saved spectra
+SPECTRUM_SETTINGS = ['sensitivity_cal', 'correct_prnu', 'correct_nonlinearity',
+                     'normalize_exposure', 'adjust_offset', 'subtract_dark',
+                     'remove_bad_pixels', 'remove_temp_bad_pixels']
+# File suffixes saved by QminiSpectrumWriter rather than as JSON
+BINARY_SPECTRUM_SUFFIXES = ('.npz', '.h5', '.hdf5')
+# File suffixes that QminiSpectrumWriter appends to in place
+RECORDING_SPECTRUM_SUFFIXES = ('.h5', '.hdf5')
+
+
+@dataclasses.dataclass
+class QminiSpectra:
+    """
+    Spectra loaded from a file by `load_spectra`.
+
+    Attributes
+    ----------
+    wavelength : np.ndarray
+        Wavelength of each pixel, in nm.
+    intensity : np.ndarray
+        Spectra of shape (shots, pixels), in arbitrary units.
+    timestamp : np.ndarray
+        Unix time of each shot.
+    metadata : dict
+        Exposure, averaging and processing settings of the spectrometer.
+    """
+    wavelength: np.ndarray
+    intensity: np.ndarray
+    timestamp: np.ndarray
+    metadata: dict[str, Any]
+
+
+class QminiSpectrumWriter:
+    """
+    Binary spectrum file that shots can be appended to.
+
+    The wavelengths and metadata are stored once, and each shot adds a row
+    to the intensity and timestamp datasets.  The format is picked by the
+    file suffix:
+
+    * ``.h5`` or ``.hdf5``: chunked, resizable HDF5 datasets, appended to
+      in place.  Requires the optional ``h5py`` dependency, installed
+      with ``pip install pcdsdevices[hdf5]``.
+    * ``.npz``: shots are held in memory and the file is rewritten on
+      `flush` and `close`.  Only suited to a few shots, use HDF5 for
+      long recordings.
+
+    Parameters
+    ----------
+    filename : str
+        File to create.
+    wavelength : np.ndarray
+        Wavelength of each pixel, in nm.
+    metadata : dict, optional
+        JSON-serializable spectrometer settings.
+    chunk_shots : int, optional
+        Number of shots per HDF5 chunk.
+    """
+    def __init__(
+        self,
+        filename: str,
+        wavelength: np.ndarray,
+        metadata: Optional[dict[str, Any]] = None,
+        chunk_shots: int = 256,
+    ):
+        self.filename = filename
+        self.wavelength = np.asarray(wavelength, dtype=np.float64)
+        self.metadata = dict(metadata or {})
+        self.chunk_shots = chunk_shots
+        self.shots = 0
+        self._lock = threading.Lock()
+        self._suffix = os.path.splitext(filename)[1].lower()
+        if self._suffix not in BINARY_SPECTRUM_SUFFIXES:
+            raise ValueError(
+                f'Unsupported spectrum file type {self._suffix!r}, expected '
+                f'one of {BINARY_SPECTRUM_SUFFIXES}'
+            )
+        self._h5 = None
+        self._intensity = []
+        self._timestamp = []
+        if self._suffix != '.npz':
+            self._open_hdf5()
+
+    def _open_hdf5(self):
+        try:
+            # h5py is an optional dependency, see the hdf5 extra
+            import h5py
+        except ImportError:
+            raise RuntimeError('h5py is required to save spectra as HDF5, '
+                               'install pcdsdevices[hdf5].') from None
+        self._h5 = h5py.File(self.filename, 'w')
+        self._h5.attrs['metadata'] = json.dumps(self.metadata)
+        self._h5.create_dataset('wavelength', data=self.wavelength)
+        self._h5.create_dataset(
+            'timestamp', shape=(0,), maxshape=(None,), dtype=np.float64,
+            chunks=(self.chunk_shots,),
+        )
+
+    def append(self, intensity: np.ndarray,
+               timestamp: Optional[float] = None) -> None:
+        """
+        Add one shot to the file.
+
+        Parameters
+        ----------
+        intensity : np.ndarray
+            The spectrum, one value per wavelength.
+        timestamp : float, optional
+            Unix time of the shot, defaults to now.
+        """
+        intensity = np.asarray(intensity).reshape(-1)
+        if intensity.size != self.wavelength.size:
+            raise ValueError(
+                f'Spectrum has {intensity.size} points, expected '
+                f'{self.wavelength.size}'
+            )
+        if timestamp is None:
+            timestamp = time.time()
+        with self._lock:
+            if self._h5 is None:
+                self._intensity.append(intensity.copy())
+                self._timestamp.append(timestamp)
+            else:
+                self._append_hdf5(intensity, timestamp)
+            self.shots += 1
+
+    def _append_hdf5(self, intensity, timestamp):
+        if 'intensity' not in self._h5:
+            # The dtype is only known from the first spectrum
+            self._h5.create_dataset(
+                'intensity', shape=(0, intensity.size),
+                maxshape=(None, intensity.size), dtype=intensity.dtype,
+                chunks=(self.chunk_shots, intensity.size),
+            )
+        data = self._h5['intensity']
+        timestamps = self._h5['timestamp']
+        if self.shots >= data.shape[0]:
+            # Grow by a whole chunk at a time, trimmed on close
+            data.resize(self.shots + self.chunk_shots, axis=0)
+            timestamps.resize(self.shots + self.chunk_shots, axis=0)
+        data[self.shots] = intensity
+        timestamps[self.shots] = timestamp
+
+    def flush(self) -> None:
+        """Write everything appended so far to disk."""
+        with self._lock:
+            if self._h5 is not None:
+                self._h5.flush()
+                return
+            if self._intensity:
+                intensity = np.stack(self._intensity)
+            else:
+                intensity = np.empty((0, self.wavelength.size))
+            buffer = io.BytesIO()
+            np.savez(
+                buffer,
+                wavelength=self.wavelength,
+                intensity=intensity,
+                timestamp=np.asarray(self._timestamp, dtype=np.float64),
+                metadata=np.array(json.dumps(self.metadata)),
+            )
+            with open(self.filename, 'wb') as fd:
+                fd.write(buffer.getbuffer())
+
+    def close(self) -> None:
+        """Write out and close the file."""
+        if self._h5 is None:
+            self.flush()
+            return
+        with self._lock:
+            if self._h5:
+                if 'intensity' in self._h5:
+                    self._h5['intensity'].resize(self.shots, axis=0)
+                self._h5['timestamp'].resize(self.shots, axis=0)
+                self._h5.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load_spectra(filename: str) -> QminiSpectra:
+    """
+    Load spectra saved by a Qmini spectrometer.
+
+    Reads the binary files of `QminiSpectrumWriter` as well as the
+    single-shot JSON text files saved by earlier versions.
+
+    Parameters
+    ----------
+    filename : str
+        The file to load.
+
+    Returns
+    -------
+    spectra : QminiSpectra
+        The wavelengths, spectra, timestamps and metadata.
+    """
+    suffix = os.path.splitext(filename)[1].lower()
+    if suffix == '.npz':
+        with np.load(filename) as npz:
+            return QminiSpectra(
+                wavelength=npz['wavelength'],
+                intensity=npz['intensity'],
+                timestamp=npz['timestamp'],
+                metadata=json.loads(str(npz['metadata'])),
+            )
+    if suffix in BINARY_SPECTRUM_SUFFIXES:
+        import h5py
+        with h5py.File(filename, 'r') as h5:
+            n_pixels = h5['wavelength'].shape[0]
+            if 'intensity' in h5:
+                intensity = h5['intensity'][()]
+            else:
+                intensity = np.empty((0, n_pixels))
+            return QminiSpectra(
+                wavelength=h5['wavelength'][()],
+                intensity=intensity,
+                timestamp=h5['timestamp'][()],
+                metadata=json.loads(h5.attrs['metadata']),
+            )
+
+    with open(filename, 'r') as fd:
+        data = json.load(fd)
+    timestamp = time.mktime(
+        time.strptime(data.pop('timestamp'), "%Y-%m-%d %H:%M:%S")
+    )
+    wavelength = np.asarray(data.pop('wavelength (nm)'), dtype=np.float64)
+    intensity = np.asarray(data.pop('intensity (a.u.)'), dtype=np.float64)
+    return QminiSpectra(
+        wavelength=wavelength,
+        intensity=intensity.reshape(1, -1),
+        timestamp=np.array([timestamp]),
+        metadata=data,
+    )
+
 
 class QminiSpectrometer(Device):
     """
@@ -88,9 +331,32 @@ class QminiSpectrometer(Device):
     fit_chisq = Cpt(EpicsSignalRO, ':CHISQ', kind='config')
 
     # Save spectra functions
-    def save_data(self, file_dest: str = ''):
+    def spectrum_metadata(self) -> dict[str, Any]:
+        """
+        The spectrometer settings that are saved alongside spectra.
         """
-        Save the wavelength and spectrum PVs to a text file
+        return {'exposure (us)': self.exposure.get(),
+                'averages': self.exposures_to_average.get(),
+                # Lets do some sneaky conversion to bool from int
+                'settings': {f"{sig}": bool(getattr(self, sig).get())
+                             for sig in SPECTRUM_SETTINGS},
+                }
+
+    def save_data(self, file_dest: str = '', indent: Optional[int] = None):
+        """
+        Save the wavelength and spectrum PVs to a file
+
+        Files ending in ``.npz``, ``.h5`` or ``.hdf5`` are written by
+        `QminiSpectrumWriter`, anything else is written as JSON text.  Both
+        can be read back with `load_spectra`.
+
+        Parameters
+        ----------
+        file_dest : str, optional
+            The file to save to.  Defaults to the ``file_dest`` signal, or
+            else a timestamped ``.txt`` file in the current directory.
+        indent : int, optional
+            Indentation of JSON text files.
         """
         # Let's check to see if we set this in a non-gui context
         if not file_dest.strip():
@@ -105,22 +371,72 @@ class QminiSpectrometer(Device):
         else:
             _file = file_dest
         self.log.info('Saving spectrum to disk...')
+        if _file.lower().endswith(BINARY_SPECTRUM_SUFFIXES):
+            with QminiSpectrumWriter(_file, self.wavelengths.get(),
+                                     self.spectrum_metadata()) as writer:
+                writer.append(self.spectrum.get())
+            return
         # Let's format to JSON for the science folk with sinful f-string mangling
-        _settings = ['sensitivity_cal', 'correct_prnu', 'correct_nonlinearity',
-                     'normalize_exposure', 'adjust_offset', 'subtract_dark',
-                     'remove_bad_pixels', 'remove_temp_bad_pixels']
         _data = {'timestamp': time.strftime("%Y-%m-%d %H:%M:%S"),
-                 'exposure (us)': self.exposure.get(),
-                 'averages': self.exposures_to_average.get(),
-                 # Lets do some sneaky conversion to bool from int
-                 'settings': {f"{sig}": bool(getattr(self, sig).get())
-                              for sig in _settings},
+                 **self.spectrum_metadata(),
                  'wavelength (nm)': [str(x) for x in self.wavelengths.get()],
                  'intensity (a.u.)': [str(y) for y in self.spectrum.get()]
                  }
         # and let's assume you have permission to save your file where you want to
         with open(_file, 'w') as _f:
-            _f.write(json.dumps(_data))
+            _f.write(json.dumps(_data, indent=indent))
+
+    def start_recording(self, file_dest: str) -> QminiSpectrumWriter:
+        """
+        Append every new spectrum to a binary file until `stop_recording`.
+
+        Parameters
+        ----------
+        file_dest : str
+            A ``.h5`` or ``.hdf5`` file to record to.  Requires the
+            optional ``h5py`` dependency.
+
+        Returns
+        -------
+        writer : QminiSpectrumWriter
+            The file being recorded to.
+
+        Raises
+        ------
+        ValueError
+            If the file type can't be appended to in place.
+        """
+        suffix = os.path.splitext(file_dest)[1].lower()
+        if suffix not in RECORDING_SPECTRUM_SUFFIXES:
+            raise ValueError(
+                f'Cannot record spectra to a {suffix!r} file, expected one '
+                f'of {RECORDING_SPECTRUM_SUFFIXES}'
+            )
+        self.stop_recording()
+        writer = QminiSpectrumWriter(file_dest, self.wavelengths.get(),
+                                     self.spectrum_metadata())
+        self._recording = writer
+        self._recording_cid = self.spectrum.subscribe(self._record_spectrum,
+                                                      run=False)
+        return writer
+
+    def stop_recording(self) -> None:
+        """Stop recording spectra and close the file."""
+        writer = getattr(self, '_recording', None)
+        if writer is None:
+            return
+        self.spectrum.unsubscribe(self._recording_cid)
+        self._recording = None
+        writer.close()
+
+    def _record_spectrum(self, *args, value, timestamp=None, **kwargs):
+        writer = self._recording
+        if writer is None:
+            return
+        try:
+            writer.append(value, timestamp=timestamp)
+        except ValueError as ex:
+            self.log.warning('Skipping spectrum: %s', ex)
 
     save_spectrum = Cpt(AttributeSignal, attr='_save_spectrum', kind='omitted')
     file_dest = Cpt(Signal, value='', kind='omitted')
@@ -81,6 +81,52 @@ class Prefocus(CombinedInOutRecordPositioner, LightpathInOutMixin):
         self.y = self.y_motor
 
 
+class AlignmentLine:
+    """
+    The line through the two alignment points of a `LensStackBase`.
+
+    Parameters
+    ----------
+    one : tuple of float
+        The (x, y, z) coordinates of ``align_position_one``.
+
+    two : tuple of float
+        The (x, y, z) coordinates of ``align_position_two``.
+    """
+
+    def __init__(self, one, two):
+        x1, y1, z1 = one
+        x2, y2, z2 = two
+        self.x0 = x1
+        self.y0 = y1
+        self.z0 = z1
+        self.x_slope = (x1 - x2) / (z1 - z2)
+        self.y_slope = (y1 - y2) / (z1 - z2)
+
+    def __call__(self, z):
+        """
+        Get the x and y positions on the line for one or more z positions.
+
+        Parameters
+        ----------
+        z : float or array_like
+
+        Returns
+        -------
+        x, y : float or np.ndarray
+            Arrays if ``z`` was an array, floats otherwise.
+        """
+        if not np.isscalar(z):
+            z = np.asarray(z, dtype=float)
+        dz = z - self.z0
+        return self.x_slope * dz + self.x0, self.y_slope * dz + self.y0
+
+    def __repr__(self):
+        return (f'{type(self).__name__}(x0={self.x0}, y0={self.y0}, '
+                f'z0={self.z0}, x_slope={self.x_slope}, '
+                f'y_slope={self.y_slope})')
+
+
 class LensStackBase(BaseInterface, PseudoPositioner):
     """
     Class for Be lens macros and safe operations.
@@ -131,9 +177,13 @@ class LensStackBase(BaseInterface, PseudoPositioner):
     beam_size = Cpt(PseudoSingleInterface)
 
     tab_whitelist = ['tweak', 'align', 'calib_z', 'beam_size', 'create_lens',
-                     'read_lens']
+                     'read_lens', 'forward_many']
     tab_component_names = True
 
+    # Minimum number of seconds between checks of the alignment presets
+    # for changes made outside of this session
+    alignment_check_interval = 1.0
+
     def __init__(self, x_prefix, y_prefix, z_prefix, lens_set,
                  z_offset, z_dir, E, att_obj, lcls_obj=None,
                  mono_obj=None, *args, **kwargs):
@@ -150,6 +200,9 @@ class LensStackBase(BaseInterface, PseudoPositioner):
         if lens_set is not None:
             lens_set = list(lens_set)
         self.lens_set = lens_set
+        self._alignment = None
+        self._alignment_caches = None
+        self._alignment_checked = None
 
         super().__init__(x_prefix, *args, **kwargs)
 
@@ -190,30 +243,105 @@ class LensStackBase(BaseInterface, PseudoPositioner):
             If pseudo motor is not setup for use.
         """
         if not np.isclose(pseudo_pos.beam_size, self.beam_size.position):
-            beam_size = pseudo_pos.beam_size
-            dist = calcs.calc_distance_for_size(beam_size, self.lens_set,
-                                                self._E)[0]
-            z_pos = (dist - self.z_offset) * self.z_dir * 1000
+            z_pos = self._z_for_beam_size(pseudo_pos.beam_size)
         else:
             z_pos = pseudo_pos.calib_z
         try:
-            pos = [self.x.presets.positions.align_position_one.pos,
-                   self.y.presets.positions.align_position_one.pos,
-                   self.z.presets.positions.align_position_one.pos,
-                   self.x.presets.positions.align_position_two.pos,
-                   self.y.presets.positions.align_position_two.pos,
-                   self.z.presets.positions.align_position_two.pos]
-            x_pos = ((pos[0]-pos[3])/(pos[2]-pos[5]))*(z_pos-pos[2])+pos[0]
-            y_pos = ((pos[1]-pos[4])/(pos[2]-pos[5]))*(z_pos-pos[2])+pos[1]
+            x_pos, y_pos = self.alignment_line()(z_pos)
             return self.RealPosition(x=x_pos, y=y_pos, z=z_pos)
         except AttributeError:
-            self.log.debug('', exc_info=True)
-            self.log.error("Please setup the pseudo motor for use by using "
-                           "the align() method. If you have already done that,"
-                           " check if the preset pathways have been setup.")
+            self._log_alignment_error()
             return self.RealPosition(x=self.x.position, y=self.y.position,
                                      z=z_pos)
 
+    def forward_many(self, beam_sizes):
+        """
+        Calculate the real positions for many beam sizes at once.
+
+        This is the vectorized version of `forward`, useful for planning
+        focus scans without moving anything.
+
+        Parameters
+        ----------
+        beam_sizes : array_like
+            Beam sizes (fwhm) in meters.
+
+        Returns
+        -------
+        x, y, z : np.ndarray
+            The real motor positions for each beam size. If the pseudo motor
+            has not been aligned, x and y are filled with the current
+            motor positions.
+        """
+        beam_sizes = np.atleast_1d(np.asarray(beam_sizes, dtype=float))
+        z_pos = self._z_for_beam_size(beam_sizes)
+        try:
+            x_pos, y_pos = self.alignment_line()(z_pos)
+        except AttributeError:
+            self._log_alignment_error()
+            x_pos = np.full_like(z_pos, self.x.position)
+            y_pos = np.full_like(z_pos, self.y.position)
+        return x_pos, y_pos, z_pos
+
+    def _z_for_beam_size(self, beam_size):
+        """Get the z position(s) that give one or more beam sizes."""
+        if np.isscalar(beam_size):
+            dist = calcs.calc_distance_for_size(beam_size, self.lens_set,
+                                                self._E)[0]
+        else:
+            # Every part of the distance calculation broadcasts except for
+            # the pair of solutions, so take the first solution by hand.
+            dist = calcs.calc_distance_for_size(
+                np.asarray(beam_size)[:, np.newaxis], self.lens_set, self._E,
+            )[:, 0]
+        return (dist - self.z_offset) * self.z_dir * 1000
+
+    def alignment_line(self):
+        """
+        Get the line through the alignment presets saved by `align`.
+
+        The line is cached and only rebuilt when the presets of any of the
+        motors change. Changes made from other sessions are checked for at
+        most once every ``alignment_check_interval`` seconds.
+
+        Returns
+        -------
+        line : AlignmentLine
+
+        Raises
+        ------
+        AttributeError
+            If the alignment presets do not exist.
+        """
+        motors = (self.x, self.y, self.z)
+        now = time.monotonic()
+        if (
+            self._alignment_checked is None
+            or now - self._alignment_checked >= self.alignment_check_interval
+        ):
+            for motor in motors:
+                if motor.presets.sync_needed():
+                    motor.presets.sync()
+            self._alignment_checked = now
+        # Presets swaps in a new cache whenever it syncs
+        caches = tuple(motor.presets._cache for motor in motors)
+        if self._alignment is None or any(
+            new is not old for new, old in zip(caches, self._alignment_caches)
+        ):
+            positions = [motor.presets.positions for motor in motors]
+            self._alignment = AlignmentLine(
+                [pos.align_position_one.pos for pos in positions],
+                [pos.align_position_two.pos for pos in positions],
+            )
+            self._alignment_caches = caches
+        return self._alignment
+
+    def _log_alignment_error(self):
+        self.log.debug('', exc_info=True)
+        self.log.error("Please setup the pseudo motor for use by using "
+                       "the align() method. If you have already done that,"
+                       " check if the preset pathways have been setup.")
+
     @real_position_argument
     def inverse(self, real_pos):
         """
@@ -277,6 +405,8 @@ class LensStackBase(BaseInterface, PseudoPositioner):
                            'using setup_preset_paths from '
                            'pcdsdevices.interface to keep the position files.')
             return
+        finally:
+            self._alignment = None
         if z_position is not None:
             self.calib_z.move(z_position)
 
@@ -36,6 +36,117 @@ class MirrorLogicError(Exception):
     """ An error in mirror pointing logic """
 
 
+class _RangeTable:
+    """
+    Precompiled lookup of which (min, max) ranges contain a value.
+
+    Every range bound is sorted once into a single array of edges.  Values
+    strictly between two neighboring edges all fall into the same set of
+    ranges, as do values sitting exactly on an edge, so range membership is
+    tabulated for each interval and each edge up front.  A lookup is then a
+    single ``searchsorted`` followed by a table gather, and works the same
+    for scalars and arrays of any shape.
+
+    Bounds are exclusive, ranges may overlap, and NaN is in no range.
+    Malformed ranges are accepted here, but raise `MirrorLogicError` on
+    lookup, matching the behavior of evaluating them on the fly.
+
+    Parameters
+    ----------
+    ranges : list of [min, max]
+        The ranges to compile.
+    """
+    def __init__(self, ranges: list[list[numeric]]):
+        self.ranges = ranges
+        self.error = None
+        try:
+            shape = np.shape(ranges)
+        except ValueError:
+            # ragged nested lists
+            shape = 'ragged'
+        if shape == 'ragged' or len(shape) < 2 or shape[1] < 2:
+            self.error = (
+                "Provided ranges must be a list of ranges (min, max).  "
+                f"Received an array of shape: {shape}"
+            )
+            return
+
+        bounds = np.asarray(ranges, dtype=float)
+        lows = bounds[:, 0]
+        highs = bounds[:, 1]
+        self.edges = np.unique(bounds[:, :2])
+        self.edges = self.edges[~np.isnan(self.edges)]
+        # Bounds of each open interval between edges, including the two
+        # unbounded intervals on either end
+        below = np.concatenate([[-np.inf], self.edges])[:, np.newaxis]
+        above = np.concatenate([self.edges, [np.inf]])[:, np.newaxis]
+        # No range bound falls inside an interval, so an interval is either
+        # entirely within a range or entirely outside of it
+        self._interval_members = (lows <= below) & (above <= highs)
+        edges = self.edges[:, np.newaxis]
+        self._edge_members = (lows < edges) & (edges < highs)
+
+    def __len__(self) -> int:
+        return len(self.ranges)
+
+    def match(self, values: Union[numeric, np.ndarray]) -> np.ndarray:
+        """
+        Report which ranges contain each value.
+
+        Parameters
+        ----------
+        values : numeric or np.ndarray
+            Value or array of values to look up.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array of shape ``np.shape(values) + (len(ranges),)``.
+
+        Raises
+        ------
+        MirrorLogicError
+            If the compiled ranges are malformed.
+        """
+        if self.error is not None:
+            raise MirrorLogicError(self.error)
+        values = np.asarray(values, dtype=float)
+        n_edges = len(self.edges)
+        if n_edges == 0:
+            return np.zeros(values.shape + (len(self.ranges),), dtype=bool)
+        idx = np.searchsorted(self.edges, values, side='left')
+        nearest = np.minimum(idx, n_edges - 1)
+        on_edge = self.edges[nearest] == values
+        members = np.where(
+            on_edge[..., np.newaxis],
+            self._edge_members[nearest],
+            self._interval_members[idx],
+        )
+        members &= ~np.isnan(values)[..., np.newaxis]
+        return members
+
+    def index(self, values: Union[numeric, np.ndarray]) -> np.ndarray:
+        """
+        Find the single range containing each value.
+
+        Parameters
+        ----------
+        values : numeric or np.ndarray
+            Value or array of values to look up.
+
+        Returns
+        -------
+        np.ndarray
+            Integer array shaped like ``values``, holding the index of the
+            matching range, -1 where no range matches, or -2 where more than
+            one range matches.
+        """
+        members = self.match(values)
+        count = members.sum(axis=-1)
+        first = np.argmax(members, axis=-1) if members.shape[-1] else count
+        return np.where(count == 1, first, np.where(count == 0, -1, -2))
+
+
 class OMMotor(FltMvInterface, PVPositioner):
     """Base class for each motor in the LCLS offset mirror system."""
     __doc__ += basic_positioner_init
@@ -434,6 +545,38 @@ class XOffsetMirror(BaseInterface, GroupDevice, LightpathMixin):
         self.pitch_ranges = pitch_ranges
         super().__init__(*args, **kwargs)
 
+    # The range tables are recompiled whenever the ranges are replaced, so
+    # that each lightpath update is only a lookup
+    @property
+    def x_ranges(self) -> list[list[numeric]]:
+        """Insertion ranges, [[min_x_out, max_x_out], [min_x_in, max_x_in]]"""
+        return self._x_ranges
+
+    @x_ranges.setter
+    def x_ranges(self, ranges: list[list[numeric]]) -> None:
+        self._x_ranges = ranges
+        self._x_table = _RangeTable(ranges)
+
+    @property
+    def y_ranges(self) -> list[list[numeric]]:
+        """Coating ranges, one [min_y, max_y] per coating"""
+        return self._y_ranges
+
+    @y_ranges.setter
+    def y_ranges(self, ranges: list[list[numeric]]) -> None:
+        self._y_ranges = ranges
+        self._y_table = _RangeTable(ranges)
+
+    @property
+    def pitch_ranges(self) -> list[list[list[numeric]]]:
+        """Output branch ranges, one list of [min_p, max_p] per coating"""
+        return self._pitch_ranges
+
+    @pitch_ranges.setter
+    def pitch_ranges(self, ranges: list[list[list[numeric]]]) -> None:
+        self._pitch_ranges = ranges
+        self._pitch_tables = [_RangeTable(coating) for coating in ranges]
+
     def calc_lightpath_state(
         self,
         x_up: float,
@@ -513,8 +656,9 @@ class XOffsetMirror(BaseInterface, GroupDevice, LightpathMixin):
 
         Parameters
         ----------
-        ranges : List[List[numeric]]
+        ranges : List[List[numeric]] or _RangeTable
             A list of ranges.  Each range has a max and min value (exclusive)
+            Precompiled range tables are used as-is.
         value : numeric
             Value to compare to each range
 
@@ -524,13 +668,9 @@ class XOffsetMirror(BaseInterface, GroupDevice, LightpathMixin):
             A list of booleans, reporting if the value is in each range
             in ``ranges``
         """
-        if len(np.shape(ranges)) < 2:
-            raise MirrorLogicError(
-                "Provided ranges must be a list of ranges (min, max).  "
-                f"Received an array of shape: {np.shape(ranges)}"
-            )
-
-        return [limit[0] < value < limit[1] for limit in ranges]
+        if not isinstance(ranges, _RangeTable):
+            ranges = _RangeTable(ranges)
+        return ranges.match(value).tolist()
 
     def _get_insertion_state(self, x: float) -> tuple[bool, bool]:
         """
@@ -554,18 +694,23 @@ class XOffsetMirror(BaseInterface, GroupDevice, LightpathMixin):
         is_out, is_in : Tuple[bool, bool]
             tuple of booleans describing the inserted and removed status
         """
-        if self.x_ranges == []:
+        if len(self._x_table) == 0:
             # default case for always-in mirrors
             return False, True
 
-        if np.shape(self.x_ranges) != (2, 2):
+        self._check_insertion_ranges(self.x_ranges)
+
+        ins_bools = self._find_matching_range_indices(self._x_table, x)
+        return ins_bools[0], ins_bools[1]  # out, in
+
+    @staticmethod
+    def _check_insertion_ranges(ranges: list[list[numeric]]) -> None:
+        """Raise MirrorLogicError if insertion ranges are not (out, in)"""
+        if np.shape(ranges) != (2, 2):
             # improper ranges for insertion, fail
             raise MirrorLogicError(
                 'Provided x-ranges are the malformed. '
-                f'got: {np.shape(self.x_ranges)}, expected (2,2)')
-
-        ins_bools = self._find_matching_range_indices(self.x_ranges, x)
-        return ins_bools[0], ins_bools[1]  # out, in
+                f'got: {np.shape(ranges)}, expected (2,2)')
 
     def _get_coating_index(self, y: float) -> int:
         """
@@ -586,21 +731,20 @@ class XOffsetMirror(BaseInterface, GroupDevice, LightpathMixin):
         index : int
             The coating state
         """
-        if self.y_ranges == []:
+        if len(self._y_table) == 0:
             return 1
 
-        y_idxs = self._find_matching_range_indices(self.y_ranges, y)
-        valid_y_idx = np.where(y_idxs)[0]
-        if len(valid_y_idx) > 1:
+        valid_y_idx = int(self._y_table.index(y))
+        if valid_y_idx == -2:
             # should only see one valid y-range, coating unknown
             raise MirrorLogicError('only one y-range should be valid')
-        elif len(valid_y_idx) == 0:
+        elif valid_y_idx == -1:
             # coating state is unknown
             raise MirrorLogicError('Coating state is unknown, mirror '
                                    'is not aligned given provided '
                                    'y-ranges')
 
-        return valid_y_idx[0] + 1
+        return valid_y_idx + 1
 
     def _get_output_branch(self, coating_idx: int, pitch: float) -> str:
         """
@@ -627,24 +771,178 @@ class XOffsetMirror(BaseInterface, GroupDevice, LightpathMixin):
         output_branch : str
             the name of the current beam destination
         """
-        if self.pitch_ranges == []:
+        if len(self._pitch_tables) == 0:
             return self.output_branches[0]
 
         # use coating to pick proper pitch ranges
         # 0 state is unknown, 1 is the first coating.  decrement to get index
-        pitch_limit_list = self.pitch_ranges[coating_idx]
+        pitch_table = self._pitch_tables[coating_idx]
 
-        # find indices ranges where pitch is valid
-        pitch_idxs = self._find_matching_range_indices(pitch_limit_list, pitch)
-        valid_pitch_idx = np.where(pitch_idxs)[0]
+        # find the index of the range where pitch is valid
+        valid_pitch_idx = int(pitch_table.index(pitch))
 
         # pitch should only be within one valid range
-        if len(valid_pitch_idx) != 1:
+        if valid_pitch_idx < 0:
             raise MirrorLogicError('only one pitch-range should be valid')
 
         # index of valid range = index of output_branch + 1
         # assuming first output_branch is through line
-        return self.output_branches[valid_pitch_idx[0] + 1]
+        return self.output_branches[valid_pitch_idx + 1]
+
+    def calc_lightpath_arrays(
+        self,
+        x_info: np.ndarray,
+        y_info: np.ndarray,
+        pitch_info: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evaluate the lightpath decision tree for arrays of positions.
+
+        This walks the same decision tree as ``calc_lightpath_state``, but
+        for every element of the (broadcast) inputs at once, which makes it
+        cheap to precompute the beam destination over a scan of positions.
+        The arguments take the same place as the arguments to
+        ``calc_lightpath_state``.
+
+        Parameters
+        ----------
+        x_info : np.ndarray
+            x-positions or insertion states
+        y_info : np.ndarray
+            y-positions or coating states
+        pitch_info : np.ndarray
+            pitch positions
+
+        Returns
+        -------
+        inserted, removed, branch : Tuple[np.ndarray, np.ndarray, np.ndarray]
+            arrays of the broadcast input shape.  ``branch`` holds the index
+            of the output branch in ``output_branches``, or -1 where the
+            state cannot be determined.
+        """
+        x_info, y_info, pitch_info = np.broadcast_arrays(
+            x_info, y_info, pitch_info
+        )
+        try:
+            x_out, x_in = self._get_insertion_arrays(x_info)
+            coating_idx = self._get_coating_index_array(y_info)
+            branch = self._get_output_branch_array(coating_idx, pitch_info)
+        except MirrorLogicError as ex:
+            # a state for if calculation cannot proceed
+            self.log.debug(ex)
+            unknown = np.zeros(x_info.shape, dtype=bool)
+            return unknown, unknown.copy(), np.full(x_info.shape, -1)
+
+        # if removed, beam goes straight through
+        branch = np.where(x_out, 0, branch)
+        known = x_out | (branch >= 0)
+        return x_in & known, x_out, branch
+
+    def calc_lightpath_states(self, *args) -> list[LightpathState]:
+        """
+        Calculate a LightpathState for each element of array arguments.
+
+        Takes the same arguments as ``calc_lightpath_state``, as scalars or
+        arrays, and returns the states of the flattened broadcast inputs.
+        """
+        inserted, removed, branch = self.calc_lightpath_arrays(*args)
+        states = []
+        for ins, rem, idx in zip(inserted.ravel().tolist(),
+                                 removed.ravel().tolist(),
+                                 branch.ravel().tolist()):
+            if idx < 0:
+                states.append(LightpathState(
+                    inserted=False,
+                    removed=False,
+                    output={self.output_branches[0]: 0}
+                ))
+            else:
+                states.append(LightpathState(
+                    inserted=ins,
+                    removed=rem,
+                    output={self.output_branches[idx]: 1}
+                ))
+        return states
+
+    def destination_map(self, *args) -> np.ndarray:
+        """
+        Map arrays of positions to the output branch the beam is sent to.
+
+        Takes the same arguments as ``calc_lightpath_state``, as scalars or
+        arrays.
+
+        Returns
+        -------
+        np.ndarray
+            Object array of the broadcast input shape, holding the name of
+            the output branch, or None where the state cannot be determined.
+        """
+        _, _, branch = self.calc_lightpath_arrays(*args)
+        names = np.array(list(self.output_branches) + [None], dtype=object)
+        # -1 (unknown) picks the trailing None
+        return names[branch]
+
+    def _get_insertion_arrays(
+        self,
+        x: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Array version of ``_get_insertion_state``.
+
+        Returns
+        -------
+        is_out, is_in : Tuple[np.ndarray, np.ndarray]
+            boolean arrays describing the removed and inserted status
+        """
+        if len(self._x_table) == 0:
+            return np.zeros(x.shape, dtype=bool), np.ones(x.shape, dtype=bool)
+
+        self._check_insertion_ranges(self.x_ranges)
+        ins_bools = self._x_table.match(x)
+        return ins_bools[..., 0], ins_bools[..., 1]
+
+    def _get_coating_index_array(self, y: np.ndarray) -> np.ndarray:
+        """
+        Array version of ``_get_coating_index``.
+
+        Returns
+        -------
+        np.ndarray
+            The coating states, -1 where the coating is unknown
+        """
+        if len(self._y_table) == 0:
+            return np.ones(y.shape, dtype=int)
+
+        valid_y_idx = self._y_table.index(y)
+        return np.where(valid_y_idx >= 0, valid_y_idx + 1, -1)
+
+    def _get_output_branch_array(
+        self,
+        coating_idx: np.ndarray,
+        pitch: np.ndarray
+    ) -> np.ndarray:
+        """
+        Array version of ``_get_output_branch``.
+
+        Returns
+        -------
+        np.ndarray
+            index of the output branch in ``output_branches``, -1 where the
+            coating or output branch is unknown
+        """
+        if len(self._pitch_tables) == 0:
+            return np.where(coating_idx >= 0, 0, -1)
+
+        branch = np.full(coating_idx.shape, -1)
+        for idx, pitch_table in enumerate(self._pitch_tables):
+            in_coating = coating_idx == idx
+            if not in_coating.any():
+                continue
+            valid_pitch_idx = pitch_table.index(pitch[in_coating])
+            branch[in_coating] = np.where(
+                valid_pitch_idx >= 0, valid_pitch_idx + 1, -1
+            )
+        return branch
 
     # Tab config: show components
     tab_component_names = True
@@ -886,7 +1184,7 @@ class XOffsetMirrorBend(XOffsetMirror):
                     'Provided x-ranges are the malformed. '
                     f'got: {np.shape(self.x_ranges)}, expected (2,2)')
 
-            x_out, x_in = self._find_matching_range_indices(self.y_ranges,
+            x_out, x_in = self._find_matching_range_indices(self._y_table,
                                                             y_up)
 
             if x_in and not x_out:
@@ -909,6 +1207,32 @@ class XOffsetMirrorBend(XOffsetMirror):
                 output={self.output_branches[0]: 0}
             )
 
+    def calc_lightpath_arrays(
+        self,
+        x_up: np.ndarray,
+        y_up: np.ndarray,
+        pitch: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Array version of ``calc_lightpath_state``, where insertion depends
+        only on the y-range.
+        """
+        x_up, y_up, pitch = np.broadcast_arrays(x_up, y_up, pitch)
+        try:
+            if np.shape(self.y_ranges) != (2, 2):
+                raise MirrorLogicError(
+                    'Provided y-ranges are the malformed. '
+                    f'got: {np.shape(self.y_ranges)}, expected (2,2)')
+            ins_bools = self._y_table.match(y_up)
+        except MirrorLogicError as ex:
+            self.log.debug(ex)
+            unknown = np.zeros(y_up.shape, dtype=bool)
+            return unknown, unknown.copy(), np.full(y_up.shape, -1)
+
+        x_out, x_in = ins_bools[..., 0], ins_bools[..., 1]
+        branch = np.where(x_in & ~x_out, 1, 0)
+        return x_in, x_out, branch
+
 
 # Maintain backward compatibility
 XOffsetMirror2 = XOffsetMirrorBend
@@ -976,6 +1300,16 @@ class XOffsetMirrorSwitch(XOffsetMirror):
             inserted=True, removed=False, output={self.output_branches[0]: 1}
         )
 
+    def calc_lightpath_arrays(
+        self,
+        x_up: np.ndarray,
+        pitch: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Array version of ``calc_lightpath_state``, always inserted."""
+        shape = np.broadcast(x_up, pitch).shape
+        return (np.ones(shape, dtype=bool), np.zeros(shape, dtype=bool),
+                np.zeros(shape, dtype=int))
+
 
 class KBOMirror(BaseInterface, GroupDevice, LightpathMixin):
     """
@@ -1446,6 +1780,11 @@ class XOffsetMirrorState(XOffsetMirror):
             raise MirrorLogicError('coating state not valid or unknown')
         return y - 1
 
+    def _get_coating_index_array(self, y: np.ndarray) -> np.ndarray:
+        """Array version of ``_get_coating_index``, -1 where unknown"""
+        y = np.asarray(y, dtype=int)
+        return np.where(y >= 1, y - 1, -1)
+
     def calc_lightpath_state(
         self,
         x_up: float,
@@ -1583,6 +1922,27 @@ class XOffsetMirrorXYState(XOffsetMirrorState):
 
         return x_out, x_in
 
+    def _get_insertion_arrays(
+        self,
+        insertion_state: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Array version of ``_get_insertion_state``.  Each distinct state is
+        checked once.  If the insertion state is not initialized, every
+        element is reported as both inserted and removed.
+        """
+        if not self.insertion._state_initialized:
+            both = np.ones(np.shape(insertion_state), dtype=bool)
+            return both, both.copy()
+
+        states, inverse = np.unique(insertion_state, return_inverse=True)
+        x_in = np.array([self.insertion.check_inserted(state)
+                         for state in states.tolist()], dtype=bool)
+        x_out = np.array([self.insertion.check_removed(state)
+                          for state in states.tolist()], dtype=bool)
+        inverse = inverse.reshape(np.shape(insertion_state))
+        return x_out[inverse], x_in[inverse]
+
     def calc_lightpath_state(
         self,
         insertion_state: int,
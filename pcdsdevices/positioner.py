@@ -4,10 +4,11 @@ import time
 import numpy as np
 from ophyd.positioner import SoftPositioner
 from ophyd.signal import EpicsSignal, Signal
+from ophyd.status import wait as status_wait
 from ophyd.utils import InvalidState
 
 from .interface import FltMvInterface
-from .utils import schedule_task
+from .utils import schedule_task, set_many
 
 
 class FuncPositioner(FltMvInterface, SoftPositioner):
@@ -219,3 +220,175 @@ class FuncPositioner(FltMvInterface, SoftPositioner):
 
 # Legacy name from old code
 VirtualMotor = FuncPositioner
+
+
+def synchronize_velocities(targets, timeout=10):
+    """
+    Scale axis velocities so that all axes arrive at their targets together.
+
+    The slowest move sets the pace: every other axis with a ``velocity``
+    signal is slowed down to take the same time. Axes without a
+    ``velocity`` signal, or that are already at their target, are left
+    alone.
+
+    Parameters
+    ----------
+    targets : dict
+        Map of positioner to target position.
+
+    timeout : float, optional
+        How long to wait for the new velocities to be accepted.
+
+    Returns
+    -------
+    originals : dict
+        Map of each changed ``velocity`` signal to its original value, to
+        pass to `restore_velocities` once the move is done.
+    """
+    moves = []
+    for axis, target in targets.items():
+        velocity = getattr(axis, 'velocity', None)
+        if not isinstance(velocity, Signal):
+            continue
+        try:
+            distance = abs(float(target) - float(axis.position))
+            speed = float(velocity.get())
+        except (TypeError, ValueError):
+            continue
+        if distance > 0 and speed > 0:
+            moves.append((velocity, speed, distance))
+    if len(moves) < 2:
+        return {}
+    duration = max(distance / speed for _, speed, distance in moves)
+    originals = {}
+    scaled = {}
+    for velocity, speed, distance in moves:
+        new_speed = distance / duration
+        if not np.isclose(new_speed, speed):
+            originals[velocity] = speed
+            scaled[velocity] = new_speed
+    if scaled:
+        set_many(scaled, use_put_callback=True,
+                 raise_on_set_failure=True).wait(timeout=timeout)
+    return originals
+
+
+def restore_velocities(originals):
+    """
+    Put back the velocities changed by `synchronize_velocities`.
+
+    Returns
+    -------
+    status : SetManyStatus
+    """
+    return set_many(originals, use_put_callback=True)
+
+
+def coordinated_move(targets, *, go_signal=None, go_value=1, preset=None,
+                     synchronize=False, timeout=None, moved_cb=None,
+                     wait=False):
+    """
+    Move several positioners together, with a single status.
+
+    All targets are checked before anything moves, so one bad axis rejects
+    the whole move. The setpoints are then all issued at once. For
+    controllers with a common "go" command, pass it as ``go_signal``: any
+    axis with a ``defer_motion`` flag holds its motion until the go signal
+    is written once at the end.
+
+    Some controllers check each move against every setpoint at once, e.g.
+    whether a whole pose is reachable. For these, pass all of the setpoints
+    as ``preset``: they are written before any axis is moved, so that no
+    check sees a partially written pose.
+
+    Parameters
+    ----------
+    targets : dict
+        Map of positioner to target position.
+
+    go_signal : Signal, optional
+        Signal that starts the motion of all deferred axes.
+
+    go_value : any, optional
+        Value to write to ``go_signal``. Defaults to 1.
+
+    preset : dict, optional
+        Map of signal to value, all written and completed before any axis
+        is moved.
+
+    synchronize : bool, optional
+        Scale the axis velocities so that all axes arrive together, see
+        `synchronize_velocities`. They are restored when the move is done.
+
+    timeout : float, optional
+        Per-axis timeout for the motion.
+
+    moved_cb : callable, optional
+        Added as a callback to the returned status.
+
+    wait : bool, optional
+        If `True`, block until the move is completed. The axes are stopped
+        if interrupted.
+
+    Returns
+    -------
+    status : SetManyStatus
+        One status for the motion of all axes.
+
+    Raises
+    ------
+    ValueError
+        If more than one of the targets is rejected. A single rejected
+        target raises its own exception, e.g. a
+        `~ophyd.utils.LimitError`.
+    """
+    errors = []
+    for axis, target in targets.items():
+        try:
+            axis.check_value(target)
+        except Exception as ex:
+            errors.append((axis, ex))
+    if len(errors) == 1:
+        raise errors[0][1]
+    if errors:
+        msg = '\n'.join(f'{axis.name}: {ex}' for axis, ex in errors)
+        raise ValueError(f'Coordinated move rejected:\n{msg}') from errors[0][1]
+
+    if preset:
+        set_many(preset, timeout=timeout, use_put_callback=True,
+                 raise_on_set_failure=True,
+                 fail_on_set_failure=True).wait(timeout=timeout)
+    originals = synchronize_velocities(targets) if synchronize else {}
+    deferred = {}
+    if go_signal is not None:
+        for axis in targets:
+            if hasattr(axis, 'defer_motion'):
+                deferred[axis] = axis.defer_motion
+                axis.defer_motion = True
+    try:
+        status = set_many(targets, timeout=timeout, raise_on_set_failure=True)
+        if go_signal is not None:
+            go_signal.put(go_value)
+    except Exception:
+        if go_signal is None:
+            for axis in targets:
+                axis.stop()
+        if originals:
+            restore_velocities(originals)
+        raise
+    finally:
+        for axis, defer in deferred.items():
+            axis.defer_motion = defer
+
+    if originals:
+        status.add_callback(lambda status: restore_velocities(originals))
+    if moved_cb is not None:
+        status.add_callback(moved_cb)
+    if wait:
+        try:
+            status_wait(status)
+        except KeyboardInterrupt:
+            for axis in targets:
+                axis.stop()
+            raise
+    return status
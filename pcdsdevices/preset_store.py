@@ -0,0 +1,435 @@
+"""
+Consolidated storage for device preset positions.
+
+By default, :class:`~pcdsdevices.interface.Presets` keeps one yaml file per
+device for each preset type. This module provides an alternative backend that
+keeps every device's presets for a preset type in a single indexed sqlite
+file. The file is read once per process and re-read only when it changes on
+disk, which is checked with one ``stat`` per preset type rather than one per
+device.
+
+Select this backend with
+``setup_preset_paths(backend='sqlite', hutch=..., user=...)``, and use
+:func:`migrate_yaml_presets` (or ``python -m pcdsdevices.preset_store``) to
+import existing yaml preset files.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Optional
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+PresetData = dict[str, dict[str, Any]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS presets (
+    device TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value REAL NOT NULL,
+    active INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (device, name)
+);
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    device TEXT NOT NULL,
+    name TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_device ON history (device, name);
+"""
+
+
+class SQLitePresetStore:
+    """
+    All of the preset positions of one preset type, in one sqlite file.
+
+    The presets for each device are held in memory using the same layout
+    as the per-device yaml files, i.e. a dictionary of preset name to a
+    dictionary with ``value``, ``active`` and ``history`` keys.
+
+    Parameters
+    ----------
+    path : str or Path
+        Either the sqlite file itself, or the preset directory in which
+        case the file will be named ``presets.db``.
+
+    Attributes
+    ----------
+    poll_interval : float
+        Minimum number of seconds between checks of the file for changes
+        made by other processes.
+
+    lock_timeout : float
+        Number of seconds to wait for another process to finish writing.
+    """
+    filename = 'presets.db'
+    poll_interval = 1.0
+    lock_timeout = 1.0
+
+    def __init__(self, path: str | Path):
+        path = Path(path)
+        if path.suffix != '.db':
+            path = path / self.filename
+        self.path = path
+        self._lock = threading.RLock()
+        self._data: dict[str, PresetData] = {}
+        self._versions: dict[str, int] = {}
+        self._stat = None
+        self._last_check = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection in autocommit mode, creating the schema."""
+        conn = sqlite3.connect(self.path, timeout=self.lock_timeout,
+                               isolation_level=None)
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _file_stat(self) -> Optional[tuple[int, int, bytes]]:
+        """
+        Return a marker that changes every time the file is written.
+
+        The sqlite header holds a counter that is incremented on every
+        commit, which catches quick writes that do not change the mtime.
+        """
+        try:
+            stat = self.path.stat()
+            with open(self.path, 'rb') as f:
+                f.seek(24)
+                counter = f.read(4)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, counter
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        Re-read the file if it has changed since it was last read.
+
+        The file is checked at most once every ``poll_interval`` seconds.
+
+        Parameters
+        ----------
+        force : bool, optional
+            Re-read the file right away, even if it looks unchanged.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if (
+                not force
+                and self._last_check is not None
+                and now - self._last_check < self.poll_interval
+            ):
+                return
+            self._last_check = now
+            stat = self._file_stat()
+            if stat == self._stat and not force:
+                return
+            logger.debug('loading presets from %s', self.path)
+            self._stat = stat
+            if stat is None:
+                self._set_data({})
+            else:
+                self._set_data(self._load())
+
+    def _load(self) -> dict[str, PresetData]:
+        data = {}
+        with closing(self._connect()) as conn:
+            for device, name, value, active in conn.execute(
+                'SELECT device, name, value, active FROM presets'
+            ):
+                data.setdefault(device, {})[name] = {
+                    'value': value,
+                    'active': bool(active),
+                    'history': {},
+                }
+            for device, name, timestamp, entry in conn.execute(
+                'SELECT device, name, timestamp, entry FROM history '
+                'ORDER BY id'
+            ):
+                try:
+                    data[device][name]['history'][timestamp] = entry
+                except KeyError:
+                    pass
+        return data
+
+    def _set_data(self, data: dict[str, PresetData]) -> None:
+        """Swap in new data, bumping the version of changed devices."""
+        for device in set(data) | set(self._data):
+            if data.get(device) != self._data.get(device):
+                self._versions[device] = self._versions.get(device, 0) + 1
+        self._data = data
+
+    def get(self, device: str) -> PresetData:
+        """
+        Get the presets for one device.
+
+        The returned dictionary must not be modified.
+        """
+        self.refresh()
+        return self._data.get(device, {})
+
+    def version(self, device: str) -> int:
+        """
+        Get a number that changes whenever the device's presets change.
+        """
+        self.refresh()
+        return self._versions.get(device, 0)
+
+    def update(
+        self,
+        device: str,
+        name: str,
+        value: Optional[float] = None,
+        comment: Optional[str] = None,
+        active: bool = True,
+    ) -> None:
+        """
+        Update one preset position, recording the change in its history.
+
+        This has the same semantics as editing the per-device yaml file:
+        a new ``value`` is recorded in the history along with ``comment``,
+        a ``comment`` alone re-records the current value, and ``active``
+        is always applied.
+
+        Raises
+        ------
+        KeyError
+            If there is no new value and the preset does not exist.
+        BlockingIOError
+            If another process is holding the file for too long.
+        """
+        timestamp = time.strftime('%d %b %Y %H:%M:%S')
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute('BEGIN IMMEDIATE')
+                try:
+                    row = conn.execute(
+                        'SELECT value FROM presets '
+                        'WHERE device = ? AND name = ?',
+                        (device, name),
+                    ).fetchone()
+                    if row is None and value is None:
+                        raise KeyError(name)
+                    if value is None and comment is not None:
+                        value = row[0]
+                    if value is not None:
+                        conn.execute(
+                            'INSERT INTO presets (device, name, value, active) '
+                            'VALUES (?, ?, ?, ?) ON CONFLICT (device, name) '
+                            'DO UPDATE SET value = excluded.value, '
+                            'active = excluded.active',
+                            (device, name, value, active),
+                        )
+                        comment = f' {comment}' if comment else ''
+                        conn.execute(
+                            'INSERT INTO history '
+                            '(device, name, timestamp, entry) '
+                            'VALUES (?, ?, ?, ?)',
+                            (device, name, timestamp,
+                             f'{value:10.4f}{comment}'),
+                        )
+                    else:
+                        conn.execute(
+                            'UPDATE presets SET active = ? '
+                            'WHERE device = ? AND name = ?',
+                            (active, device, name),
+                        )
+                except BaseException:
+                    conn.execute('ROLLBACK')
+                    raise
+                conn.execute('COMMIT')
+        except sqlite3.OperationalError as ex:
+            if 'locked' in str(ex):
+                raise BlockingIOError(str(ex)) from ex
+            raise
+        self.refresh(force=True)
+
+    def import_device(
+        self,
+        device: str,
+        data: PresetData,
+        overwrite: bool = False,
+    ) -> int:
+        """
+        Add all of the presets from one device's yaml data.
+
+        Parameters
+        ----------
+        device : str
+            The device name.
+        data : dict
+            The contents of the device's yaml preset file.
+        overwrite : bool, optional
+            Replace the device's existing presets. If False (default),
+            devices that already have presets are skipped.
+
+        Returns
+        -------
+        count : int
+            The number of presets imported.
+        """
+        with closing(self._connect()) as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                exists = conn.execute(
+                    'SELECT 1 FROM presets WHERE device = ? LIMIT 1',
+                    (device,),
+                ).fetchone()
+                if exists and not overwrite:
+                    conn.execute('ROLLBACK')
+                    logger.info('Skipping %s, presets already exist', device)
+                    return 0
+                conn.execute('DELETE FROM presets WHERE device = ?',
+                             (device,))
+                conn.execute('DELETE FROM history WHERE device = ?',
+                             (device,))
+                for name, info in data.items():
+                    conn.execute(
+                        'INSERT INTO presets (device, name, value, active) '
+                        'VALUES (?, ?, ?, ?)',
+                        (device, name, info['value'],
+                         bool(info.get('active', True))),
+                    )
+                    conn.executemany(
+                        'INSERT INTO history (device, name, timestamp, entry) '
+                        'VALUES (?, ?, ?, ?)',
+                        [(device, name, str(timestamp), entry)
+                         for timestamp, entry
+                         in (info.get('history') or {}).items()],
+                    )
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+        self.refresh(force=True)
+        return len(data)
+
+    def devices(self) -> list[str]:
+        """Return the names of all devices with presets."""
+        self.refresh()
+        return sorted(self._data)
+
+
+_stores: dict[Path, SQLitePresetStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_preset_store(path: str | Path) -> SQLitePresetStore:
+    """
+    Get the process-wide store for a preset path.
+
+    Parameters
+    ----------
+    path : str or Path
+        The preset directory or sqlite file.
+    """
+    key = Path(path).absolute()
+    with _stores_lock:
+        try:
+            return _stores[key]
+        except KeyError:
+            store = _stores[key] = SQLitePresetStore(key)
+            return store
+
+
+def migrate_yaml_presets(
+    yaml_dir: str | Path,
+    db_path: Optional[str | Path] = None,
+    overwrite: bool = False,
+) -> int:
+    """
+    Import every per-device yaml preset file in a directory.
+
+    The yaml files are left in place.
+
+    Parameters
+    ----------
+    yaml_dir : str or Path
+        The preset directory, e.g. the one passed to ``setup_preset_paths``.
+    db_path : str or Path, optional
+        The sqlite file to write to. Defaults to ``presets.db`` inside
+        ``yaml_dir``, which is where the sqlite backend will look for it.
+    overwrite : bool, optional
+        Replace devices that have already been imported.
+
+    Returns
+    -------
+    count : int
+        The total number of presets imported.
+    """
+    yaml_dir = Path(yaml_dir)
+    store = get_preset_store(db_path or yaml_dir)
+    count = 0
+    for path in sorted(yaml_dir.glob('*.yml')):
+        with open(path) as f:
+            data = yaml.full_load(f) or {}
+        count += store.import_device(path.stem, data, overwrite=overwrite)
+    logger.info('Imported %d presets from %s into %s',
+                count, yaml_dir, store.path)
+    return count
+
+
+def export_yaml_presets(
+    db_path: str | Path,
+    yaml_dir: str | Path,
+) -> int:
+    """
+    Write out one yaml preset file per device from a sqlite store.
+
+    This reverses :func:`migrate_yaml_presets`, overwriting any existing
+    yaml files for the same devices.
+
+    Returns
+    -------
+    count : int
+        The number of files written.
+    """
+    store = get_preset_store(db_path)
+    yaml_dir = Path(yaml_dir)
+    devices = store.devices()
+    for device in devices:
+        with open(yaml_dir / f'{device}.yml', 'w') as f:
+            yaml.dump(store.get(device), f, default_flow_style=False)
+    return len(devices)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m pcdsdevices.preset_store',
+        description='Convert between yaml and sqlite preset storage.',
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    migrate = subparsers.add_parser(
+        'migrate', help='Import per-device yaml files into a sqlite file.'
+    )
+    migrate.add_argument('yaml_dir')
+    migrate.add_argument('--db', default=None,
+                         help='The sqlite file, default <yaml_dir>/presets.db')
+    migrate.add_argument('--overwrite', action='store_true',
+                         help='Replace devices that were already imported.')
+    export = subparsers.add_parser(
+        'export', help='Write per-device yaml files from a sqlite file.'
+    )
+    export.add_argument('db')
+    export.add_argument('yaml_dir')
+
+    args = parser.parse_args(args)
+    logging.basicConfig(level=logging.INFO)
+    if args.command == 'migrate':
+        migrate_yaml_presets(args.yaml_dir, db_path=args.db,
+                             overwrite=args.overwrite)
+    else:
+        export_yaml_presets(args.db, args.yaml_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -13,14 +13,17 @@ from ophyd.positioner import PositionerBase
 from ophyd.pseudopos import (PseudoSingle, pseudo_position_argument,
                              real_position_argument)
 from ophyd.signal import EpicsSignal
+from ophyd.status import wait as status_wait
 from scipy.constants import speed_of_light
 
 from .device import InterfaceComponent as ICpt
 from .device import InterfaceDevice
 from .interface import FltMvInterface
+from .positioner import restore_velocities, synchronize_velocities
 from .signal import NotepadLinkedSignal
 from .sim import FastMotor
-from .utils import convert_unit, get_status_float, get_status_value
+from .utils import (convert_unit, dynamic_class_cache, get_status_float,
+                    get_status_value)
 
 logger = logging.getLogger(__name__)
 
@@ -120,9 +123,14 @@ class PseudoPositioner(ophyd.pseudopos.PseudoPositioner):
     * Makes scalar ``RealPosition`` and ``PseudoPosition`` easily convert
       to floating point values.
     * Adds a set_current_position helper method
+    * Optionally scales the real motor velocities so that they all arrive
+      together, see ``synchronize_motion``
 
     """ + ophyd.pseudopos.PseudoPositioner.__doc__
 
+    # bool that defines if real motor velocities are scaled during moves
+    synchronize_motion = False
+
     def __init__(self, *args, **kwargs):
         self._my_move = False
         self._move_time = 0
@@ -201,9 +209,24 @@ class PseudoPositioner(ophyd.pseudopos.PseudoPositioner):
         '''
         self._my_move = True
         self._move_time = time.monotonic()
-        status = super().move(position, wait=wait, timeout=timeout,
-                              moved_cb=moved_cb)
+        if not self.synchronize_motion:
+            status = super().move(position, wait=wait, timeout=timeout,
+                                  moved_cb=moved_cb)
+            self._update_notepad_ioc(position, 'notepad_setpoint')
+            return status
+
+        real_pos = self.forward(position)
+        originals = synchronize_velocities(dict(zip(self._real, real_pos)))
+        try:
+            status = super().move(position, wait=False, timeout=timeout,
+                                  moved_cb=moved_cb)
+        except Exception:
+            restore_velocities(originals)
+            raise
+        status.add_callback(lambda status: restore_velocities(originals))
         self._update_notepad_ioc(position, 'notepad_setpoint')
+        if wait:
+            status_wait(status)
         return status
 
     def _update_position(self):
@@ -440,6 +463,12 @@ class SyncAxis(FltMvInterface, PseudoPositioner):
         real motor limits are sufficient to protect your application.
         e.g. sync_limits = (-100, 100) will bind the `SyncAxis` to move between
         -100 and 100.
+
+    synchronize_motion : bool
+        If `True`, scale the velocities of the real motors during each move
+        so that they all arrive at the same time, rather than each moving at
+        its own speed. The velocities are restored after the move. Defaults
+        to `False`.
     """
     sync = Cpt(PseudoSingleInterface, kind='omitted')
 
@@ -837,6 +866,8 @@ class DelayBase(FltMvInterface, PseudoPositioner):
         return self.delay.format_status_info(status_info['delay'])
 
 
+# Map of motor class to delay class, classes registered here take priority
+# over the shared dynamic_class_cache
 delay_classes = {}
 
 
@@ -848,14 +879,18 @@ def delay_class_factory(motor_class):
     declarations inside ophyd Devices.
     """
     try:
-        cls = delay_classes[motor_class]
+        return delay_classes[motor_class]
     except KeyError:
-        cls = type(
+        pass
+    cls = dynamic_class_cache.get_or_create(
+        (DelayBase, motor_class),
+        lambda: type(
             'Delay' + motor_class.__name__,
             (DelayBase,),
             {'motor': Cpt(motor_class, '')}
-        )
-        delay_classes[motor_class] = cls
+        ),
+    )
+    delay_classes[motor_class] = cls
     return cls
 
 
@@ -922,6 +957,7 @@ class SimDelayStage(DelayBase):
 
 
 delay_classes[FastMotor] = SimDelayStage
+dynamic_class_cache.register((DelayBase, FastMotor), SimDelayStage)
 
 
 class LookupTablePositioner(PseudoPositioner):
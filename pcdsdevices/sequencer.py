@@ -1,5 +1,8 @@
 import logging
 
+import numpy as np
+from numpy.lib.recfunctions import (structured_to_unstructured,
+                                    unstructured_to_structured)
 from ophyd import Component as Cpt
 from ophyd import Device, EpicsSignal, EpicsSignalRO
 from ophyd.flyers import FlyerInterface, MonitorFlyerMixin
@@ -11,15 +14,129 @@ from .interface import BaseInterface
 logger = logging.getLogger(__name__)
 
 
+#: One line of an event sequence: beam code, delta beam, delta fiducial and
+#: burst count.
+sequence_dtype = np.dtype([
+    ('ec', np.int32),
+    ('bd', np.int32),
+    ('fd', np.int32),
+    ('bc', np.int32),
+])
+
+
+def to_sequence_array(sequence, max_length=2048):
+    """
+    Validate an event sequence and convert it to a structured array.
+
+    Parameters
+    ----------
+    sequence : list, numpy.ndarray
+        Either a list of ``[beam_code, delta_beam, delta_fiducial,
+        burst_count]`` lines, an equivalent ``(N, 4)`` array, or an array
+        that already has `sequence_dtype`.
+
+    max_length : int, optional
+        The maximum number of lines the sequencer can hold.
+
+    Returns
+    -------
+    sequence : numpy.ndarray
+        A new 1D array of `sequence_dtype`, one element per line.
+
+    Raises
+    ------
+    ValueError
+        If the sequence is too long, is not made of four-item lines, or
+        holds anything other than non-negative integers.
+    """
+    if isinstance(sequence, np.ndarray) and sequence.dtype.names:
+        sequence = structured_to_unstructured(
+            sequence[list(sequence_dtype.names)]
+        )
+    lines = np.asarray(sequence, dtype=float)
+    if lines.size == 0:
+        lines = lines.reshape(0, 4)
+    if lines.ndim != 2 or lines.shape[1] != 4:
+        raise ValueError(
+            'Event sequences must be a list of [beam_code, delta_beam, '
+            f'delta_fiducial, burst_count] lines, got shape {lines.shape}.'
+        )
+    if len(lines) > max_length:
+        raise ValueError(
+            f'Event sequence has {len(lines)} lines, but the sequencer '
+            f'only holds {max_length}.'
+        )
+    bad = ~np.isfinite(lines) | (lines < 0) | (lines != np.round(lines))
+    bad |= lines > np.iinfo(np.int32).max
+    if bad.any():
+        line, column = np.argwhere(bad)[0]
+        raise ValueError(
+            f'Invalid value {lines[line, column]} in line {line} of the '
+            'event sequence, expected a non-negative integer.'
+        )
+    return unstructured_to_structured(
+        lines.astype(np.int32), dtype=sequence_dtype
+    )
+
+
 class EventSequence(BaseInterface, Device):
-    """Class for the event sequence of the event sequencer."""
+    """
+    Class for the event sequence of the event sequencer.
+
+    The last program written with :meth:`.put_seq` is cached so that later
+    writes only upload the waveforms that actually changed.
+    """
     ec_array = Cpt(EpicsSignal, ':SEQ.A')
     bd_array = Cpt(EpicsSignal, ':SEQ.B')
     fd_array = Cpt(EpicsSignal, ':SEQ.C')
     bc_array = Cpt(EpicsSignal, ':SEQ.D')
     seq_proc = Cpt(EpicsSignal, ':SEQ.PROC')
 
-    tab_whitelist = ['get_seq', 'put_seq', 'show']
+    max_length = 2048
+    _array_attrs = {
+        'ec': 'ec_array',
+        'bd': 'bd_array',
+        'fd': 'fd_array',
+        'bc': 'bc_array',
+    }
+
+    tab_whitelist = ['get_seq', 'get_seq_array', 'put_seq', 'verify_seq',
+                     'library', 'show']
+
+    def __init__(self, prefix='', *, name, **kwargs):
+        super().__init__(prefix, name=name, **kwargs)
+        self._uploaded = None
+        self.library = SequenceLibrary(self)
+
+    def _read_program(self):
+        """Read back all four waveforms as a full-length program."""
+        program = np.zeros(self.max_length, dtype=sequence_dtype)
+        for column, attr in self._array_attrs.items():
+            values = getattr(self, attr).get()
+            if values is None:
+                continue
+            values = np.asarray(values)[:self.max_length]
+            program[column][:len(values)] = values
+        return program
+
+    def get_seq_array(self, current_length=True):
+        """
+        Retrieve the current event sequence as a structured array.
+
+        The array has `sequence_dtype`, with one element per line and the
+        fields ``ec``, ``bd``, ``fd`` and ``bc``.
+
+        Parameters
+        ----------
+        current_length : bool
+            Option to retrieve the sequence up to the current length. Defaults
+            to `True`.
+        """
+        if self.parent and current_length is True:
+            seq_length = self.parent.sequence_length.get()
+        else:
+            seq_length = self.max_length
+        return self._read_program()[:seq_length]
 
     def get_seq(self, current_length=True):
         """
@@ -44,26 +161,33 @@ class EventSequence(BaseInterface, Device):
         Get the whole sequence:
         >>> EventSequence.get_seq(current_length=False)
         """
+        seq = self.get_seq_array(current_length=current_length)
+        return structured_to_unstructured(seq).tolist()
 
-        if self.parent and current_length is True:
-            seq_length = self.parent.sequence_length.get()
-        else:
-            seq_length = 2048  # Whole thing
-
-        sequence = [[], [], [], []]
-        sequence[0] = self.ec_array.get()[0:seq_length]
-        sequence[1] = self.bd_array.get()[0:seq_length]
-        sequence[2] = self.fd_array.get()[0:seq_length]
-        sequence[3] = self.bc_array.get()[0:seq_length]
-
-        zip_seq = zip(sequence[0], sequence[1], sequence[2], sequence[3])
-        seq_list = list(zip_seq)
-        # Convert list of tuples (from zip) to list of lists
-        seq = [list(line) for line in seq_list]
+    def verify_seq(self):
+        """
+        Check the cached copy of the last uploaded sequence against readbacks.
 
-        return seq
+        The cache is discarded if the readbacks differ, so that the next
+        :meth:`.put_seq` writes the whole sequence again. The readbacks may
+        also differ just because they have not caught up with a recent
+        upload yet, which costs one full upload but is always safe.
 
-    def put_seq(self, sequence, update_length=True):
+        Returns
+        -------
+        verified : bool
+            `True` if the sequencer still holds our last upload.
+        """
+        if self._uploaded is None:
+            return False
+        if np.array_equal(self._read_program(), self._uploaded):
+            return True
+        logger.warning('Event sequence was modified outside of %s, '
+                       'discarding the cached upload.', self.name)
+        self._uploaded = None
+        return False
+
+    def put_seq(self, sequence, update_length=True, verify=True):
         """
         Write a sequence to the event sequencer.
 
@@ -74,17 +198,30 @@ class EventSequence(BaseInterface, Device):
         sequencer will automatically be updated, unless the `update_length`
         flag is set to :keyword:`False`.
 
+        Only the waveforms that differ from the last upload are written, and
+        the sequencer is only reprocessed if anything was written. If there
+        is no verified copy of the last upload, e.g. on the first call or if
+        the sequencer was changed elsewhere, all of the waveforms are
+        written.
+
         Parameters
         ----------
-        sequence : list
+        sequence : list or numpy.ndarray
             List of lists describing the event sequence. The list takes the
             form ``[[beam_code, delta_beam, delta_fiducial, burst_count],
-            ...]``.
+            ...]``. An ``(N, 4)`` array or an array of `sequence_dtype` is
+            also accepted.
 
         update_length : bool
             Option to automatically update the play length (the '{prefix}:LEN'
             PV) to the length of the written sequence. Defaults to `True`.
 
+        verify : bool
+            Option to check the cached last upload against the readbacks
+            before comparing to it. Set this to :keyword:`False` to skip the
+            readbacks when nothing else writes to this sequencer. Defaults to
+            `True`.
+
         Examples
         --------
         >>> seq = [[182,  12,   0,   0], # Line 1
@@ -97,25 +234,36 @@ class EventSequence(BaseInterface, Device):
         Don't update length:
         >>> EventSequence.put_seq(seq, update_length=False)
         """
-
-        curr_seq = self.get_seq(current_length=False)
-        new_seq = curr_seq.copy()
-
-        for i in range(len(sequence)):
-            new_seq[i] = sequence[i]
+        sequence = to_sequence_array(sequence, max_length=self.max_length)
+
+        if verify:
+            self.verify_seq()
+        # Readbacks can lag behind a recent upload, so they are never diffed
+        # against. Without a trusted cache, every waveform is written.
+        full_upload = self._uploaded is None
+        if full_upload:
+            current = self._read_program()
+        else:
+            current = self._uploaded
+        new_seq = current.copy()
+        new_seq[:len(sequence)] = sequence
 
         # Update the length of the sequence if update_length == True and
         # the event sequence is a child of the EventSequencer
         if self.parent and update_length is True:
             new_len = len(sequence)
-            self.parent.sequence_length.put(new_len)
-
-        seq = [arr for arr in zip(*new_seq)]
-        self.ec_array.put(seq[0])
-        self.bd_array.put(seq[1])
-        self.fd_array.put(seq[2])
-        self.bc_array.put(seq[3])
-        self.seq_proc.put(1)  # Force the sequencer to update sequence
+            if self.parent.sequence_length.get() != new_len:
+                self.parent.sequence_length.put(new_len)
+
+        changed = [column for column in sequence_dtype.names
+                   if full_upload
+                   or not np.array_equal(new_seq[column], current[column])]
+        for column in changed:
+            sig = getattr(self, self._array_attrs[column])
+            sig.put(np.ascontiguousarray(new_seq[column]))
+        self._uploaded = new_seq
+        if changed:
+            self.seq_proc.put(1)  # Force the sequencer to update sequence
 
     def show(self, num_lines=None):
         """
@@ -147,6 +295,90 @@ class EventSequence(BaseInterface, Device):
             print(line)
 
 
+class SequenceLibrary:
+    """
+    Named event sequences, validated ahead of time for fast switching.
+
+    Programs are checked and converted once when they are added, so that
+    loading one between scan steps is just a diffed :meth:`.put_seq`.
+
+    Parameters
+    ----------
+    sequence : EventSequence
+        The event sequence to load programs into.
+
+    Examples
+    --------
+    >>> lib = sequencer.sequence.library
+    >>> lib.add('pump', [[90, 0, 0, 0], [91, 1, 0, 0]])
+    >>> lib.add('probe', [[92, 0, 0, 0]])
+    >>> lib.load('pump')
+    """
+
+    def __init__(self, sequence):
+        self.sequence = sequence
+        self.programs = {}
+        self.current = None
+
+    def __contains__(self, name):
+        return name in self.programs
+
+    def __getitem__(self, name):
+        return self.programs[name]
+
+    def __len__(self):
+        return len(self.programs)
+
+    def names(self):
+        """Return the names of all programs in the library."""
+        return list(self.programs)
+
+    def add(self, name, sequence):
+        """
+        Validate a sequence and store it under ``name``.
+
+        Parameters
+        ----------
+        name : str
+            The name to store the program under, replacing any existing
+            program of the same name.
+
+        sequence : list or numpy.ndarray
+            The event sequence, in any form accepted by :meth:`.put_seq`.
+        """
+        program = to_sequence_array(sequence,
+                                    max_length=self.sequence.max_length)
+        program.flags.writeable = False
+        self.programs[name] = program
+        if self.current == name:
+            self.current = None
+
+    def remove(self, name):
+        """Remove a program from the library."""
+        del self.programs[name]
+        if self.current == name:
+            self.current = None
+
+    def load(self, name, update_length=True, verify=True):
+        """
+        Write a stored program to the event sequencer.
+
+        Parameters
+        ----------
+        name : str
+            The name of the program to load.
+
+        update_length : bool, optional
+            Passed to :meth:`.EventSequence.put_seq`.
+
+        verify : bool, optional
+            Passed to :meth:`.EventSequence.put_seq`.
+        """
+        self.sequence.put_seq(self.programs[name],
+                              update_length=update_length, verify=verify)
+        self.current = name
+
+
 class EventSequencer(BaseInterface, Device, MonitorFlyerMixin, FlyerInterface):
     """
     Event Sequencer.
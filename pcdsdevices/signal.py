@@ -13,13 +13,19 @@ if __name__ != 'pcdsdevices.signal':
                        'elsewhere for better results.')
 import contextlib
 import dataclasses
+import heapq
 import inspect
 import itertools
 import logging
+import math
 import numbers
+import threading
+import time
 import typing
+from collections import deque
 from threading import RLock
-from typing import Any, Generator, Mapping, Optional, Union
+from typing import (Any, Callable, ClassVar, Generator, Iterable, Mapping,
+                    Optional, Union)
 
 import numpy as np
 import ophyd
@@ -146,6 +152,199 @@ class _AggregateSignalState:
     value_cbid: Optional[int] = None
     #: The meta subscription callback ID (None if not yet subscribed)
     meta_cbid: Optional[int] = None
+    #: What the last value contributed to the AggregateSignal's reducer
+    reducer_input: Any = None
+
+
+class AggregateReducer:
+    """
+    An associative reduction over the values of an `AggregateSignal`.
+
+    The reduction is seeded from all of the values with `reset`, and after
+    that each new value is folded in with `update` from the value it
+    replaces, without looking at the other values.
+    """
+    #: True once the reduction has been seeded with `reset`
+    ready: bool = False
+
+    def reset(self, values: Iterable[Any]) -> None:
+        """Start over from all of the values."""
+        raise NotImplementedError(
+            'Subclasses must implement reset'
+        )  # pragma nocover
+
+    def update(self, old: Any, new: Any) -> None:
+        """Replace one value that went into the reduction."""
+        raise NotImplementedError(
+            'Subclasses must implement update'
+        )  # pragma nocover
+
+    @property
+    def result(self) -> Any:
+        """The current result of the reduction."""
+        raise NotImplementedError(
+            'Subclasses must implement result'
+        )  # pragma nocover
+
+
+class SumReducer(AggregateReducer):
+    """The sum of the values."""
+    def reset(self, values: Iterable[Any]) -> None:
+        self._total = sum(values)
+        self.ready = True
+
+    def update(self, old: Any, new: Any) -> None:
+        self._total += new - old
+
+    @property
+    def result(self) -> Any:
+        return self._total
+
+
+class CountReducer(AggregateReducer):
+    """
+    The number of values for which ``predicate(value)`` is true.
+
+    Parameters
+    ----------
+    predicate : callable, optional
+        Defaults to `bool`.
+    """
+    def __init__(self, predicate: Callable[[Any], bool] = bool):
+        self.predicate = predicate
+
+    def reset(self, values: Iterable[Any]) -> None:
+        self._count = 0
+        self._size = 0
+        for value in values:
+            self._count += bool(self.predicate(value))
+            self._size += 1
+        self.ready = True
+
+    def update(self, old: Any, new: Any) -> None:
+        self._count += (
+            bool(self.predicate(new)) - bool(self.predicate(old))
+        )
+
+    @property
+    def result(self) -> int:
+        return self._count
+
+
+class AnyReducer(CountReducer):
+    """True if ``predicate(value)`` is true for any value."""
+    @property
+    def result(self) -> bool:
+        return self._count > 0
+
+
+class AllReducer(CountReducer):
+    """True if ``predicate(value)`` is true for all of the values."""
+    @property
+    def result(self) -> bool:
+        return self._count == self._size
+
+
+class BitwiseOrReducer(AggregateReducer):
+    """
+    The bitwise OR of non-negative integer values, e.g. error bitmasks.
+
+    The number of values with each bit set is tracked, so an update costs
+    one step per set bit.
+    """
+    def reset(self, values: Iterable[int]) -> None:
+        self._bit_counts = {}
+        self._mask = 0
+        for value in values:
+            self._add(int(value), 1)
+        self.ready = True
+
+    def _add(self, value: int, delta: int) -> None:
+        while value:
+            low_bit = value & -value
+            count = self._bit_counts.get(low_bit, 0) + delta
+            if count:
+                self._bit_counts[low_bit] = count
+                self._mask |= low_bit
+            else:
+                self._bit_counts.pop(low_bit, None)
+                self._mask &= ~low_bit
+            value ^= low_bit
+
+    def update(self, old: int, new: int) -> None:
+        self._add(int(old), -1)
+        self._add(int(new), 1)
+
+    @property
+    def result(self) -> int:
+        return self._mask
+
+
+class MinReducer(AggregateReducer):
+    """
+    The smallest of the values.
+
+    Replaced values are removed lazily from a heap, so an update costs
+    O(log n) rather than O(1).
+    """
+    _sign = 1
+
+    def reset(self, values: Iterable[Any]) -> None:
+        self._counts = {}
+        for value in values:
+            key = self._sign * value
+            self._counts[key] = self._counts.get(key, 0) + 1
+        self._heap = list(self._counts)
+        heapq.heapify(self._heap)
+        self.ready = True
+
+    def update(self, old: Any, new: Any) -> None:
+        old, new = self._sign * old, self._sign * new
+        count = self._counts[old] - 1
+        if count:
+            self._counts[old] = count
+        else:
+            del self._counts[old]
+        if new in self._counts:
+            self._counts[new] += 1
+        else:
+            self._counts[new] = 1
+            heapq.heappush(self._heap, new)
+        if len(self._heap) > 2 * len(self._counts) + 16:
+            # Too many stale entries, start a fresh heap
+            self._heap = list(self._counts)
+            heapq.heapify(self._heap)
+
+    @property
+    def result(self) -> Any:
+        heap = self._heap
+        while heap[0] not in self._counts:
+            heapq.heappop(heap)
+        return self._sign * heap[0]
+
+
+class MaxReducer(MinReducer):
+    """
+    The largest of the values, which must be numbers.
+
+    See `MinReducer`.
+    """
+    _sign = -1
+
+
+@dataclasses.dataclass
+class AggregateSignalStats:
+    """
+    Counters for the readback calculations of one `AggregateSignal`.
+
+    Times are in seconds.
+    """
+    #: Number of readback calculations over all of the cached values
+    recalculations: int = 0
+    #: Number of readback updates done by the reducer from one new value
+    incremental_updates: int = 0
+    #: Total time spent on both kinds of calculation
+    calc_time: float = 0.0
 
 
 class AggregateSignal(Signal):
@@ -157,9 +356,22 @@ class AggregateSignal(Signal):
 
     This signal type is intended to be used programmatically with a subclass.
     For simple per-device usage, see :class:`MultiDerivedSignal`.
+
+    Subclasses either implement ``_calc_readback``, or set
+    ``_reducer_factory`` to an `AggregateReducer` class (or other
+    zero-argument callable that returns one). With a reducer, each update
+    from one signal costs O(1) instead of a calculation over every cached
+    value. ``_reducer_input`` and ``_reduced_readback`` can be overridden to
+    convert the values going into and the result coming out of the reducer.
+
+    Attributes
+    ----------
+    calc_stats : AggregateSignalStats
+        How many readback calculations were done, and the time they took.
     """
 
     _update_only_on_change: bool = True
+    _reducer_factory: ClassVar[Optional[Callable[[], AggregateReducer]]] = None
     _has_subscribed: bool
     _signals: dict[Signal, _AggregateSignalState]
 
@@ -168,6 +380,10 @@ class AggregateSignal(Signal):
         self._has_subscribed = False
         self._lock = RLock()
         self._signals = {}
+        # Look up on the class so that a plain function is not bound
+        factory = type(self)._reducer_factory
+        self._reducer = factory() if factory is not None else None
+        self.calc_stats = AggregateSignalStats()
 
     def _calc_readback(self):
         """
@@ -179,16 +395,59 @@ class AggregateSignal(Signal):
         readback
             The result of the calculation.
         """
+        if self._reducer is None:
+            raise NotImplementedError(
+                'Subclasses must implement _calc_readback or set '
+                '_reducer_factory'
+            )  # pragma nocover
+        for signal, siginfo in self._signals.items():
+            siginfo.reducer_input = self._reducer_input(signal, siginfo.value)
+        self._reducer.reset(
+            siginfo.reducer_input for siginfo in self._signals.values()
+        )
+        return self._reduced_readback(self._reducer.result)
 
-        raise NotImplementedError(
-            'Subclasses must implement _calc_readback'
-        )  # pragma nocover
+    def _reducer_input(self, signal: Signal, value: OphydDataType) -> Any:
+        """Convert one cached value for the reducer."""
+        return value
+
+    def _reduced_readback(self, result: Any) -> OphydDataType:
+        """Convert the reducer's result into the readback value."""
+        return result
+
+    def _recalculate(self) -> OphydDataType:
+        """Run ``_calc_readback`` and count it in ``calc_stats``."""
+        start = time.monotonic()
+        try:
+            return self._calc_readback()
+        finally:
+            self.calc_stats.recalculations += 1
+            self.calc_stats.calc_time += time.monotonic() - start
 
     def _insert_value(self, signal, value):
         """Update the cache with one value and recalculate."""
         with self._lock:
-            self._signals[signal].value = value
-            self._update_readback()
+            siginfo = self._signals[signal]
+            old_value = siginfo.value
+            siginfo.value = value
+            reducer = self._reducer
+            if (
+                reducer is not None
+                and reducer.ready
+                and old_value is not None
+                and value is not None
+            ):
+                start = time.monotonic()
+                # Remove what the old value added, which need not be what it
+                # would add now, e.g. if it depends on metadata
+                reducer_input = self._reducer_input(signal, value)
+                reducer.update(siginfo.reducer_input, reducer_input)
+                siginfo.reducer_input = reducer_input
+                self._readback = self._reduced_readback(reducer.result)
+                self.calc_stats.incremental_updates += 1
+                self.calc_stats.calc_time += time.monotonic() - start
+            else:
+                self._update_readback()
             return self._readback
 
     @property
@@ -216,7 +475,7 @@ class AggregateSignal(Signal):
         """
         with self._lock:
             if self._have_values:
-                self._readback = self._calc_readback()
+                self._readback = self._recalculate()
             return self._readback
 
     def get(self, **kwargs):
@@ -286,19 +545,44 @@ class AggregateSignal(Signal):
         """This is a SUB_META callback from one of the aggregated signals."""
         with self._check_connectivity():
             self._signals[obj].connected = connected
+        # The reducer input may depend on metadata, e.g. alarm severity
+        self._refresh_reducer_input(obj)
+
+    def _refresh_reducer_input(self, signal: Signal) -> None:
+        """Redo one signal's reducer input from its cached value."""
+        with self._lock:
+            reducer = self._reducer
+            siginfo = self._signals[signal]
+            if reducer is None or not reducer.ready or siginfo.value is None:
+                return
+            old_value = self._readback
+            start = time.monotonic()
+            reducer_input = self._reducer_input(signal, siginfo.value)
+            reducer.update(siginfo.reducer_input, reducer_input)
+            siginfo.reducer_input = reducer_input
+            value = self._readback = self._reduced_readback(reducer.result)
+            self.calc_stats.incremental_updates += 1
+            self.calc_stats.calc_time += time.monotonic() - start
+            if value != old_value:
+                self._run_subs(sub_type=self.SUB_VALUE, obj=self, value=value,
+                               old_value=old_value)
 
     def _signal_value_callback(self, *, obj: Signal, **kwargs):
         """This is a SUB_VALUE callback from one of the aggregated signals."""
-        kwargs.pop('sub_type')
-        kwargs.pop('old_value')
-        value = kwargs['value']
+        self._apply_values({obj: kwargs['value']})
+
+    def _apply_values(self, values: dict[Signal, OphydDataType]) -> None:
+        """Insert new values for some of the signals and run subscriptions."""
+        if not values:
+            return
         with self._lock:
             old_value = self._readback
-            # Update just one value and assume the rest are cached
+            # Update just these values and assume the rest are cached
             # This allows us to run subs without EPICS gets
             # Run metadata callbacks before the value callback, if appropriate
             with self._check_connectivity() as connectivity_info:
-                value = self._insert_value(obj, value)
+                for signal, value in values.items():
+                    value = self._insert_value(signal, value)
             if connectivity_info["sent_value_callback"]:
                 # Avoid sending a duplicate SUB_VALUE event since the
                 # connectivity check above did it already
@@ -361,7 +645,7 @@ class AggregateSignal(Signal):
             # 2. All underlying signals have a value cached
             with self._lock:
                 old_value = self._readback
-                self._readback = self._calc_readback()
+                self._readback = self._recalculate()
                 self._run_subs(
                     sub_type=self.SUB_VALUE,
                     obj=self,
@@ -435,12 +719,48 @@ class SummarySignal(AggregateSignal):
     The calculated readback value is useless, and should not be used
     in any downstream calculations.  Use the signal/PV you actually
     care about instead.
+
+    Parameters
+    ----------
+    debounce : float, optional
+        If positive, updates from the constituent signals that arrive
+        within this many seconds of each other are collected and applied
+        together, resulting in a single value callback per burst.
+        Defaults to 0, which runs callbacks on every update.
     """
-    def _calc_readback(self):
-        values = tuple(sig.get() for sig in self._signals)
-        # We return a hash here, rather than the tuple, to always provide
-        # an ophyd-compatible datatype.
-        return hash(values)
+    _reducer_factory = SumReducer
+
+    def __init__(self, *, name, debounce: float = 0.0, **kwargs):
+        super().__init__(name=name, **kwargs)
+        self.debounce = debounce
+        self._pending_values = {}
+
+    def _reducer_input(self, signal: Signal, value: OphydDataType) -> int:
+        # Sum the per-signal hashes, so one update does not rehash the rest
+        return hash((signal.name, value))
+
+    def _reduced_readback(self, result: int) -> int:
+        # We return a hash here, rather than the sum, to always provide
+        # an ophyd-compatible (64-bit) integer.
+        return hash(result)
+
+    def _signal_value_callback(self, *, obj: Signal, **kwargs):
+        """Apply the update now, or hold it until the debounce expires."""
+        if self.debounce <= 0:
+            return super()._signal_value_callback(obj=obj, **kwargs)
+        with self._lock:
+            first_update = not self._pending_values
+            self._pending_values[obj] = kwargs['value']
+        if first_update:
+            utils.schedule_task(self._apply_pending_values,
+                                delay=self.debounce)
+
+    def _apply_pending_values(self) -> None:
+        """Apply all of the updates collected during the debounce."""
+        with self._lock:
+            values = self._pending_values
+            self._pending_values = {}
+            self._apply_values(values)
 
 
 class PVStateSignal(AggregateSignal):
@@ -590,7 +910,8 @@ class MultiDerivedSignal(AggregateSignal):
     calculate_on_get : MdsCalculationFunction
         A calculation function that takes in a dictionary of signals to values.
         It should be made to return a value of a compatible ophyd data type,
-        such as an integer, float, or an array.
+        such as an integer, float, or an array. Not needed for subclasses
+        that set ``_reducer_factory``, see `AggregateSignal`.
 
     calculate_on_put : MdsOnPutFunction
         A calculation function that allows this MultiDerivedSignal to be
@@ -623,14 +944,17 @@ class MultiDerivedSignal(AggregateSignal):
                 calculate_on_get, owner=self.parent
             )
         elif not hasattr(self, "calculate_on_get"):
-            raise ValueError(
-                "The `calculate_on_get` argument must be provided for "
-                "non-subclassed MultiDerivedSignal instances.  This function "
-                "should have the following signature: "
-                "calculate_on_get(mds, items) "
-                "where ``mds`` is this signal and ``items`` is a dictionary "
-                "of the source signal-to-values items."
-            )
+            if self._reducer is not None:
+                self.calculate_on_get = None
+            else:
+                raise ValueError(
+                    "The `calculate_on_get` argument must be provided for "
+                    "non-subclassed MultiDerivedSignal instances.  This function "
+                    "should have the following signature: "
+                    "calculate_on_get(mds, items) "
+                    "where ``mds`` is this signal and ``items`` is a dictionary "
+                    "of the source signal-to-values items."
+                )
 
         if calculate_on_put is not None:
             if isinstance(self, SignalRO):
@@ -712,6 +1036,8 @@ class MultiDerivedSignal(AggregateSignal):
 
     def _calc_readback(self) -> OphydDataType:
         """calculate_on_get the new readback value."""
+        if self._reducer is not None:
+            return super()._calc_readback()
         items = {sig: siginfo.value for sig, siginfo in self._signals.items()}
         return self.calculate_on_get(mds=self, items=items)
 
@@ -782,6 +1108,258 @@ class MultiDerivedSignalRO(SignalRO, MultiDerivedSignal):
     ...
 
 
+@dataclasses.dataclass(frozen=True)
+class RollingStatsSnapshot:
+    """The statistics of a `RollingStats` window at one moment."""
+    #: The number of non-NaN values in the window
+    count: int
+    mean: float
+    #: The population standard deviation
+    std: float
+    min: float
+    max: float
+    #: The time the snapshot was taken
+    timestamp: float
+    #: The values in the window, oldest first
+    values: np.ndarray = dataclasses.field(repr=False)
+
+    def percentile(self, q: float) -> float:
+        """The q-th percentile of the values, skipping NaN values."""
+        if not self.count:
+            return math.nan
+        return float(np.nanpercentile(self.values, q))
+
+
+class RollingStats:
+    """
+    Statistics over a rolling window of the most recent values.
+
+    The running mean, sum of squared deviations from the mean and count are
+    updated in O(1) with Welford's method as values enter and leave the
+    window, which stays precise for values on a large offset, and the
+    running minimum and maximum are
+    kept in monotonic queues, so adding a value never looks at the rest of
+    the window. NaN values take up space in the window, but are left out of
+    the statistics. Percentiles are calculated from the window on request.
+
+    Parameters
+    ----------
+    size : int, optional
+        The maximum number of values in the window.
+    duration : float, optional
+        The maximum age of the values in the window, in seconds, compared
+        using the timestamps passed to `add`.
+    """
+
+    def __init__(
+        self,
+        size: int | None = None,
+        duration: float | None = None,
+    ):
+        if size is None and duration is None:
+            raise ValueError('Provide a window size, duration, or both.')
+        self.size = size
+        self.duration = duration
+        self._lock = RLock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Empty the window."""
+        with self._lock:
+            # (sequence number, timestamp, value)
+            self._window = deque()
+            # (sequence number, value), increasing for min, decreasing for max
+            self._min = deque()
+            self._max = deque()
+            self._next_seq = 0
+            self._mean = 0.0
+            # Sum of squared deviations from the mean
+            self._m2 = 0.0
+            self._count = 0
+            self._evictions = 0
+
+    def add(self, value: float, timestamp: float | None = None) -> None:
+        """
+        Add a value to the window, removing the ones that fall out of it.
+
+        Parameters
+        ----------
+        value : float
+            The new value.
+        timestamp : float, optional
+            The time of the value, defaults to now.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        value = float(value)
+        with self._lock:
+            seq = self._next_seq
+            self._next_seq += 1
+            self._window.append((seq, timestamp, value))
+            if not math.isnan(value):
+                self._count += 1
+                delta = value - self._mean
+                self._mean += delta / self._count
+                self._m2 += delta * (value - self._mean)
+                while self._min and self._min[-1][1] >= value:
+                    self._min.pop()
+                self._min.append((seq, value))
+                while self._max and self._max[-1][1] <= value:
+                    self._max.pop()
+                self._max.append((seq, value))
+            self._expire(timestamp)
+
+    def extend(
+        self,
+        values: Iterable[float],
+        timestamps: Iterable[float] | None = None,
+    ) -> None:
+        """Add many values to the window, see `add`."""
+        with self._lock:
+            if timestamps is None:
+                now = time.time()
+                for value in values:
+                    self.add(value, now)
+            else:
+                for value, timestamp in zip(values, timestamps):
+                    self.add(value, timestamp)
+
+    def _expire(self, now: float | None = None) -> None:
+        """Remove the values that are too old, or over the size limit."""
+        window = self._window
+        size = self.size
+        duration = self.duration
+        if duration is not None and now is None:
+            now = time.time()
+        while window and (
+            (size is not None and len(window) > size)
+            or (duration is not None and now - window[0][1] > duration)
+        ):
+            seq, _, value = window.popleft()
+            self._evictions += 1
+            if math.isnan(value):
+                continue
+            self._count -= 1
+            if self._count:
+                delta = value - self._mean
+                self._mean -= delta / self._count
+                self._m2 -= delta * (value - self._mean)
+            else:
+                self._mean = self._m2 = 0.0
+            if self._min[0][0] == seq:
+                self._min.popleft()
+            if self._max[0][0] == seq:
+                self._max.popleft()
+        if self._evictions > len(window):
+            # Removing values leaves rounding errors, start over every so often
+            self._resum()
+
+    def _resum(self) -> None:
+        values = [value for _, _, value in self._window
+                  if not math.isnan(value)]
+        self._count = len(values)
+        self._mean = math.fsum(values) / self._count if values else 0.0
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in values)
+        self._evictions = 0
+
+    def _current(self) -> None:
+        """Drop expired values before reading a duration-limited window."""
+        if self.duration is not None:
+            self._expire()
+
+    def __len__(self) -> int:
+        return len(self._window)
+
+    @property
+    def count(self) -> int:
+        """The number of non-NaN values in the window."""
+        with self._lock:
+            self._current()
+            return self._count
+
+    @property
+    def mean(self) -> float:
+        """The mean of the values in the window."""
+        with self._lock:
+            self._current()
+            if not self._count:
+                return math.nan
+            return self._mean
+
+    @property
+    def std(self) -> float:
+        """The population standard deviation of the values in the window."""
+        with self._lock:
+            self._current()
+            if not self._count:
+                return math.nan
+            return math.sqrt(max(self._m2 / self._count, 0.0))
+
+    @property
+    def min(self) -> float:
+        """The smallest value in the window."""
+        with self._lock:
+            self._current()
+            return self._min[0][1] if self._min else math.nan
+
+    @property
+    def max(self) -> float:
+        """The largest value in the window."""
+        with self._lock:
+            self._current()
+            return self._max[0][1] if self._max else math.nan
+
+    @property
+    def values(self) -> np.ndarray:
+        """The values in the window, oldest first."""
+        with self._lock:
+            self._current()
+            return np.array([value for _, _, value in self._window],
+                            dtype=float)
+
+    @property
+    def added(self) -> int:
+        """The number of values added since the last reset."""
+        return self._next_seq
+
+    def ring_buffer(self, size: int) -> np.ndarray:
+        """
+        The values in the window, laid out in a ring buffer.
+
+        The n-th value added since the last reset is at index ``n % size``,
+        and the unfilled entries are NaN.
+
+        Parameters
+        ----------
+        size : int
+            The length of the ring buffer.
+        """
+        with self._lock:
+            values = self.values[-size:]
+            buffer = np.full(size, np.nan)
+            buffer[np.arange(self.added - len(values), self.added) % size] = (
+                values
+            )
+            return buffer
+
+    def percentile(self, q: float) -> float:
+        """The q-th percentile of the values in the window."""
+        return self.snapshot().percentile(q)
+
+    def snapshot(self) -> RollingStatsSnapshot:
+        """Get all of the statistics at once, from the same window."""
+        with self._lock:
+            return RollingStatsSnapshot(
+                count=self.count,
+                mean=self.mean,
+                std=self.std,
+                min=self.min,
+                max=self.max,
+                timestamp=time.time(),
+                values=self.values,
+            )
+
+
 class AvgSignal(Signal):
     """
     Signal that acts as a rolling average of another signal.
@@ -800,6 +1378,12 @@ class AvgSignal(Signal):
     Warning: this means that if we only have recieved ONE value, the mean will
     just be the mean of a single value!
 
+    The buffer is a `RollingStats` window, available as ``stats``, so each
+    update costs O(1). Other statistics of the same window can be added to
+    the parent device as `RollingStatSignal` components. ``trigger`` stores
+    a `RollingStatsSnapshot` of the window as ``last_snapshot`` when it
+    completes.
+
     Parameters
     ----------
     signal : Signal or str
@@ -816,6 +1400,16 @@ class AvgSignal(Signal):
         The number of seconds to wait before returning trigger complete. Nominally this
         should be set to averages divided by the expected update rate of the signal.
         If omitted, we will not reset the buffer or wait for values at scan points.
+
+    max_rate : float, optional
+        If provided, the values are collected and added to the buffer in
+        batches, updating the average at most this many times per second
+        instead of on every update. See `utils.CoalescingCallback`, which is
+        available as ``coalescer``.
+
+    window_duration : float, optional
+        If provided, values older than this many seconds are also left out
+        of the average.
     """
 
     def __init__(
@@ -826,6 +1420,8 @@ class AvgSignal(Signal):
         *,
         name: str,
         parent: Device | None = None,
+        max_rate: float | None = None,
+        window_duration: float | None = None,
         **kwargs,
     ):
         super().__init__(name=name, parent=parent, **kwargs)
@@ -833,9 +1429,18 @@ class AvgSignal(Signal):
             signal = getattr(parent, signal)
         self.raw_sig = signal
         self._lock = RLock()
+        self.stats = RollingStats(size=averages, duration=window_duration)
+        self.last_snapshot = None
         self.averages = averages
         self.duration = duration
-        self.raw_sig.subscribe(self._update_avg)
+        if max_rate is None:
+            self.coalescer = None
+            self.raw_sig.subscribe(self._update_avg)
+        else:
+            self.coalescer = utils.CoalescingCallback(
+                self._update_avg_batch, max_rate=max_rate, batch=True,
+            )
+            self.raw_sig.subscribe(self.coalescer)
 
     @property
     def connected(self) -> bool:
@@ -850,32 +1455,58 @@ class AvgSignal(Signal):
     def averages(self, avg: int) -> None:
         """Change the buffer size and reinitialize an empty buffer."""
         self._avg = avg
+        self.stats.size = avg
         self.reset_buffer()
 
+    @property
+    def values(self) -> np.ndarray:
+        """
+        The buffer of ``averages`` values, NaN where not filled yet.
+
+        This is a ring buffer, the next value goes in at ``index``. It is a
+        copy, use ``stats.values`` for the values oldest first.
+        """
+        return self.stats.ring_buffer(self._avg)
+
+    @property
+    def index(self) -> int:
+        """The index in ``values`` where the next value goes in."""
+        return self.stats.added % self._avg
+
     def reset_buffer(self) -> None:
         """Re-initialize the avg signal buffer."""
-        with self._lock:
-            self.index = 0
-            # Allocate uninitalized array
-            self.values = np.empty(self._avg)
-            # Fill with nan
-            self.values.fill(np.nan)
+        self.stats.reset()
 
-    def _update_avg(self, *args, value: float, **kwargs) -> None:
+    def _update_avg(
+        self, *args, value: float, timestamp: float | None = None, **kwargs
+    ) -> None:
         """Add new value to the buffer, overriding old values if needed."""
         with self._lock:
-            self.values[self.index] = value
-            self.index = (self.index + 1) % len(self.values)
-            # This takes a mean, skipping nan values.
-            self.put(np.nanmean(self.values))
+            self.stats.add(value, timestamp)
+            # This is the mean, skipping nan values.
+            self.put(self.stats.mean)
+
+    def _update_avg_batch(self, updates: list[dict[str, Any]]) -> None:
+        """Add a batch of new values to the buffer at once."""
+        with self._lock:
+            self.stats.extend(
+                (update['value'] for update in updates),
+                (update.get('timestamp') for update in updates),
+            )
+            self.put(self.stats.mean)
+
+    def _take_snapshot(self, status: Status | None = None) -> None:
+        self.last_snapshot = self.stats.snapshot()
 
     def trigger(self) -> Status:
         if self.duration is None:
+            self._take_snapshot()
             return super().trigger()
         # reset the averaging buffer
         self.reset_buffer()
         # set status to complete after duration
         status = Status(obj=self, settle_time=self.duration)
+        status.add_callback(self._take_snapshot)
         status.set_finished()
         return status
 
@@ -906,6 +1537,54 @@ class InternalSignal(SignalRO):
         return Signal.set(self, value, timestamp=timestamp, force=force)
 
 
+class RollingStatSignal(InternalSignal):
+    """
+    One statistic of the window of an `AvgSignal`, updated along with it.
+
+    Parameters
+    ----------
+    avg_signal : AvgSignal or str
+        The `AvgSignal`, or the attr name of one of the parent's components.
+    stat : str or float
+        One of ``'mean'``, ``'std'``, ``'min'``, ``'max'`` or ``'count'``,
+        or a number for that percentile.
+    """
+
+    valid_stats = ('mean', 'std', 'min', 'max', 'count')
+
+    def __init__(
+        self,
+        avg_signal: AvgSignal | str,
+        stat: str | float = 'std',
+        *,
+        name: str,
+        parent: Device | None = None,
+        **kwargs,
+    ):
+        super().__init__(name=name, parent=parent, **kwargs)
+        if isinstance(avg_signal, str):
+            avg_signal = getattr(parent, avg_signal)
+        if isinstance(stat, str) and stat not in self.valid_stats:
+            raise ValueError(
+                f'{stat} is not one of {self.valid_stats} or a percentile.'
+            )
+        self.avg_signal = avg_signal
+        self.stat = stat
+        self.avg_signal.subscribe(self._stat_update, run=False)
+
+    @property
+    def connected(self) -> bool:
+        return self.avg_signal.connected
+
+    def _stat_update(self, *args, **kwargs) -> None:
+        stats = self.avg_signal.stats
+        if isinstance(self.stat, str):
+            value = getattr(stats, self.stat)
+        else:
+            value = stats.percentile(self.stat)
+        self.put(value, force=True)
+
+
 class _OptionalEpicsSignal(Signal):
     """
     An EPICS Signal which may or may not exist.
@@ -1347,6 +2026,14 @@ class EpicsSignalBaseEditMD(EpicsSignalBase, SignalEditMD):
         instance.  Attribute names may be ``None`` in the case where the
         original enum string should be passed through.
 
+    lazy_enum_attrs : bool, optional
+        If True, do not connect to the ``enum_attrs`` signals until the enum
+        strings are first needed: on access of ``enum_strs``, on
+        ``describe()``, or on a string ``put``.  Until then, the original
+        EPICS enum strings are used and the connection status does not wait
+        on the ``enum_attrs`` signals.  Defaults to the class attribute of
+        the same name, which is False.
+
     See Also
     ---------
     `ophyd.signal.EpicsSignal` for further parameter information.
@@ -1360,21 +2047,34 @@ class EpicsSignalBaseEditMD(EpicsSignalBase, SignalEditMD):
     _enum_subscriptions: dict[ophyd.ophydobj.OphydObject, int]
     _pending_signals: set[ophyd.ophydobj.OphydObject]
     _sent_first_md_callbacks: bool
+    _enum_attrs_resolved: threading.Event
+    _enum_attrs_lock: threading.Lock
+
+    # Set to True to defer connecting to enum_attrs for all signals
+    lazy_enum_attrs: bool = False
+    # Seconds to wait for the enum_attrs signals when resolving lazily
+    enum_attrs_timeout: float = 2.0
 
     def __init__(
         self,
         *args,
         enum_attrs: Optional[list[Optional[str]]] = None,
         enum_strs: Optional[list[str]] = None,
+        lazy_enum_attrs: Optional[bool] = None,
         parent: Optional[ophyd.ophydobj.OphydObject] = None,
         name: Optional[str] = None,
         **kwargs
     ):
         self._enum_attrs = list(enum_attrs or [])
+        if lazy_enum_attrs is not None:
+            self.lazy_enum_attrs = lazy_enum_attrs
+        self._enum_attrs_resolved = threading.Event()
+        self._enum_attrs_lock = threading.Lock()
         self._pending_signals = set()
         self._original_enum_strings = []
         self._enum_signals = []
         self._enum_subscriptions = {}
+        self._enum_attrs_subscribed = False
         self._enum_count = 0
         self._metadata_override = {}
         self._sent_first_md_callbacks = False
@@ -1409,7 +2109,7 @@ class EpicsSignalBaseEditMD(EpicsSignalBase, SignalEditMD):
 
         super().__init__(*args, parent=parent, name=name, **kwargs)
 
-        if enum_attrs:
+        if enum_attrs and not self.lazy_enum_attrs:
             # NOTE: Ensure that subscriptions happen only after everything
             # else is already configured.
             self._subscribe_enum_attrs()
@@ -1423,6 +2123,8 @@ class EpicsSignalBaseEditMD(EpicsSignalBase, SignalEditMD):
 
     def _subscribe_enum_attrs(self):
         """Subscribe to enum signals by attribute name."""
+        self._enum_attrs_subscribed = True
+        self._enum_attrs_resolved.clear()
         for attr in self.enum_attrs:
             if attr is None:
                 # Opt-out for a specific signal
@@ -1444,9 +2146,45 @@ class EpicsSignalBaseEditMD(EpicsSignalBase, SignalEditMD):
                 )
             self._enum_signals.append(obj)
             self._pending_signals.add(obj)
+        # All of the signals are created above before any of them are
+        # subscribed to, so that their connections are made in parallel.
+        for obj in list(self._pending_signals):
             self._enum_subscriptions[obj] = obj.subscribe(
                 self._enum_string_updated, run=True
             )
+        if not self._pending_signals:
+            self._enum_attrs_resolved.set()
+
+    def resolve_enum_strs(self, timeout: Optional[float] = None) -> None:
+        """
+        Fetch the enum strings from the ``enum_attrs`` signals.
+
+        This only does anything for ``lazy_enum_attrs`` signals, which call
+        this automatically when the enum strings are needed.  All of the
+        signals are requested together and the results are kept up to date
+        by monitors afterwards, so only the first call waits.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum number of seconds to wait for the strings.  Defaults to
+            ``enum_attrs_timeout``.  Any strings that are still missing
+            afterwards keep their original EPICS value.
+        """
+        if not (self.lazy_enum_attrs and self._enum_attrs):
+            return
+        with self._enum_attrs_lock:
+            # Check the flag rather than the subscriptions, as enum_attrs
+            # made up of only None entries never subscribe to anything
+            if not self._enum_attrs_subscribed and not self._destroyed:
+                self._subscribe_enum_attrs()
+        if timeout is None:
+            timeout = self.enum_attrs_timeout
+        if not self._enum_attrs_resolved.wait(timeout):
+            self.log.warning(
+                "Timed out waiting for %d enum strings of %s",
+                len(self._pending_signals), self.name,
+            )
 
     # Switch out _metadata for metadata where appropriate
     @property
@@ -1462,6 +2200,7 @@ class EpicsSignalBaseEditMD(EpicsSignalBase, SignalEditMD):
         3. The user-provided strings in ``enum_strs``.
         """
         if self._enum_string_override:
+            self.resolve_enum_strs()
             return list(self._enum_strings)[:self._enum_count]
         return self.metadata['enum_strs']
 
@@ -1491,6 +2230,12 @@ class EpicsSignalBaseEditMD(EpicsSignalBase, SignalEditMD):
         desc[self.name]['units'] = self.metadata['units']
         return desc
 
+    def check_value(self, value, **kwargs):
+        """Check a value before putting, resolving lazy enums for strings."""
+        if isinstance(value, str):
+            self.resolve_enum_strs()
+        return super().check_value(value, **kwargs)
+
     @property
     def enum_attrs(self) -> list[str]:
         """Enum attribute names - the source of each enum string."""
@@ -1546,6 +2291,7 @@ class EpicsSignalBaseEditMD(EpicsSignalBase, SignalEditMD):
 
         if not self._pending_signals:
             # We're probably connected!
+            self._enum_attrs_resolved.set()
             self._run_metadata_callbacks()
 
     @property
@@ -1554,7 +2300,7 @@ class EpicsSignalBaseEditMD(EpicsSignalBase, SignalEditMD):
         return (
             self._metadata["connected"]
             and not self._destroyed
-            and not len(self._pending_signals)
+            and (self.lazy_enum_attrs or not len(self._pending_signals))
         )
 
     def _check_signal_metadata(self):
@@ -1639,6 +2385,7 @@ class FakeEpicsSignalEditMD(SignalEditMD, FakeEpicsSignal):
         *args,
         enum_attrs: Optional[list[Optional[str]]] = None,
         enum_strs: Optional[list[str]] = None,
+        lazy_enum_attrs: Optional[bool] = None,
         **kwargs
     ):
         super().__init__(*args, **kwargs)
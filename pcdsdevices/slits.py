@@ -24,7 +24,6 @@ from ophyd.ophydobj import OphydObject
 from ophyd.pv_positioner import PVPositioner
 from ophyd.signal import Signal, SignalRO
 from ophyd.status import Status
-from ophyd.status import wait as status_wait
 
 from .analog_signals import FDQ
 from .areadetector.detectors import PCDSAreaDetectorTyphosTrigger
@@ -36,6 +35,7 @@ from .epics_motor import (BeckhoffAxis, BeckhoffAxisNoOffset, EpicsMotor,
 from .interface import (BaseInterface, FltMvInterface, LightpathInOutCptMixin,
                         LightpathMixin, MvInterface)
 from .pmps import TwinCATStatePMPS
+from .positioner import coordinated_move
 from .sensors import RTD, TwinCATTempSensor
 from .signal import PytmcSignal
 from .sim import FastMotor
@@ -159,8 +159,8 @@ class SlitsBase(MvInterface, GroupDevice, LightpathMixin):
 
         Returns
         -------
-        status : AndStatus
-            Logical combination of the request to both horizontal and vertical
+        status : SetManyStatus
+            Combined status of the request to both horizontal and vertical
             motors.
         """
 
@@ -175,22 +175,14 @@ class SlitsBase(MvInterface, GroupDevice, LightpathMixin):
             (width, height) = width
         elif height is None:
             height = width
-        # Instruct both width and height then combine the output status
-        x_stat = self.xwidth.move(width, wait=False, timeout=timeout)
-        y_stat = self.ywidth.move(height, wait=False, timeout=timeout)
-        status = x_stat & y_stat
-        # Add our callback if one was given
-        if moved_cb is not None:
-            status.add_callback(moved_cb)
-        # Wait if instructed to do so. Stop the motors if interrupted
-        if wait:
-            try:
-                status_wait(status)
-            except KeyboardInterrupt:
-                self.xwidth.stop()
-                self.ywidth.stop()
-                raise
-        return status
+        # Instruct both width and height with one combined status. Stop the
+        # motors if interrupted while waiting
+        return coordinated_move(
+            {self.xwidth: width, self.ywidth: height},
+            timeout=timeout,
+            moved_cb=moved_cb,
+            wait=wait,
+        )
 
     def __call__(self, width=None, height=None):
         """
@@ -20,8 +20,8 @@ from ophyd.device import Component as Cpt
 from ophyd.device import Device
 from ophyd.device import FormattedComponent as FCpt
 from ophyd.signal import EpicsSignal, EpicsSignalRO
-from ophyd.status import wait as status_wait
 
+from pcdsdevices.positioner import coordinated_move
 from pcdsdevices.pv_positioner import PVPositionerIsClose
 
 logger = logging.getLogger(__name__)
@@ -227,46 +227,30 @@ class SmarPod(Device):
         wait: bool = True,
         timeout: float = 30.0,
     ):
-        x_sp = self.x.readback.get() if x_sp is None else x_sp
-        y_sp = self.y.readback.get() if y_sp is None else y_sp
-        z_sp = self.z.readback.get() if z_sp is None else z_sp
-        rx_sp = self.rx.readback.get() if rx_sp is None else rx_sp
-        ry_sp = self.ry.readback.get() if ry_sp is None else ry_sp
-        rz_sp = self.rz.readback.get() if rz_sp is None else rz_sp
-
-        self.x.defer_motion = True
-        self.y.defer_motion = True
-        self.z.defer_motion = True
-        self.rx.defer_motion = True
-        self.ry.defer_motion = True
-        self.rz.defer_motion = True
-
-        self.x.setpoint.put(x_sp)
-        self.y.setpoint.put(y_sp)
-        self.z.setpoint.put(z_sp)
-        self.rx.setpoint.put(rx_sp)
-        self.ry.setpoint.put(ry_sp)
-        self.rz.setpoint.put(rz_sp)
-
-        x_status = self.x.move(x_sp, wait=False, timeout=timeout)
-        y_status = self.y.move(y_sp, wait=False, timeout=timeout)
-        z_status = self.z.move(z_sp, wait=False, timeout=timeout)
-        rx_status = self.rx.move(rx_sp, wait=False, timeout=timeout)
-        ry_status = self.ry.move(ry_sp, wait=False, timeout=timeout)
-        rz_status = self.rz.move(rz_sp, wait=False, timeout=timeout)
-
-        self.cmd_move.put(0)
-
-        status = x_status & y_status & z_status & rx_status & \
-            ry_status & rz_status
-        if wait:
-            status_wait(status)
-
-        self.x.defer_motion = False
-        self.y.defer_motion = False
-        self.z.defer_motion = False
-        self.rx.defer_motion = False
-        self.ry.defer_motion = False
-        self.rz.defer_motion = False
-
-        return status
+        """
+        Move to a full pose with a single move command.
+
+        All six setpoints are written before any axis checks that the pose
+        is reachable, and ``cmd_move`` then starts the motion once. Any axis
+        left as `None` is held at its current readback.
+        """
+        setpoints = {
+            self.x: x_sp,
+            self.y: y_sp,
+            self.z: z_sp,
+            self.rx: rx_sp,
+            self.ry: ry_sp,
+            self.rz: rz_sp,
+        }
+        targets = {
+            axis: axis.readback.get() if setpoint is None else setpoint
+            for axis, setpoint in setpoints.items()
+        }
+        return coordinated_move(
+            targets,
+            go_signal=self.cmd_move,
+            go_value=0,
+            preset={axis.setpoint: target for axis, target in targets.items()},
+            timeout=timeout,
+            wait=wait,
+        )
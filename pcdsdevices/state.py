@@ -23,7 +23,7 @@ from .interface import MvInterface
 from .signal import (EpicsSignalEditMD, MultiDerivedSignal, PVStateSignal,
                      PytmcSignal)
 from .type_hints import SignalToValue
-from .utils import HelpfulIntEnum
+from .utils import HelpfulIntEnum, dynamic_class_cache
 from .variety import set_metadata
 
 logger = logging.getLogger(__name__)
@@ -82,6 +82,9 @@ class StatePositioner(MvInterface, Device, PositionerBase):
 
     egu = 'state'
 
+    # The enum strings our states_list was built from, if any
+    _states_enum_strs: tuple[str, ...] | None = None
+
     def __init__(self, prefix, *, name, **kwargs):
         if self.__class__ is StatePositioner:
             raise TypeError('StatePositioner must be subclassed with at least a state signal')
@@ -115,13 +118,31 @@ class StatePositioner(MvInterface, Device, PositionerBase):
         enum_strs: list[str] | None = None,
         **kwargs
     ):
-        if enum_strs is not None and not self.states_list:
+        if enum_strs is None:
+            return
+        if not self.states_list:
             self.states_list = list(enum_strs)
             # Unknown state reserved for slot zero, automatically added later
             # Removing and auto re-adding *feels* silly, but it was easy to do
             if self._unknown:
                 self.states_list.pop(0)
             self._state_init()
+            self._states_enum_strs = tuple(enum_strs)
+        elif (
+            self._states_enum_strs is not None
+            and tuple(enum_strs) != self._states_enum_strs
+        ):
+            # Our states came from enum strings that have since been updated,
+            # e.g. by a lazy_enum_attrs signal resolving its state names
+            states_list = list(enum_strs)
+            if self._unknown:
+                states_list[0] = self._unknown
+            self.states_list = states_list
+            self._valid_states = [state for state in self.states_list
+                                  if state not in self._invalid_states
+                                  and state is not None]
+            self.states_enum = self._create_states_enum()
+            self._states_enum_strs = tuple(enum_strs)
 
     def move(self, position, moved_cb=None, timeout=None, wait=False):
         """
@@ -259,6 +280,17 @@ class StatePositioner(MvInterface, Device, PositionerBase):
         if isinstance(value, str) and value.isdigit():
             value = int(value)
 
+        if (
+            isinstance(value, str)
+            and getattr(self.state, 'lazy_enum_attrs', False)
+            and self.state.connected
+        ):
+            # State names may not be known until they are fetched
+            self.state.resolve_enum_strs()
+            self._late_state_init(
+                enum_strs=self.state.metadata.get('enum_strs')
+            )
+
         try:
             return self.states_enum.from_any(value)
         except ValueError:
@@ -290,7 +322,22 @@ class StatePositioner(MvInterface, Device, PositionerBase):
         """
         Create an enum that can be used to keep track of aliases, state names,
         and integer enum values.
+
+        Positioners of the same class with the same states and aliases share
+        one enum class from :data:`~pcdsdevices.utils.dynamic_class_cache`.
         """
+        aliases = tuple(
+            (state, alias if isinstance(alias, str) else tuple(alias))
+            for state, alias in self._states_alias.items()
+        )
+        return dynamic_class_cache.get_or_create(
+            (HelpfulIntEnum, self.__class__.__name__ + 'States',
+             tuple(self.states_list), aliases),
+            self._make_states_enum,
+        )
+
+    def _make_states_enum(self):
+        """Build a new enum for `_create_states_enum`."""
         state_def = {}
         state_count = 0
         for i, state in enumerate(self.states_list):
@@ -522,15 +569,12 @@ class TwinCATStateConfigDynamic(Device):
     This will become an instance with a number of config states based on the
     input "state_count" and "motor_count" keyword-only required arguments.
 
-    Under the hood, this creates classes dynamically and stores them for later
-    use. Classes created here will pass an
-    isinstance(cls, TwinCATStateConfigDynamic) check, and two devices with
-    the same number of states and motors will use the same class from the
-    registry.
+    Under the hood, this creates classes dynamically and stores them in
+    :data:`~pcdsdevices.utils.dynamic_class_cache` for later use. Classes
+    created here will pass an isinstance(cls, TwinCATStateConfigDynamic)
+    check, and two devices with the same number of states and motors will
+    use the same class from the cache.
     """
-    _state_config_registry: ClassVar[
-        dict[tuple[int, int], TwinCATStateConfigDynamic]
-    ] = {}
     _config_cls: ClassVar[type] = TwinCATStateConfigOne
     _class_prefix: ClassVar[str] = 'StateConfig'
 
@@ -542,46 +586,51 @@ class TwinCATStateConfigDynamic(Device):
         motor_count: int,
         **kwargs
     ):
-        try:
-            # Check if the dynamic class already exists
-            new_cls = cls._state_config_registry[(state_count, motor_count)]
-        except KeyError:
-            # Commit to making a new class
-            cls_name = f'{cls._class_prefix}m{motor_count}s{state_count}'
-            if motor_count == 1:
-                # Backwards compatibility with existing 1d states: no motor count
-                new_cls = type(
-                    cls_name,
-                    (cls,),
-                    {
-                        get_dynamic_state_attr(state_index=snum):
-                        Cpt(
-                            cls._config_cls,
-                            f':{snum:02}',
-                            kind='config',
-                        )
-                        for snum in range(1, state_count + 1)
-                    }
-                )
-            else:
-                # More than one motor: must include motor count in cpt name
-                new_cls = type(
-                    cls_name,
-                    (cls,),
-                    {
-                        get_dynamic_state_attr(state_index=snum, motor_index=mnum):
-                        Cpt(
-                            cls._config_cls,
-                            f':M{mnum}:{snum:02}',
-                            kind='config',
-                        )
-                        for snum in range(1, state_count + 1)
-                        for mnum in range(1, motor_count + 1)
-                    }
-                )
-            cls._state_config_registry[state_count] = new_cls
+        new_cls = dynamic_class_cache.get_or_create(
+            (cls, state_count, motor_count),
+            functools.partial(
+                cls._make_dynamic_class,
+                state_count=state_count,
+                motor_count=motor_count,
+            ),
+        )
         return super().__new__(new_cls)
 
+    @classmethod
+    def _make_dynamic_class(cls, state_count: int, motor_count: int) -> type:
+        """Create the subclass with the requested state and motor counts."""
+        cls_name = f'{cls._class_prefix}m{motor_count}s{state_count}'
+        if motor_count == 1:
+            # Backwards compatibility with existing 1d states: no motor count
+            return type(
+                cls_name,
+                (cls,),
+                {
+                    get_dynamic_state_attr(state_index=snum):
+                    Cpt(
+                        cls._config_cls,
+                        f':{snum:02}',
+                        kind='config',
+                    )
+                    for snum in range(1, state_count + 1)
+                }
+            )
+        # More than one motor: must include motor count in cpt name
+        return type(
+            cls_name,
+            (cls,),
+            {
+                get_dynamic_state_attr(state_index=snum, motor_index=mnum):
+                Cpt(
+                    cls._config_cls,
+                    f':M{mnum}:{snum:02}',
+                    kind='config',
+                )
+                for snum in range(1, state_count + 1)
+                for mnum in range(1, motor_count + 1)
+            }
+        )
+
     def __init__(self, *args, state_count, motor_count, **kwargs):
         # These are unused, but can't be allowed to pass into **kwargs
         self.state_count = state_count
@@ -595,9 +644,6 @@ class FakeTwinCATStateConfigDynamic(TwinCATStateConfigDynamic):
 
     Useful in test suites.
     """
-    _state_config_registry: ClassVar[
-        dict[int, FakeTwinCATStateConfigDynamic]
-    ] = {}
     _config_cls: ClassVar[type] = make_fake_device(TwinCATStateConfigOne)
     _class_prefix: ClassVar[str] = 'FakeStateConfig'
 
@@ -4,8 +4,8 @@ Module for common target stage stack configurations.
 import json
 import logging
 import os
+import threading
 from datetime import datetime
-from itertools import chain
 
 import jsonschema
 import numpy as np
@@ -15,6 +15,7 @@ from ophyd.device import Device
 from pcdsdevices.epics_motor import _GetMotorClass
 
 from .interface import tweak_base
+from .utils import dynamic_class_cache
 
 logger = logging.getLogger(__name__)
 
@@ -56,9 +57,14 @@ def StageStack(mdict, name):
             logger.warning("Unrecognized input {}. "
                            "Skipping axis {}.".format(mitem, mname))
     cls_name = name + '_StageStack'
-    cls = type(cls_name, (object,), cpts)
+    cls = dynamic_class_cache.get_or_create(
+        (StageStack, cls_name, tuple(cpts)),
+        lambda: type(cls_name, (object,), {'__slots__': tuple(cpts)}),
+    )
 
     dev = cls()
+    for mname, cpt in cpts.items():
+        setattr(dev, mname, cpt)
 
     return dev
 
@@ -271,6 +277,331 @@ class XYTargetGrid():
         self.y.mv(ypos, wait=wait)
 
 
+class SampleGridStore:
+    """
+    The targets of one saved sample grid, and which of them have been shot.
+
+    The sample's yaml file is read once and the shot status of every target
+    is kept in memory. Status changes are appended to a journal file next to
+    the yaml file instead of rewriting it, and are folded back into the yaml
+    file by `compact`, so the yaml schema is unchanged. Once
+    ``compact_every`` changes have accumulated the compaction runs in a
+    background thread so that the shot loop does not wait on it, and
+    `close` compacts whatever is left. `XYGridStage.get_sample_data`
+    applies any journaled changes that have not been compacted yet.
+
+    Targets are looked up by grid point: the m, n grid is computed from the
+    sample's coefficients and each grid point is matched to the saved target
+    with the same x position, so both snake-like and row-by-row files work.
+
+    Parameters
+    ----------
+    path : str
+        Path to the sample's yaml file.
+    sample_name : str
+        The name of the sample in the file.
+    """
+    journal_suffix = '.shots'
+    # The journal is moved here while it is being compacted
+    compacting_suffix = '.shots.compacting'
+    # Number of journal entries that triggers a background compaction
+    compact_every = 1000
+    # Maximum x distance between a saved target and its grid point
+    match_tolerance = 1e-6
+
+    def __init__(self, path, sample_name):
+        self.path = str(path)
+        self.sample_name = str(sample_name)
+        self.journal_path = self.path + self.journal_suffix
+        self.compacting_path = self.path + self.compacting_suffix
+        self._lock = threading.RLock()
+        self._compact_lock = threading.Lock()
+        self._compact_thread = None
+        self._load()
+
+    @classmethod
+    def has_journal(cls, path):
+        """True if the yaml file at path has status changes to apply."""
+        return any(os.path.exists(str(path) + suffix)
+                   for suffix in (cls.compacting_suffix, cls.journal_suffix))
+
+    def _load(self):
+        with open(self.path) as sample_file:
+            data = yaml.safe_load(sample_file) or {}
+        try:
+            sample = data[self.sample_name]
+        except KeyError:
+            raise ValueError('Could not find this sample name in the file:'
+                             f' {self.sample_name}') from None
+        self._data = data
+        self._mtime = os.stat(self.path).st_mtime_ns
+        xx = sample.get('xx') or []
+        yy = sample.get('yy') or []
+        self.x_positions = np.array([d['pos'] for d in xx], dtype=float)
+        self.y_positions = np.array([d['pos'] for d in yy], dtype=float)
+        self.shot = np.array([bool(d['status']) for d in xx], dtype=bool)
+        self.m_points = int(sample.get('M') or 0)
+        self.n_points = int(sample.get('N') or 0)
+        self.coefficients = list(sample.get('coefficients') or [])
+        self._grid_tree = None
+        self._grid_index = None
+        self.grid = None
+        self._journal_entries = 0
+        self._replay_journal()
+
+    def _replay_journal(self):
+        """Apply the status changes that have not been compacted yet."""
+        # A compaction that was interrupted leaves its journal behind, and
+        # it is older than the current one
+        for journal_path in (self.compacting_path, self.journal_path):
+            self._replay_journal_file(journal_path)
+
+    def _replay_journal_file(self, journal_path):
+        try:
+            with open(journal_path) as journal:
+                lines = journal.read().splitlines(keepends=True)
+        except FileNotFoundError:
+            return
+        for line in lines:
+            if not line.endswith('\n'):
+                # Torn final write, ignore it
+                break
+            try:
+                index, status = (int(value) for value in line.split())
+                self.shot[index] = bool(status)
+            except (ValueError, IndexError):
+                logger.warning('Skipping bad line in %s: %r',
+                               journal_path, line)
+                continue
+            self._journal_entries += 1
+
+    def is_stale(self):
+        """True if the yaml file has been rewritten by someone else."""
+        with self._lock:
+            try:
+                return os.stat(self.path).st_mtime_ns != self._mtime
+            except FileNotFoundError:
+                return True
+
+    def _build_grid(self):
+        """Compute the grid points and match the saved targets to them."""
+        if self._grid_tree is not None:
+            return
+        from scipy.spatial import cKDTree
+
+        if len(self.coefficients) != 8 or not self.m_points * self.n_points:
+            raise ValueError(f'Sample {self.sample_name} does not have its '
+                             'M, N and coefficients saved.')
+        self.grid = map_grid(self.coefficients[:4], self.coefficients[4:],
+                             self.m_points, self.n_points)
+        self._grid_tree = cKDTree(self.grid.reshape(-1, 2))
+        # Flat (m, n) grid index -> index in the file, or -1 if not saved
+        self._grid_index = np.full(self.m_points * self.n_points, -1,
+                                   dtype=int)
+        if len(self.x_positions):
+            # Match each grid point to the saved target at the same (x, y)
+            saved = cKDTree(np.column_stack([self.x_positions,
+                                             self.y_positions]))
+            distance, nearest = saved.query(
+                self.grid.reshape(-1, 2),
+                distance_upper_bound=self.match_tolerance,
+            )
+            matched = np.isfinite(distance)
+            self._grid_index[matched] = nearest[matched]
+
+    def index(self, m, n):
+        """
+        Get the index of the target at row m, column n in the file.
+
+        Parameters
+        ----------
+        m : int
+            The row, starting at 1.
+        n : int
+            The column, starting at 1.
+
+        Returns
+        -------
+        index : int
+            The index in the file's ``xx`` and ``yy`` lists, or -1 if this
+            target was not saved.
+        """
+        if not (1 <= m <= self.m_points and 1 <= n <= self.n_points):
+            raise IndexError('Index out of range, make sure the m and n values'
+                             f' are between (1, 1) and '
+                             f'({self.m_points, self.n_points})')
+        self._build_grid()
+        return int(self._grid_index[(m - 1) * self.n_points + n - 1])
+
+    def is_target_shot(self, m, n):
+        """
+        Check if the target at row m, column n has been shot.
+
+        Returns
+        -------
+        is_shot : bool or None
+            None if this target was not saved.
+        """
+        index = self.index(m, n)
+        if index < 0:
+            return None
+        return bool(self.shot[index])
+
+    def shot_mask(self):
+        """
+        Get the shot status of every grid point.
+
+        Returns
+        -------
+        mask : np.ndarray
+            Boolean array of shape (M, N), `True` where the target has been
+            shot. Targets that were not saved count as not shot.
+        """
+        self._build_grid()
+        saved = self._grid_index >= 0
+        mask = np.zeros(self._grid_index.shape, dtype=bool)
+        mask[saved] = self.shot[self._grid_index[saved]]
+        return mask.reshape(self.m_points, self.n_points)
+
+    def set_status(self, m, n, status):
+        """
+        Set the status of the target at row m, column n.
+
+        Parameters
+        ----------
+        m : int
+            The row, starting at 1.
+        n : int
+            The column, starting at 1.
+        status : bool
+            `True` if the target has been shot.
+        """
+        index = self.index(m, n)
+        if index < 0:
+            raise IndexError(f'Target {m, n} was not saved for sample '
+                             f'{self.sample_name}.')
+        with self._lock:
+            self.shot[index] = status
+            with open(self.journal_path, 'a') as journal:
+                journal.write(f'{index} {int(status)}\n')
+            self._journal_entries += 1
+            if self._journal_entries >= self.compact_every:
+                self.compact(wait=False)
+
+    def reset(self):
+        """Mark all the targets as not shot."""
+        with self._lock:
+            self.shot[:] = False
+            self.compact()
+
+    def nearest(self, x, y):
+        """
+        Get the grid point closest to a position.
+
+        Parameters
+        ----------
+        x, y : float
+            The x and y motor positions.
+
+        Returns
+        -------
+        m, n : tuple of int
+            The row and column of the closest grid point, starting at 1.
+        """
+        self._build_grid()
+        _, flat_index = self._grid_tree.query((x, y))
+        m, n = divmod(int(flat_index), self.n_points)
+        return m + 1, n + 1
+
+    def apply(self, sample):
+        """
+        Write the current statuses into a sample dictionary from the file.
+
+        Parameters
+        ----------
+        sample : dict
+            The sample's data, with ``xx`` and ``yy`` lists.
+        """
+        self._apply(sample, self.shot)
+
+    @staticmethod
+    def _apply(sample, shot):
+        for key in ('xx', 'yy'):
+            for target, status in zip(sample.get(key) or [], shot):
+                target['status'] = bool(status)
+
+    def compact(self, wait=True):
+        """
+        Rewrite the yaml file with the current statuses, and clear the journal.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            If `False`, compact in a background thread and return right
+            away. Nothing is done if a background compaction is already
+            running.
+        """
+        if wait:
+            self._compact()
+            return
+        with self._lock:
+            thread = self._compact_thread
+            if thread is not None and thread.is_alive():
+                return
+            self._compact_thread = threading.Thread(
+                target=self._compact, daemon=True,
+                name=f'compact_{self.sample_name}',
+            )
+            self._compact_thread.start()
+
+    def _compact(self):
+        with self._compact_lock:
+            with self._lock:
+                # Statuses set from here on go to a new journal, and are
+                # kept if the rewrite below fails
+                shot = self.shot.copy()
+                self._rotate_journal()
+                self._journal_entries = 0
+            self._apply(self._data[self.sample_name], shot)
+            temp_path = self.path + '.tmp'
+            with open(temp_path, 'w') as sample_file:
+                yaml.safe_dump(self._data, sample_file,
+                               sort_keys=False, default_flow_style=False)
+            with self._lock:
+                os.replace(temp_path, self.path)
+                self._mtime = os.stat(self.path).st_mtime_ns
+                try:
+                    os.remove(self.compacting_path)
+                except FileNotFoundError:
+                    pass
+
+    def _rotate_journal(self):
+        """Move the journal aside for compaction."""
+        if not os.path.exists(self.compacting_path):
+            try:
+                os.replace(self.journal_path, self.compacting_path)
+            except FileNotFoundError:
+                pass
+            return
+        # Left behind by an interrupted compaction, keep its entries first
+        try:
+            with open(self.journal_path) as journal:
+                entries = journal.read()
+        except FileNotFoundError:
+            return
+        with open(self.compacting_path, 'a') as compacting:
+            compacting.write(entries)
+        os.remove(self.journal_path)
+
+    def close(self):
+        """Wait for any background compaction, then compact what is left."""
+        thread = self._compact_thread
+        if thread is not None:
+            thread.join()
+        if self.has_journal(self.path):
+            self._compact()
+
+
 class XYGridStage():
     """
     Class that helps support multiple samples on a mount for an XY Grid setup.
@@ -335,6 +666,7 @@ class XYGridStage():
         self._current_sample = ''
         self._positions_x = []
         self._positions_y = []
+        self._stores = {}
 
     @property
     def m_n_points(self):
@@ -592,10 +924,66 @@ class XYGridStage():
         path = path or self._path
         with os.scandir(path) as entries:
             for entry in entries:
-                if entry.is_file():
-                    samples.append(entry.name.split('.yml')[0])
+                if entry.is_file() and entry.name.endswith('.yml'):
+                    samples.append(entry.name[:-len('.yml')])
         return samples
 
+    def get_sample_store(self, sample_name=None, path=None):
+        """
+        Get the `SampleGridStore` for a saved sample.
+
+        The store is kept between calls and reloaded if the sample's file
+        is rewritten.
+
+        Parameters
+        ----------
+        sample_name : str, optional
+            The sample name, defaults to the current sample.
+        path : str, optional
+            Path to the sample's `.yml` file.
+
+        Returns
+        -------
+        store : SampleGridStore
+        """
+        sample_name = str(sample_name or self.current_sample)
+        path = path or os.path.join(self._path, sample_name + '.yml')
+        key = self._store_key(sample_name, path)
+        store = self._stores.get(key)
+        if store is None or store.is_stale():
+            store = self._stores[key] = SampleGridStore(path, sample_name)
+        return store
+
+    @staticmethod
+    def _store_key(sample_name, path):
+        return (os.path.abspath(path), str(sample_name))
+
+    def close(self):
+        """
+        Compact the journaled target statuses of every loaded sample.
+
+        Call this when done shooting targets, e.g. at the end of an
+        experiment, so that the yaml files are up to date.
+        """
+        for store in list(self._stores.values()):
+            store.close()
+
+    def compact(self, sample_name=None, path=None):
+        """
+        Write journaled target statuses back into the sample's yaml file.
+
+        This happens automatically every so often, but can be done by hand
+        e.g. before copying the file somewhere else.
+
+        Parameters
+        ----------
+        sample_name : str, optional
+            The sample name, defaults to the current sample.
+        path : str, optional
+            Path to the sample's `.yml` file.
+        """
+        self.get_sample_store(sample_name, path).compact()
+
     @property
     def current_sample(self):
         """
@@ -624,40 +1012,12 @@ class XYGridStage():
     def status(self):
         x_index = ''
         y_index = ''
-        x_pos = self.x.position
-        y_pos = self.y.position
-        data = self.get_sample_data(self.current_sample)
         try:
-            xx = data['xx']
-            yy = data['yy']
-
-            x_index = next(
-                index for (index, d) in enumerate(xx)
-                if np.isclose(d["pos"], x_pos)
-            )
-            y_index = next(
-                index for (index, d) in enumerate(yy)
-                if np.isclose(d["pos"], y_pos)
-            )
+            store = self.get_sample_store()
+            y_index, x_index = store.nearest(self.x.position,
+                                             self.y.position)
         except Exception:
             logger.warning('Could not determine the m n points from position.')
-        n_points = self.m_n_points[1]
-
-        x_index += 1
-        m = int(np.ceil(x_index / n_points))
-        res = np.mod(x_index, 2 * n_points)
-        if res == 0:
-            n = 1
-        elif res <= n_points:
-            n = res
-        else:
-            n = 2 * n_points - (res + 1)
-
-        if x_index != '':
-            # to start from 1 instead of 0
-            x_index = n
-        if y_index != '':
-            y_index = m
         lines = []
         sample = f'current_sample: {self.current_sample}'
         grid = f'grid M x N: {self.m_n_points}'
@@ -760,11 +1120,17 @@ class XYGridStage():
                            'in the file.')
             return {}
         try:
-            return data[str(sample_name)]
+            sample = data[str(sample_name)]
         except Exception:
             logger.error('The sample %s might not exist in the file.',
                          sample_name)
             return {}
+        # A background compaction may be rewriting the file, the store
+        # always has the latest statuses
+        if (SampleGridStore.has_journal(path)
+                or self._store_key(sample_name, path) in self._stores):
+            self.get_sample_store(sample_name, path).apply(sample)
+        return sample
 
     def get_sample_map_info(self, sample_name, path=None):
         """
@@ -860,6 +1226,8 @@ class XYGridStage():
         # entry = os.path.join(path, sample_name + '.yml')
         # if this is an existing file, overrite the info but keep the statuses
         if os.path.isfile(entry):
+            if SampleGridStore.has_journal(entry):
+                self.compact(sample_name, entry)
             with open(entry) as sample_file:
                 yaml_dict = yaml.safe_load(sample_file)
                 sample = yaml_dict[sample_name]
@@ -898,24 +1266,7 @@ class XYGridStage():
             Path to the `.yml` file. Defaults to the path defined when
             creating this object.
         """
-        path = path or os.path.join(self._path, sample_name + '.yml')
-        with open(path) as sample_file:
-            yaml_dict = yaml.safe_load(sample_file) or {}
-            sample = yaml_dict.get(sample_name)
-            if sample:
-                for xd in sample.get('xx'):
-                    xd.update((k, False)
-                              for k, v in xd.items() if k == 'status')
-                for yd in sample.get('yy'):
-                    yd.update((k, False)
-                              for k, v in yd.items() if k == 'status')
-                yaml_dict[sample_name].update(sample)
-            else:
-                raise ValueError('Could not find this sample name in the file:'
-                                 f' {sample}')
-        with open(path, 'w') as sample_file:
-            yaml.safe_dump(yaml_dict, sample_file,
-                           sort_keys=False, default_flow_style=False)
+        self.get_sample_store(sample_name, path).reset()
 
     def map_points(self, snake_like=True, top_left=None, top_right=None,
                    bottom_right=None, bottom_left=None, m_rows=None,
@@ -964,23 +1315,14 @@ class XYGridStage():
         a_coeffs, b_coeffs = mesh_interpolation(top_left, top_right,
                                                 bottom_right, bottom_left)
         self.coefficients = a_coeffs.tolist() + b_coeffs.tolist()
-        x_points, y_points = [], []
-
-        xx, yy = get_unit_meshgrid(m_rows=rows, n_columns=columns)
-
-        # return x_points, y_points
-        for rowx, rowy in zip(xx, yy):
-            for x, y in zip(rowx, rowy):
-                i, j = convert_to_physical(a_coeffs=a_coeffs,
-                                           b_coeffs=b_coeffs,
-                                           logic_x=x, logic_y=y)
-                x_points.append(i)
-                y_points.append(j)
+
+        positions = map_grid(a_coeffs, b_coeffs, rows, columns)
         if snake_like:
-            x_points = snake_grid_list(
-                np.array(x_points).reshape(rows, columns))
-            y_points = snake_grid_list(
-                np.array(y_points).reshape(rows, columns))
+            x_points = snake_grid_list(positions[..., 0])
+            y_points = snake_grid_list(positions[..., 1])
+        else:
+            x_points = positions[..., 0].ravel().tolist()
+            y_points = positions[..., 1].ravel().tolist()
         self.positions_x = x_points
         self.positions_y = y_points
         return x_points, y_points
@@ -1008,19 +1350,57 @@ class XYGridStage():
         """
         sample = sample or self.current_sample
         path = path or self.current_sample_path
-        x, y = self.compute_mapped_point(m_row=m,
-                                         n_column=n,
-                                         sample_name=sample, path=path)
-
-        data = self.get_sample_data(sample)
-        xx = data.get('xx')
-        x_status = None
-        # one value should be enough
-        # TODO: this is assuming that none of the points will be the unique.
-        if xx is not None:
-            x_status = next((item['status']
-                             for item in xx if item['pos'] == x), None)
-        return x_status
+        return self.get_sample_store(sample, path).is_target_shot(m, n)
+
+    def next_targets(self, count=1, sample_name=None, path=None):
+        """
+        Iterate over the targets that have not been shot yet.
+
+        The targets are yielded in snake-like order, so the motors only
+        travel one grid spacing between consecutive targets on a row. The
+        statuses are read once, when the iteration starts.
+
+        Parameters
+        ----------
+        count : int, optional
+            Number of targets to yield at a time, e.g. for a fly-scan.
+        sample_name : str, optional
+            The sample name, defaults to the current sample.
+        path : str, optional
+            Path to the `.yml` file.
+
+        Yields
+        ------
+        targets : np.ndarray
+            Array of shape (count, 4) with the m, n, x and y values of the
+            next targets, the last one might be shorter. m and n start at 1.
+
+        Raises
+        ------
+        ValueError
+            If ``count`` is less than 1.
+
+        Examples
+        --------
+        >>> for targets in xy.next_targets(100):
+        ...     fly_scan(targets[:, 2:])
+        """
+        # Checked here rather than in the generator so that it raises
+        # on the call, not on the first iteration
+        if count < 1:
+            raise ValueError(f'count must be at least 1, got {count}')
+        return self._next_targets(int(count), sample_name, path)
+
+    def _next_targets(self, count, sample_name, path):
+        store = self.get_sample_store(sample_name, path)
+        unshot = ~store.shot_mask()
+        order = snake_grid_order(store.m_points, store.n_points)
+        order = order[unshot.ravel()[order]]
+        m, n = np.divmod(order, store.n_points)
+        positions = store.grid.reshape(-1, 2)[order]
+        targets = np.column_stack([m + 1, n + 1, positions])
+        for start in range(0, len(targets), count):
+            yield targets[start:start + count]
 
     def compute_mapped_point(self, m_row, n_column, sample_name=None,
                              path=None, compute_all=False):
@@ -1074,28 +1454,20 @@ class XYGridStage():
         if (m_row or n_column) == 0:
             raise IndexError('Please start at 1, 1, as the initial points.')
 
-        xx_origin, yy_origin = get_unit_meshgrid(m_rows=m_points,
-                                                 n_columns=n_points)
-
         a_coeffs = coeffs[:4]
         b_coeffs = coeffs[4:]
 
         if not compute_all:
-            logic_x = xx_origin[m_row - 1][n_column - 1]
-            logic_y = yy_origin[m_row - 1][n_column - 1]
+            # same spacing as get_unit_meshgrid, without building the grid
+            logic_x = (n_column - 1) * (1 / (n_points - 1))
+            logic_y = (m_row - 1) * (1 / (m_points - 1))
             x, y = convert_to_physical(a_coeffs, b_coeffs, logic_x, logic_y)
             return x, y
         else:
             # compute all points
-            x_points, y_points = [], []
-            for rowx, rowy in zip(xx_origin, yy_origin):
-                for x, y in zip(rowx, rowy):
-                    i, j = convert_to_physical(a_coeffs=a_coeffs,
-                                               b_coeffs=b_coeffs,
-                                               logic_x=x, logic_y=y)
-                    x_points.append(i)
-                    y_points.append(j)
-            return x_points, y_points
+            positions = map_grid(a_coeffs, b_coeffs, m_points, n_points)
+            return (positions[..., 0].ravel().tolist(),
+                    positions[..., 1].ravel().tolist())
 
     def move_to_sample(self, m, n):
         """
@@ -1140,62 +1512,27 @@ class XYGridStage():
 
     def set_status(self, m, n, status=False, sample_name=None, path=None):
         """
-        TODO not working properly yet
         Set the status for a specific m and n point.
 
-        Parametrs:
-        ---------
+        The change is journaled rather than rewriting the sample file, see
+        `SampleGridStore`.
+
+        Parameters
+        ----------
         m : int
             Indicates the row number starting at 1.
         n : int
             Indicates the column number starting at 1.
         status : bool, optional
-            `False` to indicate that is has been shot, and `True` for
+            `True` to indicate that it has been shot, and `False` for
             available.
+        sample_name : str, optional
+            The sample name, defaults to the current sample.
+        path : str, optional
+            Path to the `.yml` file.
         """
         assert isinstance(status, bool)
-        sample_name = sample_name or self.current_sample
-        path = path or os.path.join(self._path, sample_name + '.yml')
-        m_points, n_points = self.m_n_points
-
-        if (m > m_points) or (n > n_points):
-            raise IndexError('Index out of range, make sure the m and n values'
-                             f' are between ({m_points, n_points})')
-        if (m or n) == 0:
-            raise IndexError('Please start at 1, 1, as the initial points.')
-
-        with open(path) as sample_file:
-            yaml_dict = yaml.safe_load(sample_file) or {}
-            sample = yaml_dict.get(sample_name)
-            if sample:
-                xx = sample['xx']
-                yy = sample['yy']
-
-                n_pos = next(d['pos'] for (index, d) in enumerate(xx)
-                             if index == n - 1)
-
-                m_pos = next(d['pos'] for (index, d) in enumerate(yy)
-                             if index == m - 1)
-
-                for xd in sample.get('xx'):
-                    for k, v in xd.items():
-                        if k == 'pos' and v == n_pos:
-                            xd.update((st, status)
-                                      for st, vv in xd.items()
-                                      if st == 'status')
-                for yd in sample.get('yy'):
-                    for k, v in yd.items():
-                        if k == 'pos' and v == m_pos:
-                            yd.update((st, status)
-                                      for st, vv in xd.items()
-                                      if st == 'status')
-                yaml_dict[sample_name].update(sample)
-            else:
-                raise ValueError('Could not find this sample name in the file:'
-                                 f' {sample}')
-        with open(path, 'w') as sample_file:
-            yaml.safe_dump(yaml_dict, sample_file,
-                           sort_keys=False, default_flow_style=False)
+        self.get_sample_store(sample_name, path).set_status(m, n, status)
 
 
 def mesh_interpolation(top_left, top_right, bottom_right, bottom_left):
@@ -1294,8 +1631,8 @@ def get_unit_meshgrid(m_rows, n_columns):
     dx = lx / (ni - 1)
     dy = ly / (nj - 1)
 
-    xx = [x0 + (i - 1) * dx for i in range(1, ni + 1)]
-    yy = [y0 + (j - 1) * dy for j in range(1, nj + 1)]
+    xx = x0 + np.arange(ni) * dx
+    yy = y0 + np.arange(nj) * dy
 
     return np.meshgrid(xx, yy)
 
@@ -1344,16 +1681,58 @@ def snake_grid_list(points):
     flat_points : list
         List of all the grid points folowing a snake-like pattern.
     """
-    temp_points = []
-    for i in range(points.shape[0]):
-        if i % 2 == 0:
-            temp_points.append(points[i])
-        else:
-            t = points[i]
-            tt = t[::-1]
-            temp_points.append(tt)
-    flat_points = list(chain.from_iterable(temp_points))
-    # convert the numpy.float64 to normal float to be able to easily
+    points = np.array(points, dtype=float)
+    points[1::2] = points[1::2, ::-1]
+    # tolist converts the numpy.float64 to normal float to be able to easily
     # save them in the yaml file
-    flat_points = [float(v) for v in flat_points]
-    return flat_points
+    return points.ravel().tolist()
+
+
+def snake_grid_order(m_rows, n_columns):
+    """
+    Get the flat grid indices of an MxN grid in snake-like order.
+
+    Parameters
+    ----------
+    m_rows : int
+        Number of rows our grid has.
+    n_columns : int
+        Number of columns our grid has.
+
+    Returns
+    -------
+    order : np.ndarray
+        Indices into the row-by-row flattened grid, e.g. for a 2x2 grid
+        ``[0, 1, 3, 2]``.
+    """
+    order = np.arange(m_rows * n_columns).reshape(m_rows, n_columns)
+    order[1::2] = order[1::2, ::-1]
+    return order.ravel()
+
+
+def map_grid(a_coeffs, b_coeffs, m_rows, n_columns):
+    """
+    Compute the physical positions of all the points of an MxN grid.
+
+    Parameters
+    ----------
+    a_coeffs : array
+        Perspective transformation coefficients for alpha.
+    b_coeffs : array
+        Perspective transformation coefficients for beta.
+    m_rows : int
+        Number of rows our grid has.
+    n_columns : int
+        Number of columns our grid has.
+
+    Returns
+    -------
+    positions : np.ndarray
+        Array of shape (m_rows, n_columns, 2) with the x and y position of
+        each grid point.
+    """
+    logic_x, logic_y = get_unit_meshgrid(m_rows=m_rows, n_columns=n_columns)
+    x, y = convert_to_physical(np.asarray(a_coeffs, dtype=float),
+                               np.asarray(b_coeffs, dtype=float),
+                               logic_x, logic_y)
+    return np.stack([x, y], axis=-1)
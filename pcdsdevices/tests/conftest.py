@@ -61,8 +61,8 @@ FakeEpicsSignal._read_pv = SimpleNamespace(get_ctrlvars=lambda: None)
 # Stupid patch that somehow makes the test cleanup bug go away
 PV.count = property(lambda self: 1)
 
-for name, cls in _att_classes.items():
-    _att_classes[name] = make_fake_device(cls)
+for n_filters in range(1, MAX_FILTERS + 1):
+    _att_classes[n_filters] = make_fake_device(_att_classes[n_filters])
 
 
 # Used in multiple test files
@@ -0,0 +1,320 @@
+import logging
+import time
+import tracemalloc
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from ophyd.sim import make_fake_device
+
+from ..areadetector import detectors, plugins
+from ..areadetector.detectors import (PCDSAreaDetectorEmbedded,
+                                      PCDSHDF5BlueskyTriggerable)
+from ..areadetector.plugins import ImagePlugin, RunInfoResolver
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture(scope='function')
+def fake_image_plugin():
+    FakeImagePlugin = make_fake_device(ImagePlugin)
+    plugin = FakeImagePlugin('TST:IMAGE1:', name='image1')
+    set_geometry(plugin, (4, 6, 0), 2)
+    plugin.array_data.sim_put(np.arange(24, dtype=np.uint16))
+    return plugin
+
+
+@pytest.fixture(scope='function')
+def fake_detector():
+    FakeDetector = make_fake_device(PCDSAreaDetectorEmbedded)
+    det = FakeDetector('TST:CAM:', name='det')
+    det.cam.port_name.sim_put('CAM')
+    # CAM -> IMAGE2 -> Stats2, CAM -> HDF51
+    for plugin, port, source in [(det.image2, 'IMAGE2', 'CAM'),
+                                 (det.stats2, 'Stats2', 'IMAGE2'),
+                                 (det.hdf51, 'HDF51', 'CAM')]:
+        plugin.port_name.sim_put(port)
+        plugin.nd_array_port.sim_put(source)
+    return det
+
+
+def set_geometry(plugin, size, dimensions):
+    height, width, depth = size
+    plugin.array_size.height.sim_put(height)
+    plugin.array_size.width.sim_put(width)
+    plugin.array_size.depth.sim_put(depth)
+    plugin.ndimensions.sim_put(dimensions)
+
+
+def legacy_image(plugin):
+    """The uncached image readout, for comparison"""
+    array_size = [int(val) for val in plugin.array_size.get()]
+    shape = ImagePlugin._image_shape(array_size,
+                                     int(plugin.ndimensions.get()))
+    image = plugin.array_data.get(count=plugin.array_pixels)
+    return np.array(image).reshape(shape)
+
+
+def test_image_plugin_geometry_cache(fake_image_plugin):
+    plugin = fake_image_plugin
+    image = plugin.image
+    assert image.shape == (4, 6)
+    np.testing.assert_array_equal(image, legacy_image(plugin))
+    assert plugin.image_geometry == ((4, 6), 24)
+    assert plugin._geometry is not None
+
+    # Size updates clear the cached geometry
+    set_geometry(plugin, (3, 4, 2), 3)
+    assert plugin._geometry is None
+    # Sizes are ordered as (depth, height, width)
+    assert plugin.image.shape == (2, 3, 4)
+    assert plugin.array_pixels == 24
+    np.testing.assert_array_equal(plugin.image, legacy_image(plugin))
+
+    set_geometry(plugin, (0, 0, 0), 0)
+    with pytest.raises(RuntimeError):
+        plugin.image
+
+
+def test_image_plugin_frame_buffer(fake_image_plugin):
+    plugin = fake_image_plugin
+    plugin.start_frame_buffer()
+    plugin.array_data.sim_put(np.arange(24, dtype=np.uint16) * 2)
+    buffer = plugin.image
+    assert plugin.frame_count == 1
+    np.testing.assert_array_equal(
+        buffer, (np.arange(24, dtype=np.uint16) * 2).reshape(4, 6)
+    )
+
+    # New frames are written into the same buffer, images handed out
+    # before are copies and keep their data
+    plugin.array_data.sim_put(np.ones(24, dtype=np.uint16))
+    assert plugin.frame_count == 2
+    assert plugin.image is not plugin._frame_buffer
+    np.testing.assert_array_equal(plugin.image, np.ones((4, 6)))
+    np.testing.assert_array_equal(
+        buffer, (np.arange(24, dtype=np.uint16) * 2).reshape(4, 6)
+    )
+
+    # Frames that don't match the geometry are skipped
+    plugin.array_data.sim_put(np.zeros(5, dtype=np.uint16))
+    assert plugin.frame_count == 2
+
+    # After a geometry change, the new geometry is read in the background
+    set_geometry(plugin, (6, 4, 0), 2)
+    plugin.array_data.sim_put(np.zeros(24, dtype=np.uint16))
+    assert plugin.frame_count == 2
+    deadline = time.monotonic() + 2
+    while plugin._geometry is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert plugin._geometry == ((6, 4), 24)
+    plugin.array_data.sim_put(np.full(24, 3, dtype=np.uint16))
+    assert plugin.frame_count == 3
+    np.testing.assert_array_equal(plugin.image, np.full((6, 4), 3))
+
+    plugin.stop_frame_buffer()
+    plugin.array_data.sim_put(np.zeros(24, dtype=np.uint16))
+    assert plugin.frame_count == 3
+    np.testing.assert_array_equal(plugin.image, np.zeros((6, 4)))
+
+
+def measure_readout(read, frames):
+    """Return the frames per second and peak memory of a readout method"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(frames):
+        read()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return frames / elapsed, peak
+
+
+def test_image_plugin_readout_benchmark(fake_image_plugin):
+    plugin = fake_image_plugin
+    set_geometry(plugin, (512, 512, 0), 2)
+    frame = np.arange(512 * 512, dtype=np.uint16)
+    plugin.array_data.sim_put(frame)
+    np.testing.assert_array_equal(plugin.image, legacy_image(plugin))
+
+    frames = 200
+    results = {
+        'legacy': measure_readout(lambda: legacy_image(plugin), frames),
+        'cached': measure_readout(lambda: plugin.image, frames),
+    }
+    plugin.start_frame_buffer()
+    plugin.array_data.sim_put(frame)
+
+    def put_and_read():
+        plugin.array_data.sim_put(frame)
+        return plugin.image
+
+    results['buffered'] = measure_readout(put_and_read, frames)
+    for path, (fps, peak) in results.items():
+        logger.info('%s image readout: %.0f frames/s, peak %.1f kB',
+                    path, fps, peak / 1024)
+    assert plugin.frame_count == frames + 1
+
+
+def test_asyn_port_index(fake_detector, monkeypatch):
+    det = fake_detector
+    assert det.stats2.source_plugin is det.image2
+    assert det.image2.source_plugin is None
+    assert det.stats2._asyn_pipeline == (det.cam, det.image2, det.stats2)
+    assert det.get_plugin_by_asyn_port('HDF51') is det.hdf51
+    assert det.get_plugin_by_asyn_port('Nope') is None
+    assert det.get_plugin_graph_edges() == [('det_image2', 'det_stats2')]
+    assert set(det.get_plugin_graph_edges(use_names=False,
+                                          include_cam=True)) == {
+        ('CAM', 'IMAGE2'), ('IMAGE2', 'Stats2'), ('CAM', 'HDF51')
+    }
+
+    # After the index is built, lookups don't read the port signals
+    for plugin in (det.image2, det.stats2, det.hdf51):
+        for sig in (plugin.port_name, plugin.nd_array_port):
+            monkeypatch.setattr(sig, 'get', Mock(side_effect=AssertionError))
+    assert det.stats2._asyn_pipeline == (det.cam, det.image2, det.stats2)
+
+    # Port updates are applied incrementally
+    det.stats2.nd_array_port.sim_put('HDF51')
+    assert det.stats2.source_plugin is det.hdf51
+    assert det.stats2._asyn_pipeline == (det.cam, det.hdf51, det.stats2)
+    det.hdf51.port_name.sim_put('HDF52')
+    assert det.get_plugin_by_asyn_port('HDF51') is None
+    assert det.stats2.source_plugin is None
+    assert det.stats2._asyn_pipeline == (None, det.stats2)
+
+
+class SlowLookup:
+    """Stand-in for a run information script, with injected latency"""
+    def __init__(self, latency, value):
+        self.latency = latency
+        self.value = value
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        time.sleep(self.latency)
+        if isinstance(self.value, Exception):
+            raise self.value
+        return self.value
+
+
+@pytest.fixture(scope='function')
+def slow_scripts(monkeypatch):
+    scripts = SimpleNamespace(
+        run_number=SlowLookup(latency=0.1, value=42),
+        experiment=SlowLookup(latency=0.1, value='tstx00123'),
+    )
+    monkeypatch.setattr(plugins, 'get_run_number', scripts.run_number)
+    monkeypatch.setattr(plugins, 'get_current_experiment', scripts.experiment)
+    monkeypatch.setitem(plugins._run_info_resolvers, 'tst',
+                        RunInfoResolver('tst'))
+    monkeypatch.setattr(detectors, 'get_hutch_name', lambda: 'tst')
+    return scripts
+
+
+@pytest.fixture(scope='function')
+def fake_hdf5_detector(slow_scripts):
+    FakeDetector = make_fake_device(PCDSHDF5BlueskyTriggerable)
+    return FakeDetector('TST:CAM:', name='det', write_path='/tmp')
+
+
+def test_run_info_resolver(slow_scripts):
+    resolver = RunInfoResolver.for_hutch('tst')
+    # Nothing cached yet, return immediately and look up in the background
+    start = time.monotonic()
+    assert resolver.get() is None
+    assert time.monotonic() - start < slow_scripts.run_number.latency
+    resolver.refresh(wait=True)
+    assert resolver.get() == ('tstx00123', 42)
+
+    # The run number is looked up again, the experiment is cached
+    experiment_calls = slow_scripts.experiment.calls
+    slow_scripts.run_number.value = 43
+    assert resolver.get(wait=True) == ('tstx00123', 43)
+    assert slow_scripts.experiment.calls == experiment_calls
+
+    # Failed lookups keep the last value
+    slow_scripts.run_number.value = RuntimeError('no daq')
+    assert resolver.get(wait=True) == ('tstx00123', 43)
+
+    # Slow lookups fall back to the last value after run_timeout
+    slow_scripts.run_number.value = 44
+    slow_scripts.run_number.latency = 0.5
+    resolver.run_timeout = 0.05
+    start = time.monotonic()
+    assert resolver.get(wait=True) == ('tstx00123', 43)
+    assert time.monotonic() - start < slow_scripts.run_number.latency
+    resolver.refresh(wait=True)
+    assert resolver.get() == ('tstx00123', 44)
+
+    # After ttl, the experiment is looked up again, the last one is kept
+    # until the lookup finishes
+    resolver.ttl = 0
+    slow_scripts.experiment.value = 'tstx00124'
+    assert resolver.get() == ('tstx00123', 44)
+    resolver.refresh(wait=True)
+    assert resolver.get() == ('tstx00124', 44)
+
+
+def test_run_info_resolver_after_ttl(slow_scripts):
+    resolver = RunInfoResolver.for_hutch('tst')
+    resolver.ttl = 0.2
+    resolver.run_timeout = 0.5
+    slow_scripts.run_number.latency = 0.3
+    slow_scripts.experiment.latency = 0.3
+    resolver.refresh(wait=True)
+    # A scan that starts once the experiment is due for a refresh
+    time.sleep(0.3)
+    slow_scripts.run_number.value = 43
+    assert resolver.get(wait=True) == ('tstx00123', 43)
+
+
+def test_hdf5_filestore_filename(fake_hdf5_detector, slow_scripts):
+    hdf5 = fake_hdf5_detector.hdf51
+    # Staging waits briefly for the lookup started at init
+    filename, _, _ = hdf5.make_filename()
+    assert filename.startswith('tstx00123_run42_')
+
+    # Back-to-back scans each get their own run number
+    slow_scripts.run_number.value = 43
+    filename, _, _ = hdf5.make_filename()
+    assert filename.startswith('tstx00123_run43_')
+
+    # Without any run information, fall back to the plugin name
+    plugins._run_info_resolvers['tst'] = RunInfoResolver('tst')
+    slow_scripts.experiment.value = RuntimeError('no experiment')
+    filename, _, _ = hdf5.make_filename()
+    assert filename.startswith('det_hdf51_')
+
+
+def legacy_make_filename(hdf5):
+    """The filename lookup before RunInfoResolver, for comparison"""
+    run_number = plugins.get_run_number(
+        hutch=hdf5.parent.hutch_name, live=False, timeout=5,
+    )
+    experiment = plugins.get_current_experiment(
+        hdf5.parent.hutch_name, live=False, timeout=5,
+    )
+    return f'{experiment}_run{run_number}_{time.time():.0f}'
+
+
+def test_hdf5_filestore_filename_latency(fake_hdf5_detector, slow_scripts):
+    hdf5 = fake_hdf5_detector.hdf51
+    RunInfoResolver.for_hutch('tst').refresh(wait=True)
+
+    start = time.perf_counter()
+    legacy = legacy_make_filename(hdf5)
+    uncached = time.perf_counter() - start
+
+    start = time.perf_counter()
+    filename, _, _ = hdf5.make_filename()
+    cached = time.perf_counter() - start
+    logger.info('make_filename during stage: %.3f s uncached, %.3f s with '
+                'the cached experiment', uncached, cached)
+    # Both name the file after the current run
+    assert filename.split('_')[:2] == legacy.split('_')[:2]
+    # Only the run number lookup is left on the stage path
+    assert cached < uncached
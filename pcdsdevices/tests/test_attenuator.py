@@ -1,4 +1,5 @@
 import logging
+import queue
 import threading
 import time
 from unittest.mock import Mock
@@ -8,15 +9,15 @@ from ophyd.sim import make_fake_device
 from ophyd.status import wait as status_wait
 
 from ..attenuator import (AT1K2, AT1K4, AT2K2, AT2L0, MAX_FILTERS, AttBase,
-                          Attenuator, _att_classes)
+                          Attenuator, BladeStateEnum, Filter, _att_classes)
 from .conftest import wait_and_assert
 
 logger = logging.getLogger(__name__)
 
 
 # Replace all the Attenuator classes with fake classes
-for name, cls in _att_classes.items():
-    _att_classes[name] = make_fake_device(cls)
+for n_filters in range(1, MAX_FILTERS + 1):
+    _att_classes[n_filters] = make_fake_device(_att_classes[n_filters])
 
 
 @pytest.mark.timeout(5)
@@ -252,6 +253,43 @@ def test_at2l0_error_bitmask(at2l0):
     assert at2l0.error_summary_bitmask.get() == 0b101
 
 
+def wait_for_value(values, expected):
+    """Wait for a value in a queue, skipping the earlier ones"""
+    while values.get(timeout=1) != expected:
+        ...
+
+
+def test_at2l0_error_bitmask_severity(at2l0):
+    values = queue.Queue()
+    at2l0.error_summary_bitmask.subscribe(
+        lambda value, **kwargs: values.put(value), run=False
+    )
+    assert at2l0.error_summary_bitmask.get() == 0
+    # An alarm that only changes the severity, not the value
+    readback = at2l0.blade_19.motor.user_readback
+    readback._metadata["severity"] = 2
+    # Metadata callbacks run in another thread
+    readback._run_metadata_callbacks()
+    wait_for_value(values, 0b1)
+    readback._metadata["severity"] = 0
+    readback._run_metadata_callbacks()
+    wait_for_value(values, 0)
+
+
+def test_filter_status_coalesced():
+    blade = make_fake_device(Filter)("TST:FILT", name="blade")
+    blade.stuck.sim_put(0)
+    for state in (1, 2, 1, 2, 1):
+        blade.state.sim_put(state)
+    wait_and_assert(blade.status, BladeStateEnum.IN)
+    coalescer = blade._state_update
+    assert coalescer.received >= 5
+    assert coalescer.delivered + coalescer.dropped == coalescer.received
+    # Stuck updates are still applied right away
+    blade.stuck.sim_put(2)
+    assert blade.status.get() == BladeStateEnum.STUCK_OUT
+
+
 def test_at2l0_clear_errors(at2l0):
     signals = []
     for blade_num in range(1, 20):
@@ -1,5 +1,6 @@
 import logging
 
+import numpy as np
 import pytest
 from ophyd.sim import make_fake_device
 
@@ -38,6 +39,9 @@ def test_beam_stats_avg(fake_beam_stats):
         stats.mj.sim_put(i)
 
     assert stats.mj_avg.get() == sum(range(10))/10
+    assert stats.mj_min.get() == 0
+    assert stats.mj_max.get() == 9
+    assert stats.mj_std.get() == pytest.approx(np.std(range(10)))
 
     stats.configure(dict(mj_buffersize=20))
     cfg = stats.read_configuration()
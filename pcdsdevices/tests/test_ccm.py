@@ -196,6 +196,68 @@ def test_set_current_position(fake_ccm):
         assert np.isclose(mot.position, energy)
 
 
+def test_vectorized_calcs():
+    logger.debug('test_vectorized_calcs')
+    alio = np.linspace(-10, 10, 11)
+    theta = ccm.alio_to_theta(alio, ccm.default_theta0, ccm.default_gr,
+                              ccm.default_gd)
+    assert theta.shape == alio.shape
+    for single_alio, single_theta in zip(alio, theta):
+        assert single_theta == ccm.alio_to_theta(
+            single_alio, ccm.default_theta0, ccm.default_gr, ccm.default_gd,
+        )
+    assert np.allclose(
+        ccm.theta_to_alio(list(theta), ccm.default_theta0, ccm.default_gr,
+                          ccm.default_gd),
+        alio,
+    )
+    assert np.allclose(
+        ccm.wavelength_to_energy(ccm.energy_to_wavelength([4, 8, 16])),
+        [4, 8, 16],
+    )
+
+
+def test_resolution(fake_ccm):
+    logger.debug('test_resolution')
+    calc = fake_ccm.energy
+    calc.alio.move(SAMPLE_ALIO)
+    delta = 1e-4
+    finite_diff = abs(
+        (calc.alio_to_energy(SAMPLE_ALIO - delta/2)
+         - calc.alio_to_energy(SAMPLE_ALIO + delta/2)) / delta
+    )
+    assert np.isclose(calc.resolution.get(), finite_diff, rtol=1e-6)
+
+
+def test_alio_table(fake_ccm):
+    logger.debug('test_alio_table')
+    calc = fake_ccm.energy
+    energies = np.linspace(4, 25, 1000)
+    exact = calc.energy_to_alio(energies)
+    assert exact.shape == energies.shape
+
+    calc.use_alio_table = True
+    assert np.allclose(calc.energy_to_alio(energies), exact, rtol=0,
+                       atol=1e-6)
+    table = calc._get_alio_table()
+    assert calc._get_alio_table() is table
+    # Outside of the table, the exact calculation is used
+    assert calc.energy_to_alio(30) == ccm.theta_to_alio(
+        ccm.wavelength_to_theta(ccm.energy_to_wavelength(30),
+                                calc.dspacing_val),
+        calc.theta0_rad_val, calc.gr_val, calc.gd_val,
+    )
+
+    # Changing a constant rebuilds the table
+    calc.theta0_deg.put(15)
+    assert calc._get_alio_table() is not table
+    calc.use_alio_table = False
+    exact = calc.energy_to_alio(energies)
+    calc.use_alio_table = True
+    assert np.allclose(calc.energy_to_alio(energies), exact, rtol=0,
+                       atol=1e-6)
+
+
 @pytest.mark.timeout(5)
 def test_check_valid_constant(fake_ccm):
     logger.debug('test_check_valid_constant')
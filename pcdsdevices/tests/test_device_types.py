@@ -1,2 +1,9 @@
 def test_device_types_import():
     from pcdsdevices import device_types  # NOQA
+
+
+def test_device_types_lazy_names():
+    from pcdsdevices import device_types
+    assert 'IMS' in dir(device_types)
+    for name in device_types.__all__:
+        assert getattr(device_types, name) is not None
@@ -0,0 +1,103 @@
+import logging
+import threading
+
+import numpy as np
+import pytest
+from ophyd.sim import make_fake_device
+
+from ..digitizers import (MemmapWaveformSink, Qadc134, Wave8V2Simple,
+                          WaveformCapture)
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture(scope='function')
+def fake_qadc():
+    FakeQadc = make_fake_device(Qadc134)
+    return FakeQadc('TST:QADC', name='qadc')
+
+
+def test_waveform_attrs():
+    assert Qadc134.waveform_attrs == ('out0', 'out1', 'rawdata0', 'rawdata1')
+    for attr in Wave8V2Simple.waveform_attrs:
+        assert attr in Wave8V2Simple.component_names
+
+
+def test_capture_memmap(fake_qadc, tmp_path):
+    capture = fake_qadc.capture_waveforms(str(tmp_path), shots=4)
+    for shot in range(6):
+        fake_qadc.out0.sim_put(np.full(8, shot, dtype=np.float64))
+    for shot in range(2):
+        fake_qadc.rawdata0.sim_put(np.full(16, shot, dtype=np.int16))
+    # A change of length can't be written into the same ring
+    fake_qadc.rawdata0.sim_put(np.zeros(3, dtype=np.int16))
+    stats = capture.stop(timeout=5)
+
+    assert not capture.running
+    assert stats.shots == {'out0': 6, 'rawdata0': 2}
+    assert stats.dropped == {}
+    assert stats.rejected == {'rawdata0': 1}
+    assert stats.bytes_written == 6 * 8 * 8 + 2 * 16 * 2
+    logger.info('memmap capture: %.0f shots/s, %.2f MB/s',
+                stats.shots_per_second, stats.megabytes_per_second)
+
+    out0 = np.load(tmp_path / 'out0.npy', mmap_mode='r')
+    # The ring of 4 holds shots 4, 5, 2, 3
+    np.testing.assert_array_equal(out0[:, 0], [4, 5, 2, 3])
+    assert out0.shape == (4, 8)
+    timestamps = np.load(tmp_path / 'out0_timestamp.npy')
+    assert np.all(timestamps > 0)
+    rawdata0 = np.load(tmp_path / 'rawdata0.npy')
+    assert rawdata0.dtype == np.int16
+    np.testing.assert_array_equal(rawdata0[:2, 0], [0, 1])
+
+
+class BlockingSink(MemmapWaveformSink):
+    """Memmap sink that waits on an event before each write"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.writing = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, *args, **kwargs):
+        self.writing.set()
+        assert self.release.wait(timeout=5)
+        return super().write(*args, **kwargs)
+
+
+def test_capture_backpressure(fake_qadc, tmp_path):
+    sink = BlockingSink(str(tmp_path), shots=10)
+    capture = WaveformCapture({'out1': fake_qadc.out1}, sink, queue_size=2)
+    capture.start()
+    fake_qadc.out1.sim_put(np.zeros(4))
+    assert sink.writing.wait(timeout=5)
+    # The writer is busy with the first waveform, 2 fit in the queue
+    for _ in range(4):
+        fake_qadc.out1.sim_put(np.ones(4))
+    assert capture.stats().dropped == {'out1': 2}
+    sink.release.set()
+    stats = capture.stop(timeout=5)
+    assert stats.shots == {'out1': 3}
+    assert stats.dropped == {'out1': 2}
+
+
+def test_capture_hdf5(fake_qadc, tmp_path):
+    h5py = pytest.importorskip('h5py')
+    filename = str(tmp_path / 'qadc.h5')
+    capture = fake_qadc.capture_waveforms(filename, attrs=['out0'],
+                                          fmt='hdf5')
+    for shot in range(100):
+        fake_qadc.out0.sim_put(np.full(32, shot, dtype=np.float32))
+    stats = capture.stop(timeout=5)
+    assert stats.shots == {'out0': 100}
+    with h5py.File(filename, 'r') as h5:
+        data = h5['out0']['data']
+        assert data.shape == (100, 32)
+        assert data.chunks[1] == 32
+        np.testing.assert_array_equal(data[:, 0], np.arange(100))
+        assert h5['out0']['timestamp'].shape == (100,)
+
+
+def test_capture_bad_format(fake_qadc, tmp_path):
+    with pytest.raises(ValueError):
+        fake_qadc.capture_waveforms(str(tmp_path), fmt='csv')
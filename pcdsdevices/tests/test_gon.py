@@ -6,7 +6,7 @@ import pytest
 from ophyd.sim import make_fake_device
 
 from ..gon import (BaseGon, Goniometer, GonWithDetArm, Kappa, SamPhi, SimKappa,
-                   XYZStage)
+                   XYZStage, kappa_to_spherical, spherical_to_kappa)
 
 logger = logging.getLogger(__name__)
 
@@ -225,3 +225,49 @@ def test_kappa_calculations_big_kap(fake_kappa, eta, kappa, phi):
     assert np.isclose(eta, k_eta)
     assert np.isclose(kappa, k_kap)
     assert np.isclose(phi, k_phi)
+
+
+@pytest.mark.parametrize("flipped", [False, True])
+def test_kappa_transforms_vectorized(fake_kappa, flipped):
+    eta = np.array([0, 1, 10, 45, -10, 9])
+    kappa = np.array([0, 2, 20, 45, 25, -1])
+    phi = np.array([0, 3, 30, 45, -30, 1])
+    if flipped:
+        kappa = kappa + 225
+        fake_kappa.kappa.move(225, wait=True)
+    e_eta, e_chi, e_phi = kappa_to_spherical(eta, kappa, phi, flipped=flipped)
+    for num in range(len(eta)):
+        expected = fake_kappa.k_to_e(eta[num], kappa[num], phi[num])
+        assert np.allclose(expected, (e_eta[num], e_chi[num], e_phi[num]))
+    k_eta, k_kap, k_phi = spherical_to_kappa(e_eta, e_chi, e_phi,
+                                             flipped=flipped)
+    assert np.allclose(k_eta, eta)
+    assert np.allclose(k_kap, kappa)
+    assert np.allclose(k_phi, phi)
+    assert np.allclose(fake_kappa.e_to_k(e_eta, e_chi, e_phi),
+                       (k_eta, k_kap, k_phi))
+
+
+def test_plan_trajectory(fake_kappa):
+    e_eta, e_chi, e_phi = fake_kappa.k_to_e()
+    traj = fake_kappa.plan_trajectory(e_eta + np.arange(5) * 0.5,
+                                      e_chi, e_phi)
+    assert traj.real.shape == (5, 3)
+    for num, row in enumerate(traj.real):
+        expected = fake_kappa.e_to_k(e_eta + num * 0.5, e_chi, e_phi)
+        assert np.allclose(row, expected)
+    assert np.allclose(traj.steps[0], 0)
+    assert traj.valid
+    assert traj.confirm_points.size == 0
+    # Only the big jump asks for confirmation
+    traj = fake_kappa.plan_trajectory([e_eta, e_eta + 10], e_chi, e_phi)
+    assert traj.confirm_points.tolist() == [1]
+    # Out of reach for a 50 degree kappa
+    traj = fake_kappa.plan_trajectory(0, [10, 120], 0)
+    assert traj.unreachable_points.tolist() == [1]
+    assert not traj.valid
+    # Negative chi puts a flipped kappa past its limit, but not an unflipped one
+    traj = fake_kappa.plan_trajectory(0, [20, -20], 0, flipped=True)
+    assert traj.out_of_limits[1, 1]
+    assert traj.branch_flips.tolist() == [1]
+    assert fake_kappa.eta.position == 10
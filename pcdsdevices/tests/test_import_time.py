@@ -0,0 +1,106 @@
+"""
+Guard against regressions in the time it takes to import pcdsdevices.
+
+Each measurement is made in a fresh interpreter. Import times are compared
+relative to the time it takes to import ophyd on the same machine, and
+module counts are compared as the number of modules imported on top of
+ophyd, so that the baseline does not depend on the speed of the machine
+or on the exact versions of our dependencies.
+
+After an intentional change, record a new baseline with::
+
+    python -m pcdsdevices.tests.test_import_time
+"""
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BASELINE_PATH = Path(__file__).parent / 'import_baseline.json'
+MODULES = ['pcdsdevices', 'pcdsdevices.device_types']
+# Number of fresh interpreters to measure, keeping the fastest
+REPEATS = 3
+# Allowed growth over the baseline, with some slack for very fast imports
+TIME_TOLERANCE = 1.5
+TIME_SLACK = 0.2
+MODULE_TOLERANCE = 1.1
+MODULE_SLACK = 20
+
+_measure_script = """
+import sys
+import time
+
+start = time.perf_counter()
+import ophyd
+ophyd_time = time.perf_counter() - start
+ophyd_modules = len(sys.modules)
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start, ophyd_time,
+      len(sys.modules) - ophyd_modules)
+"""
+
+
+def measure_import(module: str, repeats: int = REPEATS) -> dict[str, float]:
+    """
+    Measure a cold import of ``module``.
+
+    Returns
+    -------
+    result : dict
+        ``time_ratio``, the import time divided by the time it takes to
+        import ophyd, and ``modules``, the number of modules imported that
+        ophyd did not already import.
+    """
+    ratios = []
+    counts = []
+    for _ in range(repeats):
+        output = subprocess.check_output(
+            [sys.executable, '-c', _measure_script.format(module=module)],
+            cwd=Path(__file__).parents[2],
+            text=True,
+        )
+        import_time, ophyd_time, count = output.split()
+        ratios.append(float(import_time) / float(ophyd_time))
+        counts.append(int(count))
+    return {'time_ratio': min(ratios), 'modules': min(counts)}
+
+
+def load_baseline() -> dict[str, dict[str, float]]:
+    with open(BASELINE_PATH) as fd:
+        return json.load(fd)
+
+
+def record_baseline() -> dict[str, dict[str, float]]:
+    baseline = {module: measure_import(module) for module in MODULES}
+    with open(BASELINE_PATH, 'w') as fd:
+        json.dump(baseline, fd, indent=4, sort_keys=True)
+        fd.write('\n')
+    return baseline
+
+
+@pytest.mark.parametrize('module', MODULES)
+def test_import_time(module):
+    baseline = load_baseline()[module]
+    result = measure_import(module)
+    max_modules = max(
+        baseline['modules'] * MODULE_TOLERANCE,
+        baseline['modules'] + MODULE_SLACK,
+    )
+    assert result['modules'] <= max_modules, (
+        f'import {module} now loads {result["modules"]} modules on top of '
+        f'ophyd, up from {baseline["modules"]}'
+    )
+    max_ratio = max(baseline['time_ratio'] * TIME_TOLERANCE, TIME_SLACK)
+    assert result['time_ratio'] <= max_ratio, (
+        f'import {module} now takes {result["time_ratio"]:.2f}x as long as '
+        f'import ophyd, up from {baseline["time_ratio"]:.2f}x'
+    )
+
+
+if __name__ == '__main__':
+    print(json.dumps(record_baseline(), indent=4, sort_keys=True))
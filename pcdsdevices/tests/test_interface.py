@@ -7,9 +7,13 @@ from pathlib import Path
 
 import ophyd
 import pytest
+from lightpath import LightpathState
+from ophyd import Component as Cpt
 
-from ..interface import (BaseInterface, TabCompletionHelperClass,
-                         get_engineering_mode, set_engineering_mode,
+from .. import interface
+from ..interface import (BaseInterface, LightpathMixin,
+                         TabCompletionHelperClass, get_engineering_mode,
+                         set_engineering_mode, set_status_batching,
                          setup_preset_paths)
 from ..sim import FastMotor, SlowMotor
 from . import conftest
@@ -309,6 +313,29 @@ def test_tab_completion(cls):
     assert regex.match("post_elog_status") is not None
 
 
+@pytest.mark.parametrize(
+    'cls',
+    [pytest.param(cls, id=f'{cls.__module__}.{cls.__name__}')
+     for cls in conftest.find_all_device_classes()
+     if BaseInterface in cls.mro()]
+)
+def test_tab_completion_dir(cls):
+    instance = conftest.best_effort_instantiation(cls)
+    tab = instance._tab
+    set_engineering_mode(False)
+    try:
+        start = time.monotonic()
+        user_dir = dir(instance)
+        elapsed = time.monotonic() - start
+        regex = tab.build_regex()
+        expected = [elem for elem in tab.super_dir() if regex.fullmatch(elem)]
+        assert user_dir == sorted(expected)
+    finally:
+        set_engineering_mode(True)
+    logger.debug('%s.__dir__ took %.1f us', cls.__name__, elapsed * 1e6)
+    assert sorted(dir(instance)) == sorted(tab.super_dir())
+
+
 _STATUS_PRINT_IGNORES = {
     '.AttenuatorCalculatorBase',
     '.BadSlitPositionerBase',
@@ -350,6 +377,77 @@ def test_smoke_status_prints(cls):
     print(instance.format_status_info(status_info))
 
 
+class StatusDevice(BaseInterface, ophyd.Device):
+    a = Cpt(ophyd.Signal, value=1)
+    b = Cpt(ophyd.Signal, value=2, kind='config')
+    slow = Cpt(ophyd.Signal, value=3)
+
+
+def test_status_batching(monkeypatch):
+    dev = StatusDevice(name='dev')
+    set_status_batching(False)
+    try:
+        serial_info = dev.status_info()
+    finally:
+        set_status_batching(True)
+    assert dev.status_timing is None
+
+    def slow_get(*args, **kwargs):
+        time.sleep(0.3)
+        return 3
+
+    monkeypatch.setattr(dev.slow, 'get', slow_get)
+    batched_info = dev.status_info()
+    assert batched_info == serial_info
+    assert 'b' not in batched_info
+
+    timing = dev.status_timing
+    assert set(timing.signals) == {'dev', 'dev_a', 'dev_slow'}
+    assert timing.slowest(1)[0][0] == 'dev_slow'
+    assert not timing.timed_out
+    assert timing.total >= timing.read >= 0.3
+
+
+def test_status_batching_deadline(monkeypatch):
+    dev = StatusDevice(name='dev')
+    release = threading.Event()
+    monkeypatch.setattr(dev.slow, 'get',
+                        lambda *args, **kwargs: release.wait())
+    monkeypatch.setattr(interface, 'STATUS_INFO_TIMEOUT', 0.1)
+    try:
+        info = dev.status_info()
+    finally:
+        release.set()
+    assert info['a']['value'] == 1
+    assert info['slow']['value'] is None
+    assert dev.status_timing.timed_out == ['dev_slow']
+
+
+class SlowPositionDevice(StatusDevice):
+    @property
+    def position(self):
+        time.sleep(0.3)
+        return 4
+
+
+def test_status_batching_position(monkeypatch):
+    dev = SlowPositionDevice(name='dev')
+
+    def slow_get(*args, **kwargs):
+        time.sleep(0.3)
+        return 3
+
+    monkeypatch.setattr(dev.slow, 'get', slow_get)
+    info = dev.status_info()
+    assert info['position'] == 4.0
+    assert list(info)[:4] == ['name', 'kind', 'is_device', 'position']
+    assert info['slow']['value'] == 3
+    # The position is read alongside the signals, not before them
+    timing = dev.status_timing
+    assert timing.signals['dev'] >= 0.3
+    assert timing.read < 0.55
+
+
 def test_tab_helper_no_mixin():
     class MyDevice:
         ...
@@ -396,3 +494,81 @@ def test_tab_helper_class():
     tab.add('foobar')
     tab.reset()
     assert 'foobar' not in tab.get_filtered_dir_list()
+
+    # Instance attributes are matched on top of the cached class list
+    instance.mv_dynamic = 5
+    instance.dynamic = 6
+    tab.add('mv_.*')
+    filtered = tab.get_filtered_dir_list()
+    assert 'mv_dynamic' in filtered
+    assert 'dynamic' not in filtered
+
+
+def test_tab_class_dir_cache():
+    class MyDevice(BaseInterface, ophyd.Device):
+        tab_whitelist = ['a']
+        a = 1
+
+    class_tab = MyDevice._class_tab
+    assert class_tab.uses_object_dir
+    assert class_tab.get_class_dir() is class_tab.get_class_dir()
+    assert 'a' in class_tab.get_class_dir()
+    cached = class_tab.get_class_dir()
+    MyDevice.ab = 2
+    class_tab.add('ab')
+    assert 'ab' in class_tab.get_class_dir()
+    assert class_tab.get_class_dir() is not cached
+    cached = class_tab.get_class_dir()
+    set_engineering_mode(True)
+    assert class_tab.get_class_dir() is not cached
+
+
+class LightpathBlades(LightpathMixin):
+    lightpath_cpts = ['top', 'bottom']
+    top = Cpt(ophyd.Signal, value=0)
+    bottom = Cpt(ophyd.Signal, value=0)
+
+    def __init__(self, *args, **kwargs):
+        self.calc_calls = []
+        super().__init__(*args, **kwargs)
+
+    def calc_lightpath_state(self, top=None, bottom=None):
+        self.calc_calls.append((top, bottom))
+        return LightpathState(
+            inserted=bool(top or bottom),
+            removed=not (top or bottom),
+            output={self.output_branches[0]: 1},
+        )
+
+
+def test_lightpath_state_from_cache(monkeypatch):
+    dev = LightpathBlades('', name='blades', input_branches=['L0'],
+                          output_branches=['L0'])
+    assert dev.get_lightpath_state().removed
+    monkeypatch.setattr(
+        dev.top, 'get',
+        lambda *args, **kwargs: pytest.fail('should use cached values'),
+    )
+    dev.bottom.put(1)
+    assert dev.calc_calls[-1] == (0, 1)
+    assert dev.get_lightpath_state().inserted
+
+
+def test_lightpath_state_debounce():
+    class DebouncedBlades(LightpathBlades):
+        lightpath_debounce = 0.2
+
+    dev = DebouncedBlades('', name='blades', input_branches=['L0'],
+                          output_branches=['L0'])
+    dev.get_lightpath_state()
+    dev.calc_calls.clear()
+    for value in range(1, 5):
+        dev.top.put(value)
+        dev.bottom.put(value)
+
+    for _ in range(20):
+        if dev.calc_calls:
+            break
+        time.sleep(0.1)
+    time.sleep(0.1)
+    assert dev.calc_calls == [(4, 4)]
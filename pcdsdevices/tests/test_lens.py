@@ -150,6 +150,33 @@ def test_lensstack_align(presets, monkeypatch, fake_lensstack):
     assert lens.z.position == 0
 
 
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Fails on Windows, presets needed and not supported.",
+)
+def test_lensstack_alignment_cache(presets, fake_lensstack):
+    logger.debug('test_lensstack_alignment_cache')
+    lens = fake_lensstack
+    for motor, one, two in ((lens.x, 1, 3), (lens.y, 2, 6), (lens.z, 0, 10)):
+        motor.presets.add_hutch(value=one, name='align_position_one')
+        motor.presets.add_hutch(value=two, name='align_position_two')
+    line = lens.alignment_line()
+    assert line(5) == (2, 4)
+    assert lens.alignment_line() is line
+
+    # Editing a preset rebuilds the line
+    lens.y.presets.positions.align_position_two.update_pos(12)
+    assert lens.alignment_line() is not line
+    assert lens.alignment_line()(5) == (2, 7)
+
+    sizes = [400e-6, 500e-6, 600e-6]
+    x, y, z = lens.forward_many(sizes)
+    assert x.shape == y.shape == z.shape == (3,)
+    for size, *expected in zip(sizes, x, y, z):
+        real = lens.forward(calib_z=0, beam_size=size)
+        assert np.allclose(real, expected)
+
+
 def test_move(fake_lensstack):
     logger.debug('test_move')
     lensstack = fake_lensstack
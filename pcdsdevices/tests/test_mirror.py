@@ -1,13 +1,16 @@
 import math
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 from ophyd.sim import ReadOnlyError, make_fake_device
 
 from pcdsdevices import mirror
 
-from ..mirror import (KBOMirror, OffsetMirror, PointingMirror,
-                      XOffsetMirrorStateCool, XOffsetMirrorXYState)
+from ..mirror import (KBOMirror, OffsetMirror, PointingMirror, XOffsetMirror,
+                      XOffsetMirrorBend, XOffsetMirrorState,
+                      XOffsetMirrorStateCool, XOffsetMirrorXYState,
+                      _RangeTable)
 
 
 @pytest.fixture(scope='function')
@@ -216,3 +219,123 @@ def test_xy_mirror_lightpath(fake_xy_offset_mirror, monkeypatch):
     xym.get_lightpath_state(use_cache=False)
     assert mock_schedule.call_count == 2
     assert xym._retry_lightpath is False
+
+
+@pytest.fixture(scope='function')
+def fake_range_mirror():
+    FakeXOffsetMirror = make_fake_device(XOffsetMirror)
+    return FakeXOffsetMirror(
+        'TST:MR1', name="Test Mirror",
+        input_branches=['L0'], output_branches=['L0', 'L1', 'L2'],
+        x_ranges=[[-100, -10], [-10, 100]],
+        y_ranges=[[0, 10], [10, 20]],
+        pitch_ranges=[[[0, 1], [1, 2]], [[0, 1], [1, 2]], [[2, 3], [3, 4]]],
+    )
+
+
+@pytest.mark.parametrize(
+    'ranges',
+    [[[0, 1], [1, 2]],
+     [[0, 2], [1, 3], [3, 3], [5, 4]],
+     [[-np.inf, 0], [0, np.inf]],
+     [[np.nan, 1], [0, 2]]]
+)
+def test_range_table(ranges):
+    table = _RangeTable(ranges)
+    values = np.array([-np.inf, -1, 0, 0.5, 1, 1.5, 2, 2.5, 3, 4, 4.5, 5,
+                       np.inf, np.nan])
+    expected = [[lo < value < hi for lo, hi in ranges] for value in values]
+    np.testing.assert_array_equal(table.match(values), expected)
+    for value, row in zip(values, expected):
+        assert table.match(value).tolist() == row
+        if sum(row) == 1:
+            assert table.index(value) == row.index(True)
+        else:
+            assert table.index(value) == (-1 if sum(row) == 0 else -2)
+
+
+def test_range_table_malformed():
+    for ranges in ([], [1, 2], [[1], [2]]):
+        table = _RangeTable(ranges)
+        with pytest.raises(mirror.MirrorLogicError):
+            table.match(0)
+
+
+def test_mirror_range_tables_recompile(fake_range_mirror):
+    m = fake_range_mirror
+    assert m.calc_lightpath_state(50, 5, 0.5).output == {'L1': 1}
+    m.pitch_ranges = [[[5, 6], [0, 1]], [[5, 6], [0, 1]]]
+    assert m.calc_lightpath_state(50, 5, 0.5).output == {'L2': 1}
+    m.x_ranges = [[1, 2]]
+    state = m.calc_lightpath_state(50, 5, 0.5)
+    assert not state.inserted and not state.removed
+
+
+def test_mirror_lightpath_arrays(fake_range_mirror):
+    m = fake_range_mirror
+    x = np.array([-200, -50, -10, 50])[:, None, None]
+    y = np.array([-5, 5, 10, 15, np.nan])[None, :, None]
+    pitch = np.array([0.5, 1, 1.5, 2.5, 3.5, np.nan])[None, None, :]
+
+    inserted, removed, branch = m.calc_lightpath_arrays(x, y, pitch)
+    assert inserted.shape == removed.shape == branch.shape == (4, 5, 6)
+    states = m.calc_lightpath_states(x, y, pitch)
+    destinations = m.destination_map(x, y, pitch)
+    for idx, (xi, yi, pi) in enumerate(
+        zip(*(arr.ravel() for arr in np.broadcast_arrays(x, y, pitch)))
+    ):
+        expected = m.calc_lightpath_state(xi, yi, pi)
+        assert states[idx] == expected
+        (branch_name, trans), = expected.output.items()
+        assert destinations.ravel()[idx] == (branch_name if trans else None)
+
+
+def test_mirror_destination_map_pitch_scan(fake_range_mirror):
+    m = fake_range_mirror
+    pitch = np.linspace(0.25, 3.75, 8)
+    assert m.destination_map(50, 15, pitch).tolist() == [
+        None, None, None, None, 'L1', 'L1', 'L2', 'L2'
+    ]
+    # Removed mirrors pass beam straight through
+    assert m.destination_map(-50, 15, pitch).tolist() == ['L0'] * 8
+
+
+def test_bend_mirror_lightpath_arrays():
+    FakeBend = make_fake_device(XOffsetMirrorBend)
+    m = FakeBend('TST:MR1', name="Test Mirror",
+                 input_branches=['K0'], output_branches=['K0', 'K1'],
+                 y_ranges=[[-10, 0], [0, 10]])
+    y = np.array([-5, 0, 5, 20])
+    states = m.calc_lightpath_states(0, y, 0)
+    assert states == [m.calc_lightpath_state(0, yi, 0) for yi in y]
+    assert m.destination_map(0, y, 0).tolist() == ['K0', 'K0', 'K1', 'K0']
+
+
+def test_state_mirror_lightpath_arrays():
+    FakeStateMirror = make_fake_device(XOffsetMirrorState)
+    m = FakeStateMirror('TST:MR1', name="Test Mirror",
+                        input_branches=['L0'], output_branches=['L0', 'L1'],
+                        pitch_ranges=[[[0, 1]], [[1, 2]]])
+    coating = np.array([0, 1, 2, 1, 2])
+    pitch = np.array([0.5, 0.5, 0.5, 1.5, 1.5])
+    assert m.calc_lightpath_states(0, coating, pitch) == [
+        m.calc_lightpath_state(0, ci, pi) for ci, pi in zip(coating, pitch)
+    ]
+    assert m.destination_map(0, coating, pitch).tolist() == [
+        None, 'L1', None, None, 'L1'
+    ]
+
+
+def test_xy_mirror_lightpath_arrays(fake_xy_offset_mirror, monkeypatch):
+    xym = fake_xy_offset_mirror
+    xym.insertion._state_initialized = True
+    monkeypatch.setattr(xym.insertion, 'check_inserted',
+                        lambda state: state == 2)
+    monkeypatch.setattr(xym.insertion, 'check_removed',
+                        lambda state: state == 1)
+    inserted, removed, branch = xym.calc_lightpath_arrays(
+        [0, 1, 2, 2], [1, 1, 1, 0], 0
+    )
+    assert inserted.tolist() == [False, False, True, False]
+    assert removed.tolist() == [False, True, False, False]
+    assert branch.tolist() == [0, 0, 0, -1]
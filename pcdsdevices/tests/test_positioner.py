@@ -1,11 +1,15 @@
 import logging
 
 import pytest
+from ophyd.device import Component as Cpt
 from ophyd.signal import Signal
-from ophyd.utils import StatusTimeoutError
+from ophyd.sim import make_fake_device
+from ophyd.utils import LimitError, StatusTimeoutError
 
-from ..positioner import FuncPositioner
+from ..positioner import (FuncPositioner, coordinated_move, restore_velocities,
+                          synchronize_velocities)
 from ..sim import FastMotor, SlowMotor
+from ..smarpod import SmarPod
 
 logger = logging.getLogger(__name__)
 
@@ -108,3 +112,96 @@ def test_funcpos_failure_states(advanced, slow):
     assert not status.success
     with pytest.raises(ValueError):
         FuncPositioner(name='name', move=lambda: 0, get_pos=lambda: 0)
+
+
+class DeferredMotor(FastMotor):
+    velocity = Cpt(Signal, value=1.0)
+    defer_motion = False
+
+    def _setup_move(self, position, status):
+        self.deferred_during_move = self.defer_motion
+        super()._setup_move(position, status)
+
+
+def test_coordinated_move():
+    motors = [FastMotor(name=f'mot{num}', limits=(-10, 10)) for num in range(3)]
+    status = coordinated_move(
+        {motor: num + 1 for num, motor in enumerate(motors)}, wait=True,
+    )
+    assert status.success
+    assert [motor.position for motor in motors] == [1, 2, 3]
+    # One bad target raises its own error, nothing moves
+    with pytest.raises(LimitError):
+        coordinated_move({motors[0]: 5, motors[1]: 20})
+    assert motors[0].position == 1
+    # Several bad targets are reported together
+    with pytest.raises(ValueError) as exc_info:
+        coordinated_move({motors[0]: -20, motors[1]: 20})
+    assert 'mot0' in str(exc_info.value)
+    assert 'mot1' in str(exc_info.value)
+
+
+def test_coordinated_move_go_signal():
+    motors = [DeferredMotor(name=f'mot{num}') for num in range(2)]
+    go = Signal(name='go', value=0)
+    puts = []
+    go.subscribe(lambda value, **kwargs: puts.append(value), run=False)
+    coordinated_move({motors[0]: 1, motors[1]: 2}, go_signal=go,
+                     go_value=3, wait=True)
+    assert puts == [3]
+    assert all(motor.deferred_during_move for motor in motors)
+    assert not any(motor.defer_motion for motor in motors)
+
+
+def test_synchronize_velocities():
+    fast, slow = DeferredMotor(name='fast'), DeferredMotor(name='slow')
+    slow.velocity.put(0.5)
+    originals = synchronize_velocities({fast: 2, slow: 4})
+    # The slow axis needs 8 s, so the fast one is slowed to match
+    assert originals == {fast.velocity: 1.0}
+    assert fast.velocity.get() == 0.25
+    assert slow.velocity.get() == 0.5
+    restore_velocities(originals).wait(timeout=1)
+    assert fast.velocity.get() == 1.0
+    assert synchronize_velocities({fast: 0, slow: 4}) == {}
+
+
+def test_smarpod_multi_axis_move():
+    smarpod = make_fake_device(SmarPod)('SP', name='smarpod')
+    axes = [smarpod.x, smarpod.y, smarpod.z,
+            smarpod.rx, smarpod.ry, smarpod.rz]
+    for axis in axes:
+        axis.readback.sim_put(0)
+        axis.setpoint.sim_put(0)
+        axis.reachable.sim_put(0)
+    checked = []
+
+    def update_reachable(**kwargs):
+        # The controller only reaches poses where x and rx stay close
+        pose = [axis.setpoint.get() for axis in axes]
+        for axis in axes:
+            axis.reachable.sim_put(int(abs(pose[0] - pose[3]) <= 1))
+
+    def check_reachable(axis, position, setup_move):
+        checked.append([sp.setpoint.get() for sp in axes])
+        setup_move(position)
+
+    for axis in axes:
+        axis.setpoint.subscribe(update_reachable, run=False)
+        setup_move = axis._setup_move
+        axis._setup_move = (
+            lambda position, axis=axis, setup_move=setup_move:
+            check_reachable(axis, position, setup_move)
+        )
+    moves = []
+    smarpod.cmd_move.subscribe(lambda value, **kwargs: moves.append(value),
+                               run=False)
+    status = smarpod.multi_axis_move(x_sp=2, rx_sp=2, wait=False)
+    # Every axis saw the whole pose, so the coupled move is reachable
+    assert all(pose == [2, 0, 0, 2, 0, 0] for pose in checked)
+    assert len(checked) == 6
+    assert moves == [0]
+    for axis in axes:
+        axis.readback.sim_put(axis.setpoint.get())
+    status.wait(timeout=2)
+    assert not any(axis.defer_motion for axis in axes)
@@ -0,0 +1,129 @@
+import logging
+
+import pytest
+import yaml
+
+from ..interface import setup_preset_paths
+from ..preset_store import (SQLitePresetStore, export_yaml_presets,
+                            get_preset_store)
+from ..preset_store import main as preset_store_main
+from ..preset_store import migrate_yaml_presets
+from ..sim import FastMotor
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture(scope='function')
+def sqlite_presets(tmp_path):
+    hutch = tmp_path / 'hutch'
+    user = tmp_path / 'user'
+    hutch.mkdir()
+    user.mkdir()
+    setup_preset_paths(backend='sqlite', hutch=hutch, user=user)
+    yield tmp_path
+    setup_preset_paths()
+
+
+def test_sqlite_presets(sqlite_presets):
+    logger.debug('test_sqlite_presets')
+    motor = FastMotor(name='sqlite_motor')
+    motor.mv(4, wait=True)
+    motor.presets.add_hutch('four', comment='four!')
+    motor.presets.add_hutch('zero', 0, comment='center')
+    motor.mv(3, wait=True)
+    motor.presets.add_here_user('sample')
+
+    assert (sqlite_presets / 'hutch' / 'presets.db').exists()
+    assert not list(sqlite_presets.glob('*/*.yml'))
+    assert motor.wm_zero() == -3
+    assert motor.wm_sample() == 0
+    assert motor.wm_four() == 1
+    assert motor.presets.state() == 'sample'
+
+    motor.mv_zero(wait=True)
+    assert motor.presets.state() == 'zero'
+
+    motor.presets.positions.sample.update_comment('hello there')
+    history = motor.presets.positions.sample.history
+    assert len(history) in (1, 2)
+    assert list(history.values())[-1].endswith('hello there')
+
+    motor.presets.positions.zero.deactivate()
+    assert not hasattr(motor, 'wm_zero')
+    with pytest.raises(AttributeError):
+        motor.presets.positions.zero
+
+
+def test_sqlite_presets_desync(sqlite_presets):
+    motor = FastMotor(name='sqlite_motor')
+    other = FastMotor(name='other_motor')
+    assert not motor.presets.sync_needed()
+
+    motor.mv(4, wait=True)
+    motor.presets.add_hutch('four')
+    assert not motor.presets.sync_needed()
+    # Another device's presets do not need a resync
+    other.presets.add_hutch('one', 1)
+    assert not motor.presets.sync_needed()
+
+    # Modify from another object for the same device
+    motor2 = FastMotor(name='sqlite_motor')
+    motor2.mv(5, wait=True)
+    motor2.presets.positions.four.update_pos()
+    assert motor.presets.sync_needed()
+    assert motor.presets.positions.four.pos == 5
+
+
+def test_sqlite_presets_external_change(sqlite_presets):
+    motor = FastMotor(name='sqlite_motor')
+    motor.presets.add_hutch('four', 4)
+    # Simulate another process writing to the file
+    SQLitePresetStore(sqlite_presets / 'hutch').update(
+        'sqlite_motor', 'four', value=6
+    )
+    # Nothing is checked until the poll interval has passed
+    assert motor.presets.positions.four.pos == 4
+    get_preset_store(sqlite_presets / 'hutch')._last_check = None
+    assert motor.presets.positions.four.pos == 6
+
+
+def test_migrate_yaml_presets(tmp_path):
+    yaml_dir = tmp_path / 'yaml'
+    yaml_dir.mkdir()
+    data = {
+        'in': {
+            'value': 1.5,
+            'active': True,
+            'history': {'01 Jan 2024 00:00:00': '    1.5000 first'},
+        },
+        'out': {
+            'value': -2.0,
+            'active': False,
+            'history': {'02 Jan 2024 00:00:00': '   -2.0000'},
+        },
+    }
+    with open(yaml_dir / 'mot.yml', 'w') as f:
+        yaml.dump(data, f)
+
+    assert migrate_yaml_presets(yaml_dir) == 2
+    # Already imported
+    assert migrate_yaml_presets(yaml_dir) == 0
+
+    store = get_preset_store(yaml_dir)
+    assert store.get('mot') == data
+
+    export_dir = tmp_path / 'export'
+    export_dir.mkdir()
+    assert export_yaml_presets(store.path, export_dir) == 1
+    with open(export_dir / 'mot.yml') as f:
+        assert yaml.full_load(f) == data
+
+
+def test_preset_store_cli(tmp_path):
+    yaml_dir = tmp_path / 'yaml'
+    yaml_dir.mkdir()
+    with open(yaml_dir / 'mot.yml', 'w') as f:
+        yaml.dump({'in': {'value': 1, 'active': True, 'history': {}}}, f)
+    db = tmp_path / 'cli.db'
+    preset_store_main(['migrate', str(yaml_dir), '--db', str(db)])
+    assert get_preset_store(db).get('mot')['in']['value'] == 1
@@ -6,11 +6,13 @@ import numpy as np
 import pytest
 from ophyd.device import Component as Cpt
 from ophyd.positioner import SoftPositioner
+from ophyd.signal import Signal
 from ophyd.sim import make_fake_device
 
 from ..pseudopos import (DelayBase, LookupTablePositioner, OffsetMotorBase,
                          PseudoSingleInterface, SimDelayStage, SyncAxesBase,
-                         SyncAxis, SyncAxisOffsetMode, is_strictly_increasing)
+                         SyncAxis, SyncAxisOffsetMode, delay_class_factory,
+                         delay_classes, is_strictly_increasing)
 from ..sim import FastMotor
 
 logger = logging.getLogger(__name__)
@@ -44,6 +46,22 @@ class SyncAxisAuto(SyncAxis):
     offset_mode = SyncAxisOffsetMode.AUTO_FIXED
 
 
+class VelocityMotor(FastMotor):
+    velocity = Cpt(Signal, value=1.0)
+
+    def _setup_move(self, position, status):
+        self.move_velocity = self.velocity.get()
+        super()._setup_move(position, status)
+
+
+class SyncAxisVelocity(SyncAxis):
+    one = Cpt(VelocityMotor)
+    two = Cpt(VelocityMotor)
+
+    scales = {'two': 4}
+    synchronize_motion = True
+
+
 class SyncAxisCrazy(SyncAxis):
     one = Cpt(FastMotor)
     two = Cpt(FastMotor)
@@ -180,6 +198,22 @@ def test_delay_basic():
     np.testing.assert_allclose(stage_s.user_offset.get(), 1.e-6 - 1.e-9)
 
 
+def test_delay_classes(monkeypatch):
+    logger.debug('test_delay_classes')
+    assert delay_class_factory(FastMotor) is SimDelayStage
+    assert delay_classes[FastMotor] is SimDelayStage
+    cls = delay_class_factory(SoftPositioner)
+    assert delay_class_factory(SoftPositioner) is cls
+    assert delay_classes[SoftPositioner] is cls
+
+    # Classes registered the old way are still used
+    class CustomDelay(DelayBase):
+        motor = Cpt(SoftPositioner, init_pos=0)
+
+    monkeypatch.setitem(delay_classes, SoftPositioner, CustomDelay)
+    assert delay_class_factory(SoftPositioner) is CustomDelay
+
+
 def test_subcls_warning():
     logger.debug('test_subcls_warning')
     with pytest.raises(TypeError):
@@ -349,3 +383,17 @@ def test_implicit_mutex(linked_delays: tuple[FakeDelay, FakeDelay]):
     assert delay_one._my_move
     wait_for(delay_two, '_my_move', False)
     assert_no_updates()
+
+
+def test_sync_axis_synchronize_motion():
+    sync = SyncAxisVelocity(name='sync')
+    sync.move(1, wait=True)
+    assert sync.one.position == 1
+    assert sync.two.position == 4
+    # One only has a quarter of the distance to cover
+    assert sync.one.move_velocity == 0.25
+    assert sync.two.move_velocity == 1.0
+    deadline = time.monotonic() + 2
+    while sync.one.velocity.get() != 1.0:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
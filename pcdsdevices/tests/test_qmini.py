@@ -0,0 +1,161 @@
+import json
+import logging
+import os
+import time
+
+import numpy as np
+import pytest
+from ophyd.sim import make_fake_device
+
+from ..lasers.qmini import QminiSpectrometer, QminiSpectrumWriter, load_spectra
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture(scope='function')
+def fake_qmini():
+    FakeQmini = make_fake_device(QminiSpectrometer)
+    qmini = FakeQmini('TST:QMINI', name='qmini')
+    qmini.wavelengths.sim_put(np.linspace(400, 900, 32))
+    qmini.spectrum.sim_put(np.arange(32, dtype=np.float64))
+    qmini.exposure.sim_put(100)
+    qmini.subtract_dark.sim_put(1)
+    return qmini
+
+
+@pytest.mark.parametrize('suffix', ['.npz', '.h5'])
+def test_spectrum_writer_roundtrip(tmp_path, suffix):
+    if suffix == '.h5':
+        pytest.importorskip('h5py')
+    filename = str(tmp_path / f'spectra{suffix}')
+    wavelength = np.linspace(400, 900, 16)
+    metadata = {'exposure (us)': 10, 'settings': {'subtract_dark': True}}
+    with QminiSpectrumWriter(filename, wavelength, metadata,
+                             chunk_shots=4) as writer:
+        for shot in range(10):
+            writer.append(np.full(16, shot, dtype=np.float32),
+                          timestamp=1000.0 + shot)
+        with pytest.raises(ValueError):
+            writer.append(np.zeros(3))
+    spectra = load_spectra(filename)
+    np.testing.assert_array_equal(spectra.wavelength, wavelength)
+    assert spectra.intensity.shape == (10, 16)
+    assert spectra.intensity.dtype == np.float32
+    np.testing.assert_array_equal(spectra.intensity[:, 0], np.arange(10))
+    np.testing.assert_array_equal(spectra.timestamp, 1000 + np.arange(10))
+    assert spectra.metadata == metadata
+
+
+def test_spectrum_writer_bad_suffix(tmp_path):
+    with pytest.raises(ValueError):
+        QminiSpectrumWriter(str(tmp_path / 'spectra.csv'), np.zeros(4))
+
+
+@pytest.mark.parametrize('filename', ['spectrum.txt', 'spectrum.npz'])
+def test_qmini_save_data(fake_qmini, tmp_path, filename):
+    filename = str(tmp_path / filename)
+    fake_qmini.save_data(filename)
+    spectra = load_spectra(filename)
+    np.testing.assert_allclose(spectra.wavelength,
+                               fake_qmini.wavelengths.get())
+    np.testing.assert_array_equal(spectra.intensity,
+                                  [fake_qmini.spectrum.get()])
+    assert spectra.timestamp.shape == (1, )
+    assert spectra.metadata['exposure (us)'] == 100
+    assert spectra.metadata['settings']['subtract_dark'] is True
+    assert spectra.metadata['settings']['correct_prnu'] is False
+
+
+def test_qmini_legacy_json(fake_qmini, tmp_path):
+    filename = str(tmp_path / 'spectrum.txt')
+    fake_qmini.save_data(filename)
+    with open(filename) as fd:
+        data = json.load(fd)
+    # The text format is unchanged
+    assert list(data) == ['timestamp', 'exposure (us)', 'averages',
+                          'settings', 'wavelength (nm)', 'intensity (a.u.)']
+    assert data['intensity (a.u.)'][1] == '1.0'
+
+
+def test_qmini_save_data_default(fake_qmini, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fake_qmini.save_data()
+    # Binary files are opt-in, the default is still JSON text
+    (saved, ) = tmp_path.iterdir()
+    assert saved.suffix == '.txt'
+    assert load_spectra(str(saved)).metadata['exposure (us)'] == 100
+
+
+def test_qmini_recording(fake_qmini, tmp_path):
+    # Files that are rewritten in full can't be recorded to
+    with pytest.raises(ValueError):
+        fake_qmini.start_recording(str(tmp_path / 'recording.npz'))
+    pytest.importorskip('h5py')
+    filename = str(tmp_path / 'recording.h5')
+    fake_qmini.start_recording(filename)
+    for shot in range(5):
+        fake_qmini.spectrum.sim_put(np.full(32, shot, dtype=np.float64))
+    fake_qmini.stop_recording()
+    fake_qmini.spectrum.sim_put(np.zeros(32))
+    spectra = load_spectra(filename)
+    np.testing.assert_array_equal(spectra.intensity[:, 0], np.arange(5))
+    assert np.all(np.diff(spectra.timestamp) >= 0)
+
+
+def write_legacy_json(filename, wavelength, intensity):
+    """Write a spectrum the way save_data always has"""
+    data = {'timestamp': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'exposure (us)': 100,
+            'averages': 1,
+            'settings': {},
+            'wavelength (nm)': [str(x) for x in wavelength],
+            'intensity (a.u.)': [str(y) for y in intensity]
+            }
+    with open(filename, 'w') as fd:
+        fd.write(json.dumps(data))
+
+
+def test_qmini_save_benchmark(tmp_path):
+    shots = 1000
+    wavelength = np.linspace(400, 900, 256)
+    intensity = np.random.default_rng(0).random((shots, 256))
+    results = {}
+
+    json_dir = tmp_path / 'json'
+    json_dir.mkdir()
+    start = time.perf_counter()
+    for shot in range(shots):
+        write_legacy_json(str(json_dir / f'{shot}.txt'), wavelength,
+                          intensity[shot])
+    write_time = time.perf_counter() - start
+    start = time.perf_counter()
+    loaded = [load_spectra(str(json_dir / f'{shot}.txt')).intensity
+              for shot in range(shots)]
+    read_time = time.perf_counter() - start
+    size = sum(entry.stat().st_size for entry in json_dir.iterdir())
+    results['json'] = (size, write_time, read_time)
+    np.testing.assert_allclose(np.concatenate(loaded), intensity)
+
+    suffixes = ['.npz']
+    try:
+        import h5py  # noqa
+        suffixes.append('.h5')
+    except ImportError:
+        pass
+    for suffix in suffixes:
+        filename = str(tmp_path / f'spectra{suffix}')
+        start = time.perf_counter()
+        with QminiSpectrumWriter(filename, wavelength) as writer:
+            for shot in range(shots):
+                writer.append(intensity[shot])
+        write_time = time.perf_counter() - start
+        start = time.perf_counter()
+        spectra = load_spectra(filename)
+        read_time = time.perf_counter() - start
+        np.testing.assert_array_equal(spectra.intensity, intensity)
+        results[suffix] = (os.path.getsize(filename), write_time, read_time)
+
+    for fmt, (size, write_time, read_time) in results.items():
+        logger.info('%s: %d spectra, %.1f MB, write %.2f s, read %.2f s',
+                    fmt, shots, size / 1e6, write_time, read_time)
+    assert results['.npz'][0] < results['json'][0]
@@ -1,12 +1,13 @@
 import logging
 
+import numpy as np
 import pytest
 from bluesky import RunEngine
 from bluesky.plan_stubs import sleep
 from bluesky.preprocessors import fly_during_wrapper, run_wrapper
 from ophyd.sim import NullStatus, make_fake_device
 
-from ..sequencer import EventSequencer
+from ..sequencer import EventSequencer, sequence_dtype, to_sequence_array
 
 logger = logging.getLogger(__name__)
 
@@ -46,10 +47,7 @@ class SimSequencer(FakeSequencer):
         self.sequence.bc_array.sim_put([0] * 2048)
 
         # Initialize sequence
-        initial_sequence = [[0] * 20,
-                            [0] * 20,
-                            [0] * 20,
-                            [0] * 20]
+        initial_sequence = [[0, 0, 0, 0]] * 20
         self.sequence.put_seq(initial_sequence)
 
     def kickoff(self):
@@ -183,3 +181,106 @@ def test_sequence_get_put():
 @pytest.mark.timeout(5)
 def test_seq_disconnected():
     EventSequencer('ECS:TST:100', name='seq')
+
+
+@pytest.fixture(scope='function')
+def loaded_sequence():
+    seq = FakeSequencer('ECS:TST:100', name='seq')
+    seq.sequence_length.sim_put(0)
+    for sig in (seq.sequence.ec_array, seq.sequence.bd_array,
+                seq.sequence.fd_array, seq.sequence.bc_array):
+        sig.sim_put([0] * 2048)
+    return seq
+
+
+def record_puts(seq):
+    puts = []
+    for attr in ('ec_array', 'bd_array', 'fd_array', 'bc_array', 'seq_proc'):
+        sig = getattr(seq.sequence, attr)
+        sig.subscribe(lambda *args, attr=attr, **kwargs: puts.append(attr),
+                      run=False)
+    return puts
+
+
+def test_to_sequence_array():
+    seq = to_sequence_array([[182, 12, 0, 0], [170, 2, 0, 1]])
+    assert seq.dtype == sequence_dtype
+    assert seq['ec'].tolist() == [182, 170]
+    assert seq['bc'].tolist() == [0, 1]
+    assert len(to_sequence_array([])) == 0
+    np.testing.assert_array_equal(to_sequence_array(seq), seq)
+    for bad in ([[1, 2, 3]], [[1, 2, 3, -1]], [[1, 2, 3, 0.5]],
+                [[1, 2, 3, np.nan]], [[0, 0, 0, 0]] * 2049):
+        with pytest.raises(ValueError):
+            to_sequence_array(bad)
+
+
+def test_put_get_seq(loaded_sequence):
+    seq = loaded_sequence
+    lines = [[182, 12, 0, 0], [170, 2, 0, 0], [169, 1, 0, 0]]
+    seq.sequence.put_seq(lines)
+    assert seq.sequence_length.get() == 3
+    assert seq.sequence.get_seq() == lines
+    assert len(seq.sequence.get_seq(current_length=False)) == 2048
+    assert seq.sequence.get_seq_array()['ec'].tolist() == [182, 170, 169]
+
+
+def test_put_seq_diff(loaded_sequence):
+    seq = loaded_sequence
+    puts = record_puts(seq)
+    seq.sequence.put_seq([[182, 12, 0, 0], [170, 2, 0, 0]])
+    assert puts == ['ec_array', 'bd_array', 'fd_array', 'bc_array',
+                    'seq_proc']
+    puts.clear()
+    seq.sequence.put_seq([[182, 12, 0, 0], [170, 2, 0, 3]], verify=False)
+    assert puts == ['bc_array', 'seq_proc']
+    puts.clear()
+    seq.sequence.put_seq([[182, 12, 0, 0], [170, 2, 0, 3]])
+    assert puts == []
+
+
+def test_put_seq_verify(loaded_sequence):
+    seq = loaded_sequence
+    seq.sequence.put_seq([[182, 12, 0, 0]])
+    assert seq.sequence.verify_seq()
+    # Someone else edits the sequence
+    seq.sequence.ec_array.sim_put([0] * 2048)
+    assert not seq.sequence.verify_seq()
+    puts = record_puts(seq)
+    seq.sequence.put_seq([[182, 12, 0, 0]])
+    assert puts == ['ec_array', 'bd_array', 'fd_array', 'bc_array',
+                    'seq_proc']
+    assert seq.sequence.get_seq() == [[182, 12, 0, 0]]
+
+
+def test_put_seq_stale_readbacks(loaded_sequence):
+    seq = loaded_sequence
+    seq.sequence.put_seq([[182, 12, 0, 0], [170, 2, 0, 0]])
+    # The monitors have not caught up with the upload yet
+    seq.sequence.ec_array.sim_put([0] * 2048)
+    seq.sequence.bd_array.sim_put([0] * 2048)
+    puts = record_puts(seq)
+    seq.sequence.put_seq([[182, 12, 0, 0], [170, 3, 0, 0]])
+    assert puts == ['ec_array', 'bd_array', 'fd_array', 'bc_array',
+                    'seq_proc']
+    assert seq.sequence.get_seq() == [[182, 12, 0, 0], [170, 3, 0, 0]]
+
+
+def test_sequence_library(loaded_sequence):
+    seq = loaded_sequence
+    library = seq.sequence.library
+    library.add('pump', [[90, 0, 0, 0], [91, 1, 0, 0]])
+    library.add('probe', [[92, 0, 0, 0]])
+    assert library.names() == ['pump', 'probe']
+    with pytest.raises(ValueError):
+        library.add('bad', [[90, 0, 0]])
+    assert 'bad' not in library
+    library.load('pump')
+    assert library.current == 'pump'
+    assert seq.sequence.get_seq() == [[90, 0, 0, 0], [91, 1, 0, 0]]
+    library.load('probe')
+    assert seq.sequence_length.get() == 1
+    assert seq.sequence.get_seq() == [[92, 0, 0, 0]]
+    library.remove('probe')
+    assert library.current is None
+    assert len(library) == 1
@@ -4,6 +4,7 @@ import time
 from typing import Any
 from unittest.mock import MagicMock, Mock
 
+import numpy as np
 import pytest
 from ophyd import Component as Cpt
 from ophyd import Device
@@ -12,9 +13,12 @@ from ophyd.sim import FakeEpicsSignal
 from ophyd.status import Status
 
 from .. import signal as signal_module
-from ..signal import (AggregateSignal, AvgSignal, MultiDerivedSignal,
+from ..signal import (AggregateSignal, AllReducer, AnyReducer, AvgSignal,
+                      BitwiseOrReducer, CountReducer, EpicsSignalEditMD,
+                      MaxReducer, MinReducer, MultiDerivedSignal,
                       MultiDerivedSignalRO, PytmcSignal, ReadOnlyError,
-                      SignalEditMD, UnitConversionDerivedSignal)
+                      RollingStats, RollingStatSignal, SignalEditMD,
+                      SummarySignal, SumReducer, UnitConversionDerivedSignal)
 from ..type_hints import OphydDataType, SignalToValue
 
 logger = logging.getLogger(__name__)
@@ -60,6 +64,106 @@ def test_avg_signal():
     assert cb.called
 
 
+def test_avg_signal_max_rate():
+    sig = Signal(name='raw')
+    avg = AvgSignal(sig, 3, name='avg', max_rate=100)
+    for value in range(1, 6):
+        sig.put(value)
+    for _ in range(100):
+        if avg.coalescer.delivered == 5:
+            break
+        time.sleep(0.01)
+    assert avg.coalescer.delivered == 5
+    # Only the last 3 values are averaged
+    assert avg.get() == 4
+    assert sorted(avg.values) == [3, 4, 5]
+
+
+def test_rolling_stats():
+    stats = RollingStats(size=4)
+    values = [1.0, np.nan, 5.0, 2.0, 8.0, -3.0, np.nan, np.nan, np.nan]
+    for index, value in enumerate(values):
+        stats.add(value)
+        window = np.array(values[max(index - 3, 0):index + 1])
+        if np.isnan(window).all():
+            assert np.isnan(stats.mean)
+            assert stats.count == 0
+            continue
+        assert stats.count == np.count_nonzero(~np.isnan(window))
+        assert np.isclose(stats.mean, np.nanmean(window))
+        assert np.isclose(stats.std, np.nanstd(window))
+        assert stats.min == np.nanmin(window)
+        assert stats.max == np.nanmax(window)
+        assert np.isclose(stats.percentile(50), np.nanpercentile(window, 50))
+
+
+def test_rolling_stats_offset():
+    # Pulse energies sitting on a large baseline
+    values = 1e6 + np.random.default_rng(0).normal(0, 1e-3, 1000)
+    stats = RollingStats(size=100)
+    for index, value in enumerate(values):
+        stats.add(value)
+        window = values[max(index - 99, 0):index + 1]
+        assert stats.std == pytest.approx(np.std(window), rel=1e-6)
+    assert stats.mean == pytest.approx(np.mean(values[-100:]), abs=1e-6)
+
+
+def test_avg_signal_buffer():
+    sig = Signal(name='raw')
+    avg = AvgSignal(sig, 3, name='avg')
+    sig.put(1)
+    sig.put(2)
+    # The buffer keeps the ring layout it always had
+    np.testing.assert_array_equal(avg.values, [1, 2, np.nan])
+    assert avg.index == 2
+    sig.put(3)
+    sig.put(4)
+    np.testing.assert_array_equal(avg.values, [4, 2, 3])
+    assert avg.index == 1
+    avg.reset_buffer()
+    assert np.isnan(avg.values).all()
+    assert avg.index == 0
+
+
+def test_rolling_stats_duration():
+    stats = RollingStats(duration=10)
+    now = time.time()
+    stats.extend([1, 2, 3], [now - 20, now - 5, now])
+    assert stats.values.tolist() == [2, 3]
+    assert stats.mean == 2.5
+    with pytest.raises(ValueError):
+        RollingStats()
+
+
+class AvgStatsDevice(Device):
+    raw = Cpt(Signal, value=0)
+    avg = Cpt(AvgSignal, 'raw', averages=3)
+    std = Cpt(RollingStatSignal, 'avg', stat='std')
+    high = Cpt(RollingStatSignal, 'avg', stat=100)
+
+
+def test_rolling_stat_signal():
+    dev = AvgStatsDevice(name='dev')
+    for value in (2, 4, 4, 4, 5):
+        dev.raw.put(value)
+    assert np.isclose(dev.avg.get(), np.mean([4, 4, 5]))
+    assert np.isclose(dev.std.get(), np.std([4, 4, 5]))
+    assert dev.high.get() == 5
+    with pytest.raises(ValueError):
+        RollingStatSignal(dev.avg, stat='median', name='median')
+
+
+def test_avg_signal_trigger_snapshot():
+    sig = Signal(name='raw')
+    avg = AvgSignal(sig, 2, name='avg')
+    sig.put(1)
+    sig.put(3)
+    avg.trigger().wait()
+    sig.put(10)
+    assert avg.last_snapshot.mean == 2
+    assert avg.last_snapshot.values.tolist() == [1, 3]
+
+
 def test_avg_signal_with_duration():
     logger.debug("test_avg_signal_with_duration")
     sig = Signal(name='raw')
@@ -235,6 +339,58 @@ def test_editmd_signal():
     assert cache['precision'] == 4
 
 
+class LazyEnumDevice(Device):
+    state = Cpt(EpicsSignalEditMD, 'TST:LAZY', enum_attrs=[None, 'one', 'two'],
+                lazy_enum_attrs=True)
+    one = Cpt(Signal)
+    two = Cpt(Signal)
+
+
+@pytest.mark.parametrize('trigger', ['enum_strs', 'put'])
+def test_editmd_lazy_enum_attrs(trigger):
+    logger.debug('test_editmd_lazy_enum_attrs')
+    dev = LazyEnumDevice(name='dev')
+    dev.one.put('In')
+    dev.two.put('Out')
+    sig = dev.state
+    # Nothing is subscribed to, and the connection does not wait on them
+    assert not sig._enum_subscriptions
+    sig._metadata.update(connected=True, enum_strs=('Unknown', 'A', 'B'))
+    sig._run_metadata_callbacks()
+    assert sig.connected
+    assert sig.metadata['enum_strs'] == ['Unknown', 'A', 'B']
+    assert not sig._enum_subscriptions
+
+    if trigger == 'enum_strs':
+        assert sig.enum_strs == ['Unknown', 'In', 'Out']
+    else:
+        sig.check_value('In')
+    assert sig.metadata['enum_strs'] == ['Unknown', 'In', 'Out']
+    # Further updates arrive by subscription
+    dev.two.put('Gone')
+    assert sig.enum_strs == ['Unknown', 'In', 'Gone']
+    dev.destroy()
+
+
+class LazyNoneEnumDevice(Device):
+    state = Cpt(EpicsSignalEditMD, 'TST:LAZY', enum_attrs=[None, None],
+                lazy_enum_attrs=True)
+
+
+def test_editmd_lazy_enum_attrs_all_none():
+    logger.debug('test_editmd_lazy_enum_attrs_all_none')
+    dev = LazyNoneEnumDevice(name='dev')
+    sig = dev.state
+    sig._metadata.update(connected=True, enum_strs=('A', 'B'))
+    sig._run_metadata_callbacks()
+    for _ in range(3):
+        assert sig.enum_strs == ['A', 'B']
+    # The attributes are only resolved once, with nothing to subscribe to
+    assert sig._enum_signals == [None, None]
+    assert not sig._enum_subscriptions
+    dev.destroy()
+
+
 @pytest.fixture(params=["method", "func"])
 def multi_derived_ro(request) -> Device:
     class MultiDerivedRO(Device):
@@ -469,6 +625,18 @@ def test_multi_derived_rw_timeout_settle_time(multi_derived_rw: Device, monkeypa
     multi_derived_rw.a.set.assert_called_with(4., timeout=1.1, settle_time=0.1)
 
 
+def test_multi_derived_rw_set_raises(multi_derived_rw: Device, monkeypatch):
+    multi_derived_rw.wait_for_connection()
+    monkeypatch.setattr(
+        multi_derived_rw.b, "set", MagicMock(side_effect=RuntimeError("bad"))
+    )
+    # The failed write is logged and skipped, as before
+    multi_derived_rw.cpt.set(12).wait(timeout=1)
+    assert multi_derived_rw.a.get() == 4.
+    assert multi_derived_rw.b.get() == 2
+    assert multi_derived_rw.c.get() == 4.
+
+
 def wait_until_value(
     ev: threading.Event, values: list, waiting_value: Any, timeout: float = 1.0
 ) -> None:
@@ -594,3 +762,111 @@ def test_multi_derived_connectivity_without_subs(any_multi_derived):
     assert any_multi_derived.connected
     any_multi_derived.destroy()
     assert not any_multi_derived.cpt.connected
+
+
+class SummaryDevice(Device):
+    a = Cpt(Signal, value=0)
+    b = Cpt(Signal, value=0)
+    summary = Cpt(SummarySignal)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.summary.add_signal_by_attr_name('a')
+        self.summary.add_signal_by_attr_name('b')
+
+
+def test_summary_signal_uses_cache(monkeypatch):
+    dev = SummaryDevice(name='dev')
+    cb = Mock()
+    dev.summary.subscribe(cb, run=False)
+    dev.summary.get()
+    get = Mock(side_effect=AssertionError('should use cached values'))
+    monkeypatch.setattr(dev.a, 'get', get)
+    dev.b.put(1)
+    assert cb.call_count == 1
+
+
+@pytest.mark.parametrize(
+    'reducer, expected',
+    [
+        (SumReducer(), lambda values: sum(values)),
+        (CountReducer(), lambda values: sum(bool(v) for v in values)),
+        (AnyReducer(), lambda values: any(values)),
+        (AllReducer(), lambda values: all(values)),
+        (MinReducer(), lambda values: min(values)),
+        (MaxReducer(), lambda values: max(values)),
+    ]
+)
+def test_reducers(reducer, expected):
+    values = [3, 0, 7, 7, 1]
+    reducer.reset(values)
+    assert reducer.ready
+    assert reducer.result == expected(values)
+    for index, new in enumerate([0, 9, 1, 0, 4, 2, 2, 5, 0, 3] * 5):
+        index = index % len(values)
+        reducer.update(values[index], new)
+        values[index] = new
+        assert reducer.result == expected(values)
+
+
+def test_bitwise_or_reducer():
+    reducer = BitwiseOrReducer()
+    reducer.reset([0b001, 0b011, 0])
+    assert reducer.result == 0b011
+    reducer.update(0b011, 0b100)
+    assert reducer.result == 0b101
+    reducer.update(0b001, 0)
+    assert reducer.result == 0b100
+
+
+class SumSignal(AggregateSignal):
+    _reducer_factory = SumReducer
+
+
+class SumDevice(Device):
+    a = Cpt(Signal, value=1)
+    b = Cpt(Signal, value=2)
+    c = Cpt(Signal, value=3)
+    total = Cpt(SumSignal)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for attr in ('a', 'b', 'c'):
+            self.total.add_signal_by_attr_name(attr)
+
+
+def test_aggregate_signal_reducer():
+    dev = SumDevice(name='dev')
+    cb = Mock()
+    dev.total.subscribe(cb, run=False)
+    assert dev.total.get() == 6
+    recalculations = dev.total.calc_stats.recalculations
+    dev.a.put(10)
+    dev.c.put(0)
+    assert cb.call_args[1]['value'] == 12
+    assert dev.total.calc_stats.recalculations == recalculations
+    assert dev.total.calc_stats.incremental_updates == 2
+    assert dev.total.calc_stats.calc_time > 0
+    assert dev.total.get() == 12
+
+
+def test_summary_signal_debounce():
+    dev = SummaryDevice(name='dev')
+    dev.summary.debounce = 0.2
+    cb = Mock()
+    dev.summary.subscribe(cb, run=False)
+    dev.summary.get()
+    for value in range(1, 5):
+        dev.a.put(value)
+        dev.b.put(value)
+    assert cb.call_count == 0
+    assert dev.summary._signals[dev.a].value == 0
+
+    for _ in range(20):
+        if cb.call_count:
+            break
+        time.sleep(0.1)
+    time.sleep(0.1)
+    assert cb.call_count == 1
+    assert dev.summary._signals[dev.a].value == 4
+    assert dev.summary._signals[dev.b].value == 4
@@ -1,5 +1,7 @@
+import enum
 import logging
 import threading
+import time
 from unittest.mock import Mock
 
 import pytest
@@ -12,6 +14,7 @@ from ..device import UpdateComponent as UpCpt
 from ..state import (TWINCAT_MAX_STATES, PVStatePositioner, StatePositioner,
                      StateRecordPositioner, StateStatus,
                      TwinCATStatePositioner, state_config_dotted_names)
+from ..utils import HelpfulIntEnumMeta, dynamic_class_cache
 
 logger = logging.getLogger(__name__)
 
@@ -269,6 +272,61 @@ class NoStatesList(StatePositioner):
     state = Cpt(InOutSignal)
 
 
+def test_states_enum_shared():
+    logger.debug('test_states_enum_shared')
+    first = IntState('INT:1', name='first')
+    second = IntState('INT:2', name='second')
+    assert first.states_enum is second.states_enum
+    # Aliases resolve case-insensitively too
+    assert first.get_state('iN') is first.states_enum.UNO
+    assert first.get_state('out') is first.states_enum.OUT
+
+
+class ManyStates(StatePositioner):
+    state = Cpt(PrefixSignal, 'many', value='state63')
+    states_list = [None] + [f'STATE{num}' for num in range(64)]
+    _states_alias = {}
+
+
+def legacy_getitem(cls, key):
+    """The linear scan that enum string lookups used to do"""
+    if hasattr(key, 'lower'):
+        for item in cls:
+            if item.name.lower() == key.lower():
+                return item
+    return enum.EnumMeta.__getitem__(cls, key)
+
+
+def time_position_reads(positioner, reads):
+    """Return the position reads per second"""
+    start = time.perf_counter()
+    for _ in range(reads):
+        positioner.position
+    return reads / (time.perf_counter() - start)
+
+
+def test_position_read_benchmark(monkeypatch):
+    logger.debug('test_position_read_benchmark')
+    start = time.perf_counter()
+    positioners = [ManyStates('MANY', name=f'many{num}') for num in range(100)]
+    create_time = time.perf_counter() - start
+    assert len({states.states_enum for states in positioners}) == 1
+
+    states = positioners[0]
+    reads = 2000
+    assert states.position == 'STATE63'
+    indexed = time_position_reads(states, reads)
+    with monkeypatch.context() as patch:
+        patch.setattr(HelpfulIntEnumMeta, '__getitem__', legacy_getitem)
+        assert states.position == 'STATE63'
+        scanned = time_position_reads(states, reads)
+    logger.info('100 positioners with 64 states created in %.3f s',
+                create_time)
+    logger.info('position reads: %.0f/s indexed, %.0f/s with a linear scan',
+                indexed, scanned)
+    assert indexed > scanned
+
+
 def test_auto_states():
     logger.debug('test_auto_states')
     states = NoStatesList(prefix='NOSTATE', name='no_state')
@@ -277,6 +335,20 @@ def test_auto_states():
     assert states.states_list == list(enum_strs)
 
 
+def test_auto_states_updated():
+    logger.debug('test_auto_states_updated')
+    states = NoStatesList(prefix='NOSTATE', name='no_state')
+    states.state._run_subs(sub_type=states.state.SUB_META,
+                           enum_strs=('Unknown', 'IN', 'OUT'))
+    # Updated state names, e.g. from a lazy_enum_attrs signal
+    enum_strs = ('Unknown', 'Yag', 'Diode')
+    states.state._run_subs(sub_type=states.state.SUB_META, enum_strs=enum_strs)
+    assert states.states_list == list(enum_strs)
+    assert states.check_value('Diode').value == 2
+    with pytest.raises(ValueError):
+        states.check_value('IN')
+
+
 def test_twincat_state_config_dynamic():
     logger.debug('test_twincat_state_config_dynamic')
 
@@ -377,3 +449,17 @@ def test_twincat_state_config_dynamic():
         fake_states_2d.config.m1_state03
 
     all_states.destroy()
+
+
+def test_twincat_state_config_dynamic_cache():
+    logger.debug('test_twincat_state_config_dynamic_cache')
+
+    class CachedStates(TwinCATStatePositioner):
+        config = UpCpt(state_count=4, motor_count=3)
+
+    FakeCachedStates = make_fake_device(CachedStates)
+    first = FakeCachedStates('CACHE:1', name='first')
+    misses = dynamic_class_cache.misses
+    second = FakeCachedStates('CACHE:2', name='second')
+    assert type(first.config) is type(second.config)
+    assert dynamic_class_cache.misses == misses
@@ -1,11 +1,14 @@
+import os
+
 import numpy as np
 import pytest
 import yaml
 from ophyd.sim import make_fake_device
 
 from ..sim import FastMotor
-from ..targets import (XYGridStage, convert_to_physical, get_unit_meshgrid,
-                       mesh_interpolation, snake_grid_list)
+from ..targets import (SampleGridStore, XYGridStage, convert_to_physical,
+                       get_unit_meshgrid, map_grid, mesh_interpolation,
+                       snake_grid_list, snake_grid_order)
 
 
 @pytest.fixture(scope='function')
@@ -65,13 +68,13 @@ test_sample:
     status: true
   - pos: 26.408203124999986
     status: true
-  - pos: 26.664453124999994
-    status: false
-  - pos: 26.66232812499999
+  - pos: 26.65807812499999
     status: false
   - pos: 26.660203124999992
     status: false
-  - pos: 26.65807812499999
+  - pos: 26.66232812499999
+    status: false
+  - pos: 26.664453124999994
     status: false
     """)
     return sample_file
@@ -400,6 +403,44 @@ def test_snake_like_list():
     assert yy_res == yy_expected
 
 
+def test_snake_grid_order():
+    assert snake_grid_order(2, 2).tolist() == [0, 1, 3, 2]
+    assert snake_grid_order(3, 3).tolist() == [0, 1, 2, 5, 4, 3, 6, 7, 8]
+
+
+def test_map_grid():
+    a_coeffs = [0.0, 4.0, 1.0, 0.0]
+    b_coeffs = [0.0, -1.0, 4.0, 0.0]
+    positions = map_grid(a_coeffs, b_coeffs, 5, 3)
+    assert positions.shape == (5, 3, 2)
+    logic_x, logic_y = get_unit_meshgrid(m_rows=5, n_columns=3)
+    for m in range(5):
+        for n in range(3):
+            x, y = convert_to_physical(a_coeffs, b_coeffs,
+                                       logic_x[m][n], logic_y[m][n])
+            assert positions[m, n].tolist() == [x, y]
+
+
+def test_next_targets(fake_grid_stage, sample_file):
+    stage = fake_grid_stage
+    stage.load('test_sample')
+    mask = stage.get_sample_store().shot_mask()
+    assert mask.shape == (101, 4)
+    assert mask[0].all()
+    assert not mask[1:].any()
+
+    batches = list(stage.next_targets(3))
+    # the first row is shot, and the second row is done backwards
+    assert batches[0][:, :2].tolist() == [[2, 4], [2, 3], [2, 2]]
+    assert batches[0][0, 2:].tolist() == list(stage.compute_mapped_point(2, 4))
+    assert sum(len(batch) for batch in batches) == 100 * 4
+    assert len(batches[-1]) == 400 % 3
+
+    for count in (0, -1):
+        with pytest.raises(ValueError):
+            stage.next_targets(count)
+
+
 def test_reset_status(fake_grid_stage, sample_file):
     stage = fake_grid_stage
     origin_info = stage.get_sample_data('test_sample', sample_file)
@@ -473,3 +514,115 @@ def test_set_status(fake_grid_stage, sample_file):
 
     with pytest.raises(IndexError):
         stage.set_status(1, 5, False, 'test_sample')
+
+
+def test_set_status_journal(fake_grid_stage, sample_file):
+    stage = fake_grid_stage
+    stage.load('test_sample')
+    with open(sample_file) as f:
+        original = f.read()
+    stage.set_status(2, 4, True, 'test_sample')
+    # the yaml file is untouched until the journal is compacted
+    with open(sample_file) as f:
+        assert f.read() == original
+    assert stage.is_target_shot(2, 4)
+    assert stage.get_sample_data('test_sample')['xx'][4]['status']
+
+    stage.compact('test_sample')
+    assert not os.path.exists(str(sample_file) + '.shots')
+    with open(sample_file) as f:
+        yaml_dict = yaml.safe_load(f)
+    assert yaml_dict['test_sample']['xx'][4]['status']
+    assert yaml_dict['test_sample']['yy'][4]['status']
+
+
+def test_set_status_background_compact(fake_grid_stage, sample_file):
+    stage = fake_grid_stage
+    stage.load('test_sample')
+    store = stage.get_sample_store()
+    store.compact_every = 2
+    stage.set_status(1, 1, True, 'test_sample')
+    stage.set_status(1, 2, True, 'test_sample')
+    # The second status starts a compaction without waiting for it
+    store._compact_thread.join(timeout=5)
+    assert not SampleGridStore.has_journal(sample_file)
+    with open(sample_file) as f:
+        yaml_dict = yaml.safe_load(f)
+    assert yaml_dict['test_sample']['xx'][0]['status']
+    assert yaml_dict['test_sample']['xx'][1]['status']
+    assert not store.is_stale()
+
+    # Statuses left in the journal are compacted on close
+    stage.set_status(1, 3, True, 'test_sample')
+    assert SampleGridStore.has_journal(sample_file)
+    stage.close()
+    assert not SampleGridStore.has_journal(sample_file)
+    with open(sample_file) as f:
+        yaml_dict = yaml.safe_load(f)
+    assert yaml_dict['test_sample']['xx'][2]['status']
+
+
+def test_interrupted_compact(fake_grid_stage, sample_file):
+    stage = fake_grid_stage
+    stage.load('test_sample')
+    stage.set_status(1, 1, True, 'test_sample')
+    # Simulate a compaction that died before rewriting the yaml file
+    os.replace(str(sample_file) + SampleGridStore.journal_suffix,
+               str(sample_file) + SampleGridStore.compacting_suffix)
+    stage.set_status(1, 1, False, 'test_sample')
+    stage.set_status(1, 2, True, 'test_sample')
+    store = SampleGridStore(sample_file, 'test_sample')
+    assert not store.is_target_shot(1, 1)
+    assert store.is_target_shot(1, 2)
+    store.compact()
+    assert not SampleGridStore.has_journal(sample_file)
+    with open(sample_file) as f:
+        yaml_dict = yaml.safe_load(f)
+    assert not yaml_dict['test_sample']['xx'][0]['status']
+    assert yaml_dict['test_sample']['xx'][1]['status']
+
+
+def test_status_nearest_point(fake_grid_stage, sample_file):
+    stage = fake_grid_stage
+    stage.load('test_sample')
+    store = stage.get_sample_store()
+    assert store.nearest(-19.834546874999948, 26.664453124999994) == (2, 4)
+    assert store.nearest(-20.59, 26.41) == (1, 1)
+
+
+@pytest.fixture(scope='function')
+def square_grid_stage(tmp_path):
+    FakeGridStage = make_fake_device(XYGridStage)
+    stage = FakeGridStage(x_motor=FastMotor(), y_motor=FastMotor(),
+                          m_points=3, n_points=3, path=str(tmp_path))
+    # An axis-aligned grid, every row of a column has the same x
+    stage.map_points(snake_like=True, top_left=(0, 10), top_right=(10, 10),
+                     bottom_right=(10, 0), bottom_left=(0, 0),
+                     m_rows=3, n_columns=3)
+    stage.save_grid('square')
+    stage.load('square')
+    return stage
+
+
+def test_status_axis_aligned_grid(square_grid_stage):
+    stage = square_grid_stage
+    store = stage.get_sample_store()
+    indices = [store.index(m, n) for m in range(1, 4) for n in range(1, 4)]
+    assert indices == snake_grid_order(3, 3).tolist()
+    stage.set_status(1, 1, True, 'square')
+    mask = store.shot_mask()
+    assert mask.tolist() == [[True, False, False],
+                             [False, False, False],
+                             [False, False, False]]
+    assert not stage.is_target_shot(2, 1)
+
+
+def test_next_targets_axis_aligned_grid(square_grid_stage):
+    stage = square_grid_stage
+    stage.set_status(1, 1, True, 'square')
+    targets = np.concatenate(list(stage.next_targets(4)))
+    points = [tuple(point) for point in targets[:, :2].tolist()]
+    assert (1, 1) not in points
+    assert (2, 1) in points
+    assert (3, 1) in points
+    assert len(points) == 8
@@ -47,3 +47,17 @@ def test_undpoint_safe_abs_2d_sim():
     # Big enough for steps
     undp.move(10, -20)
     wait_assert_approx(lambda: undp.position, (10, -20))
+
+
+def test_undpoint_abs_2d_readback_coalesced():
+    undp = UndPointAbs2DSim("ABS:SIM", name="delta_sim")
+    readbacks = []
+    undp.subscribe(lambda value, **kwargs: readbacks.append(value),
+                   event_type=undp.SUB_READBACK, run=False)
+    for step in range(1, 21):
+        undp.delta_xy._raw_x.put(0.123402 + step * 1e-3)
+    wait_assert_approx(lambda: readbacks[-1] if readbacks else None,
+                       undp.position)
+    coalescer = undp._update_pos
+    assert coalescer.received >= 20
+    assert coalescer.delivered + coalescer.dropped == coalescer.received
@@ -6,13 +6,16 @@ import time
 import pytest
 from ophyd import Component as Cpt
 from ophyd import Device, Signal
+from ophyd.status import Status
 
 from .. import utils
 from ..device import GroupDevice
 from ..pv_positioner import PVPositionerDone
-from ..utils import (move_subdevices_to_start, post_ophyds_to_elog,
-                     reorder_components, set_many, set_standard_ordering,
-                     sort_components_by_kind, sort_components_by_name)
+from ..utils import (CoalescingCallback, DynamicClassCache, HelpfulIntEnum,
+                     SetManyError, coalesce, move_subdevices_to_start,
+                     post_ophyds_to_elog, reorder_components, set_many,
+                     set_standard_ordering, sort_components_by_kind,
+                     sort_components_by_name)
 
 try:
     import pty
@@ -288,3 +291,216 @@ def test_set_many():
     assert device.done.get() == 1
     assert device.setpoint.get() == 5
     assert device.another_signal.get() == 7
+
+
+class ManualSetSignal(Signal):
+    """Signal whose ``set`` only completes when the test says so."""
+    def set(self, value, *, timeout=None, settle_time=None):
+        self.put(value)
+        self.status = Status(obj=self)
+        return self.status
+
+
+class FailingSetSignal(Signal):
+    def set(self, value, *, timeout=None, settle_time=None):
+        raise RuntimeError('Could not set')
+
+
+class PutCallbackSignal(Signal):
+    def put(self, value, callback=None, **kwargs):
+        super().put(value, **kwargs)
+        if callback is not None:
+            callback(pvname=self.name)
+
+
+def wait_for(condition, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'Timed out'
+        time.sleep(0.01)
+
+
+def test_set_many_phases():
+    setpoints = [ManualSetSignal(name=f'sp{num}') for num in range(3)]
+    go = ManualSetSignal(name='go', value=0)
+    st = set_many([{sig: num for num, sig in enumerate(setpoints)}, {go: 1}])
+    assert [sig.get() for sig in setpoints] == [0, 1, 2]
+    for sig in setpoints[:-1]:
+        sig.status.set_finished()
+    wait_for(lambda: st.results[setpoints[1]].done)
+    # Go must wait for every setpoint
+    assert go.get() == 0
+    setpoints[-1].status.set_finished()
+    wait_for(lambda: go.get() == 1)
+    assert not st.done
+    go.status.set_finished()
+    st.wait(timeout=2)
+    assert st.success
+    assert st.results[go].phase == 1
+    assert all(result.elapsed >= 0 for result in st.results.values())
+
+
+def test_set_many_group_by_ioc(monkeypatch):
+    monkeypatch.setattr(utils, '_get_ioc_host', lambda obj: obj.name[0])
+    a_sp, b_sp = ManualSetSignal(name='a_sp'), ManualSetSignal(name='b_sp')
+    a_go = ManualSetSignal(name='a_go', value=0)
+    b_go = ManualSetSignal(name='b_go', value=0)
+    st = set_many([{a_sp: 1, b_sp: 1}, {a_go: 1, b_go: 1}],
+                  group_by_ioc=True)
+    a_sp.status.set_finished()
+    # The first IOC does not wait on the second
+    wait_for(lambda: a_go.get() == 1)
+    assert b_go.get() == 0
+    b_sp.status.set_finished()
+    wait_for(lambda: b_go.get() == 1)
+    a_go.status.set_finished()
+    b_go.status.set_finished()
+    st.wait(timeout=2)
+
+
+def test_set_many_put_callback(monkeypatch):
+    monkeypatch.setattr(utils, '_can_put_with_callback',
+                        lambda obj: isinstance(obj, PutCallbackSignal))
+    sigs = [PutCallbackSignal(name=f'sig{num}') for num in range(100)]
+    st = set_many({sig: num for num, sig in enumerate(sigs)},
+                  use_put_callback=True)
+    st.wait(timeout=2)
+    assert [sig.get() for sig in sigs] == list(range(100))
+    set_many({}).wait(timeout=2)
+
+
+def test_set_many_failure():
+    bad = FailingSetSignal(name='bad')
+    good = Signal(name='good', value=0)
+    later = Signal(name='later', value=0)
+    # By default, a set call that raises is logged and skipped
+    st = set_many([{bad: 1, good: 2}, {later: 3}])
+    st.wait(timeout=2)
+    assert not st.results[bad].success
+    assert later.get() == 3
+    later.put(0)
+    st = set_many([{bad: 1, good: 2}, {later: 3}], fail_on_set_failure=True)
+    with pytest.raises(SetManyError) as exc_info:
+        st.wait(timeout=2)
+    assert list(exc_info.value.failures) == [bad]
+    assert exc_info.value.skipped == 1
+    assert st.results[good].success
+    assert st.results[later].started is None
+    assert later.get() == 0
+    with pytest.raises(RuntimeError):
+        set_many({bad: 1}, raise_on_set_failure=True)
+    with pytest.raises(ValueError):
+        set_many([{good: 1}, {good: 2}])
+
+
+def test_helpful_int_enum_lookup():
+    states = HelpfulIntEnum(
+        'States', {'Unknown': 0, 'OUT': 1, 'Removed': 1, 'Yag': 2}, start=0,
+    )
+    assert states['out'] is states.OUT
+    assert states.yAG is states.Yag
+    assert states['removed'] is states.OUT
+    assert states.from_any('UNKNOWN') is states.Unknown
+    assert states.from_any(2) is states.Yag
+    assert states.exclude(['out', 2]) == {states.Unknown}
+    with pytest.raises(KeyError):
+        states['nope']
+    with pytest.raises(AttributeError):
+        states.nope
+
+
+def test_coalescing_callback():
+    sig = Signal(name='sig')
+    other = Signal(name='other')
+    received = []
+    coalescer = CoalescingCallback(
+        lambda value, obj, **kwargs: received.append((obj.name, value)),
+        max_rate=2,
+    )
+    # Hold the first delivery back for one interval
+    coalescer._last_flush = time.monotonic()
+    sig.subscribe(coalescer, run=False)
+    other.subscribe(coalescer, run=False)
+    for value in range(1, 6):
+        sig.put(value)
+    other.put(10)
+    assert coalescer.queue_depth == 2
+    assert received == []
+    wait_for(lambda: len(received) == 2)
+    assert sorted(received) == [('other', 10), ('sig', 5)]
+    assert coalescer.received == 6
+    assert coalescer.delivered == 2
+    assert coalescer.dropped == 4
+    assert coalescer.max_queue_depth == 2
+    assert coalescer.queue_depth == 0
+
+
+def test_coalesce_batch_decorator():
+    class Collector:
+        def __init__(self):
+            self.batches = []
+
+        @coalesce(batch=True)
+        def collect(self, updates):
+            self.batches.append([update['value'] for update in updates])
+
+    collector = Collector()
+    assert collector.collect is collector.collect
+    assert isinstance(collector.collect, CoalescingCallback)
+    sig = Signal(name='sig')
+    sig.subscribe(collector.collect, run=False)
+    for value in range(5):
+        sig.put(value)
+    wait_for(lambda: collector.collect.delivered == 5)
+    assert sum(collector.batches, []) == list(range(5))
+    assert collector.collect.dropped == 0
+
+
+def test_coalesce_batch_bounded():
+    updates = []
+    coalescer = CoalescingCallback(updates.extend, max_rate=1, batch=True,
+                                   max_queue=3)
+    coalescer._last_flush = time.monotonic()
+    sig = Signal(name='sig')
+    sig.subscribe(coalescer, run=False)
+    for value in range(10):
+        sig.put(value)
+    assert coalescer.queue_depth == 3
+    assert coalescer.dropped == 7
+    wait_for(lambda: coalescer.delivered == 3)
+    # The oldest updates are the ones dropped
+    assert [update['value'] for update in updates] == [7, 8, 9]
+
+
+def test_dynamic_class_cache():
+    cache = DynamicClassCache()
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return type('Dynamic', (object,), {})
+
+    def get_class():
+        results.append(cache.get_or_create(('dynamic', 1), factory))
+
+    results = []
+    threads = [threading.Thread(target=get_class) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(set(results)) == 1
+    assert cache.misses == 1
+    assert cache.hits == 9
+    assert ('dynamic', 1) in cache
+    assert ('dynamic', 2) not in cache
+
+    cache.register(('dynamic', 2), int)
+    assert cache.get_or_create(('dynamic', 2), factory) is int
+    assert len(calls) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == cache.misses == 0
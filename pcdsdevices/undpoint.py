@@ -33,6 +33,7 @@ from ophyd.status import MoveStatus
 from pcdsdevices.interface import MvInterface
 from pcdsdevices.signal import MultiDerivedSignal, UnitConversionDerivedSignal
 from pcdsdevices.type_hints import SignalToValue
+from pcdsdevices.utils import coalesce
 
 DEFAULT_DONE_MOVE_PV = "SIOC:SYS0:ML07:AO216"
 
@@ -242,7 +243,10 @@ class UndPointAbs2D(MvInterface, Device, PositionerBase):
         self._ypos_cache = value
         self._update_pos(**kwargs)
 
+    @coalesce()
     def _update_pos(self, **kwargs):
+        # Readback subscribers only need the latest position, so bursts of
+        # x and y updates are coalesced
         if None not in self.position:
             kwargs.pop("sub_type")
             self._run_subs(
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import collections
+import dataclasses
 import enum
 import inspect
 import logging
@@ -10,19 +12,17 @@ import subprocess
 import sys
 import threading
 import time
-from collections.abc import Iterable
+from collections.abc import Hashable, Iterable, Mapping, Sequence
 from functools import reduce
 from types import MethodType
-from typing import Callable, Iterator, Union
+from typing import Any, Callable, Iterator, Union
 
 import ophyd
 import prettytable
-import sympy.physics.units as units
 from ophyd.device import Component as Cpt
 from ophyd.device import Device
 from ophyd.ophydobj import Kind
 
-from . import custom_units
 from ._html import collapse_list_head, collapse_list_tail
 from .type_hints import Number, OphydDataType
 
@@ -156,6 +156,11 @@ def convert_unit(value: float, unit: str, new_unit: str):
     new_value : float
         The starting value, but converted to the new unit.
     """
+    # sympy is slow to import, so only do so when it is needed
+    import sympy.physics.units as units
+
+    from . import custom_units
+
     try:
         unit = getattr(units, unit)
     except AttributeError:
@@ -430,18 +435,38 @@ EnumId = Union[enum.Enum, int, str]
 
 
 class HelpfulIntEnumMeta(enum.EnumMeta):
+    def _lowercase_members(self) -> dict[str, enum.Enum]:
+        """
+        The lowercase name of every member and alias, mapped to the member.
+
+        Built on first use and stored on the class. Canonical names take
+        precedence over aliases that only differ from them in case.
+        """
+        lookup = self.__dict__.get("_lowercase_lookup")
+        if lookup is None:
+            lookup = {}
+            for item in self:
+                lookup.setdefault(item.name.lower(), item)
+            for name, item in self.__members__.items():
+                lookup.setdefault(name.lower(), item)
+            # Benign race: concurrent builders store equal dicts
+            type.__setattr__(self, "_lowercase_lookup", lookup)
+        return lookup
+
     def __getattr__(self, key):
         if hasattr(key, "lower"):
-            for item in self:
-                if item.name.lower() == key.lower():
-                    return item
+            try:
+                return self._lowercase_members()[key.lower()]
+            except KeyError:
+                pass
         return super().__getattr__(key)
 
     def __getitem__(self, key):
         if hasattr(key, "lower"):
-            for item in self:
-                if item.name.lower() == key.lower():
-                    return item
+            try:
+                return self._lowercase_members()[key.lower()]
+            except KeyError:
+                pass
         return super().__getitem__(key)
 
 
@@ -520,22 +545,444 @@ class HelpfulIntEnum(enum.IntEnum, metaclass=HelpfulIntEnumMeta):
         return set(cls.__members__.values()) - cls.include(identifiers)
 
 
+class CoalescingCallback:
+    """
+    Wrap a subscription callback so that bursts of updates are coalesced.
+
+    Updates are held and delivered later from ophyd's dispatcher, see
+    `schedule_task`, at most ``max_rate`` times per second. By default only
+    the latest update from each object is delivered, and the updates it
+    replaced are counted as dropped. With ``batch=True``, all of the held
+    updates are delivered in one call as ``callback(updates)``, where
+    ``updates`` is a list of the keyword argument dictionaries. At most
+    ``max_queue`` updates are held in batch mode, after that the oldest
+    ones are dropped.
+
+    Use this in place of the callback when subscribing, or use the
+    `coalesce` decorator on a callback method.
+
+    Parameters
+    ----------
+    callback : callable
+        The callback to wrap.
+    max_rate : float, optional
+        Maximum number of deliveries per second. By default, updates are
+        delivered as soon as the dispatcher gets to them.
+    batch : bool, optional
+        Deliver every update in one call instead of the latest ones.
+    max_queue : int, optional
+        Maximum number of updates held in batch mode.
+
+    Attributes
+    ----------
+    received : int
+        The number of updates received.
+    delivered : int
+        The number of updates passed on to the callback.
+    dropped : int
+        The number of updates replaced by a newer one before delivery, or
+        pushed out of a full batch queue.
+    max_queue_depth : int
+        The largest number of updates held at once.
+    """
+    def __init__(
+        self,
+        callback: Callable,
+        max_rate: Number | None = None,
+        batch: bool = False,
+        max_queue: int = 10000,
+    ):
+        self.callback = callback
+        self.min_interval = 1 / max_rate if max_rate else 0.0
+        self.batch = batch
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._pending: dict[Any, dict[str, Any]] = {}
+        self._batch: collections.deque[dict[str, Any]] = collections.deque(
+            maxlen=max_queue
+        )
+        self._scheduled = False
+        self._last_flush = 0.0
+        self.received = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.max_queue_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of updates waiting to be delivered."""
+        return len(self._batch) if self.batch else len(self._pending)
+
+    def __call__(self, **kwargs) -> None:
+        with self._lock:
+            self.received += 1
+            if self.batch:
+                if len(self._batch) == self._batch.maxlen:
+                    # The oldest update falls off the end
+                    self.dropped += 1
+                self._batch.append(kwargs)
+            else:
+                key = kwargs.get('obj')
+                if key in self._pending:
+                    self.dropped += 1
+                self._pending[key] = kwargs
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+            if self._scheduled:
+                return
+            self._scheduled = True
+            delay = self._last_flush + self.min_interval - time.monotonic()
+        schedule_task(self.flush, delay=delay if delay > 0 else None)
+
+    def flush(self) -> None:
+        """Deliver the held updates now."""
+        with self._lock:
+            self._scheduled = False
+            self._last_flush = time.monotonic()
+            if self.batch:
+                updates = list(self._batch)
+                self._batch.clear()
+            else:
+                updates = list(self._pending.values())
+                self._pending = {}
+        if not updates:
+            return
+        try:
+            if self.batch:
+                self.callback(updates)
+            else:
+                for kwargs in updates:
+                    self.callback(**kwargs)
+        finally:
+            with self._lock:
+                self.delivered += len(updates)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} callback={self.callback!r} "
+            f"received={self.received} delivered={self.delivered} "
+            f"dropped={self.dropped} queue_depth={self.queue_depth}>"
+        )
+
+
+class _CoalescedMethod:
+    """Descriptor that gives each instance its own `CoalescingCallback`."""
+    def __init__(
+        self,
+        func: Callable,
+        max_rate: Number | None,
+        batch: bool,
+        max_queue: int,
+    ):
+        self.func = func
+        self.max_rate = max_rate
+        self.batch = batch
+        self.max_queue = max_queue
+        # Component subscription decorators look the method up by __name__
+        self.name = self.__name__ = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = self.__name__ = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        callback = CoalescingCallback(
+            self.func.__get__(instance, owner),
+            max_rate=self.max_rate,
+            batch=self.batch,
+            max_queue=self.max_queue,
+        )
+        # Cache on the instance, so later lookups skip the descriptor
+        instance.__dict__[self.name] = callback
+        return callback
+
+
+def coalesce(
+    max_rate: Number | None = None,
+    batch: bool = False,
+    max_queue: int = 10000,
+) -> Callable[[Callable], _CoalescedMethod]:
+    """
+    Decorator for subscription callback methods to coalesce their updates.
+
+    Each instance gets its own `CoalescingCallback` as the attribute, so the
+    method is subscribed the same way as before and its counters are
+    available on e.g. ``self._update_pos.dropped``. This can be combined
+    with the component subscription decorators, e.g. ``@state.sub_value``,
+    which must be applied last.
+
+    Parameters
+    ----------
+    max_rate : float, optional
+        Maximum number of deliveries per second.
+    batch : bool, optional
+        Deliver every update in one call as ``method(updates)``.
+    max_queue : int, optional
+        Maximum number of updates held in batch mode.
+    """
+    def wrapper(func: Callable) -> _CoalescedMethod:
+        return _CoalescedMethod(func, max_rate=max_rate, batch=batch,
+                                max_queue=max_queue)
+
+    return wrapper
+
+
+@dataclasses.dataclass
+class SetResult:
+    """
+    Timing and outcome of one write issued by `set_many`.
+
+    Times are from `time.monotonic`. ``started`` stays `None` for writes
+    that were skipped because an earlier phase failed.
+    """
+    value: Any
+    phase: int
+    started: float | None = None
+    finished: float | None = None
+    exception: Exception | None = None
+
+    @property
+    def done(self) -> bool:
+        return self.finished is not None
+
+    @property
+    def success(self) -> bool:
+        return self.done and self.exception is None
+
+    @property
+    def elapsed(self) -> float | None:
+        """Seconds from issuing the write to its completion."""
+        if self.started is None or self.finished is None:
+            return None
+        return self.finished - self.started
+
+
+class SetManyError(RuntimeError):
+    """Raised through a `SetManyStatus` when any of its writes failed."""
+    def __init__(self, failures: dict[Any, SetResult], skipped: int = 0):
+        self.failures = failures
+        self.skipped = skipped
+        names = ', '.join(
+            f"{getattr(obj, 'name', obj)} ({result.exception})"
+            for obj, result in failures.items()
+        )
+        msg = f"{len(failures)} write(s) failed: {names}"
+        if skipped:
+            msg += f"; {skipped} later write(s) were skipped"
+        super().__init__(msg)
+
+
+def _can_put_with_callback(obj: Any) -> bool:
+    """Whether ``obj`` can be written by a non-blocking EPICS put."""
+    return isinstance(obj, ophyd.signal.EpicsSignal)
+
+
+def _get_ioc_host(obj: Any) -> str | None:
+    """The host:port of the IOC serving ``obj``, if known."""
+    pv = getattr(obj, '_write_pv', None) or getattr(obj, '_read_pv', None)
+    return getattr(pv, 'host', None)
+
+
+class SetManyStatus(ophyd.status.Status):
+    """
+    A single flat status for many concurrent writes, see `set_many`.
+
+    Every write in a phase is issued at once and all of them report back
+    through one shared callback. The next phase starts when the previous
+    phase has completed. With ``group_by_ioc``, each IOC works through its
+    own phases independently of the others.
+
+    The status finishes once every chain of phases has completed. If any
+    write failed, the status fails with a `SetManyError` and the phases
+    after the failure are skipped for that chain. A ``set`` call that
+    raises is only logged and skipped, unless ``fail_on_set_failure`` is
+    given.
+
+    Attributes
+    ----------
+    results : dict
+        Map of each object to its `SetResult`.
+    """
+    def __init__(
+        self,
+        phases: list[Mapping[Any, OphydDataType]],
+        *,
+        owner: ophyd.ophydobj.OphydObject | None = None,
+        timeout: Number | None = None,
+        settle_time: Number | None = None,
+        use_put_callback: bool = False,
+        group_by_ioc: bool = False,
+        fail_on_set_failure: bool = False,
+    ):
+        super().__init__(obj=owner)
+        self._write_log = owner.log if owner is not None else logger
+        self._write_timeout = timeout
+        self._write_settle_time = settle_time
+        self._use_put_callback = use_put_callback
+        self._fail_on_set_failure = fail_on_set_failure
+        self._skipped_failures: set[Any] = set()
+        self._set_lock = threading.Lock()
+        self.results: dict[Any, SetResult] = {}
+        self._chains: dict[Hashable, list[dict[Any, OphydDataType]]] = {}
+        for index, phase in enumerate(phases):
+            for obj, value in phase.items():
+                if obj in self.results:
+                    raise ValueError(
+                        f"{getattr(obj, 'name', obj)} is set more than once"
+                    )
+                self.results[obj] = SetResult(value=value, phase=index)
+                key = _get_ioc_host(obj) if group_by_ioc else None
+                chain = self._chains.setdefault(
+                    key, [{} for _ in range(len(phases))]
+                )
+                chain[index][obj] = value
+        for key, chain in self._chains.items():
+            self._chains[key] = [phase for phase in chain if phase]
+        self._children: dict[ophyd.status.StatusBase, tuple] = {}
+        self._chain_index = dict.fromkeys(self._chains, 0)
+        self._chain_pending = dict.fromkeys(self._chains, 0)
+        self._chain_failed = dict.fromkeys(self._chains, False)
+        self._chains_active = len(self._chains)
+
+    def start(self, raise_on_set_failure: bool = False) -> None:
+        """Issue the writes of the first phase of every chain."""
+        if not self._chains:
+            self.set_finished()
+            return
+        for key in list(self._chains):
+            self._start_phase(key, 0, raise_on_set_failure)
+
+    def _write(self, obj: Any, value: OphydDataType) -> ophyd.status.StatusBase:
+        if self._use_put_callback and _can_put_with_callback(obj):
+            st = ophyd.status.Status(
+                obj=obj,
+                timeout=self._write_timeout,
+                settle_time=self._write_settle_time,
+            )
+
+            def put_callback(**kwargs):
+                st.set_finished()
+
+            obj.put(value, callback=put_callback)
+            return st
+        try:
+            return obj.set(value, timeout=self._write_timeout,
+                           settle_time=self._write_settle_time)
+        except TypeError as exc:
+            if "settle_time" in str(exc):
+                # It's probably a Positioner, which doesn't accept *settle_time*
+                return obj.set(value, timeout=self._write_timeout)
+            raise
+
+    def _start_phase(
+        self,
+        key: Hashable,
+        index: int,
+        raise_on_set_failure: bool = False,
+    ) -> None:
+        phase = self._chains[key][index]
+        with self._set_lock:
+            self._chain_pending[key] = len(phase)
+        for obj, value in phase.items():
+            self.results[obj].started = time.monotonic()
+            try:
+                st = self._write(obj, value)
+            except Exception as ex:
+                self._write_log.exception(
+                    "Failed to set %s to %s", getattr(obj, 'name', obj), value
+                )
+                if not self._fail_on_set_failure:
+                    self._skipped_failures.add(obj)
+                self._write_done(key, obj, ex)
+                if raise_on_set_failure:
+                    raise
+            else:
+                with self._set_lock:
+                    self._children[st] = (key, obj)
+                st.add_callback(self._child_done)
+
+    def _child_done(self, status: ophyd.status.StatusBase) -> None:
+        """The callback shared by all of the individual writes."""
+        with self._set_lock:
+            key, obj = self._children.pop(status)
+        exc = None
+        if not status.success:
+            exc = status.exception() or RuntimeError(
+                f"Failed to set {getattr(obj, 'name', obj)}"
+            )
+        self._write_done(key, obj, exc)
+
+    def _write_done(
+        self,
+        key: Hashable,
+        obj: Any,
+        exc: Exception | None,
+    ) -> None:
+        result = self.results[obj]
+        result.finished = time.monotonic()
+        result.exception = exc
+        with self._set_lock:
+            if exc is not None and obj not in self._skipped_failures:
+                self._chain_failed[key] = True
+            self._chain_pending[key] -= 1
+            if self._chain_pending[key] > 0:
+                return
+            index = self._chain_index[key] + 1
+            if not self._chain_failed[key] and index < len(self._chains[key]):
+                self._chain_index[key] = index
+                next_phase = index
+            else:
+                next_phase = None
+                self._chains_active -= 1
+            finished = self._chains_active == 0
+        if next_phase is not None:
+            # Don't issue new writes from inside another write's callback
+            schedule_task(self._start_phase, args=(key, next_phase))
+        elif finished:
+            self._finish()
+
+    def _finish(self) -> None:
+        failures = {
+            obj: result for obj, result in self.results.items()
+            if result.exception is not None
+            and obj not in self._skipped_failures
+        }
+        if not failures:
+            self.set_finished()
+            return
+        skipped = sum(
+            result.started is None for result in self.results.values()
+        )
+        self.set_exception(SetManyError(failures, skipped=skipped))
+
+
 def set_many(
-    to_set: dict[ophyd.Signal, OphydDataType],
+    to_set: Mapping[ophyd.Signal, OphydDataType]
+    | Sequence[Mapping[ophyd.Signal, OphydDataType]],
     *,
     owner: ophyd.ophydobj.OphydObject | None = None,
     timeout: Number | None = None,
     settle_time: Number | None = None,
     raise_on_set_failure: bool = False,
-) -> ophyd.status.StatusBase:
+    use_put_callback: bool = False,
+    group_by_ioc: bool = False,
+    fail_on_set_failure: bool = False,
+) -> SetManyStatus:
     """
     Call ``set`` on all given signal-to-value pairs with a single Status
     return value.
 
+    All of the writes are issued at once. To order them, pass a list of
+    dictionaries instead: each is a phase that starts only once every write
+    of the previous phase has completed, e.g. all setpoints before the
+    "go" signal.
+
     Parameters
     ----------
-    to_set : Dict[ophyd.Signal, OphydDataType]
-        Dictionary of Signal to data to ``set``.
+    to_set : Dict[ophyd.Signal, OphydDataType] or list of such dicts
+        Dictionary of Signal to data to ``set``, or a list of them to be
+        written in order.
 
     owner : OphydObject, optional
         The owner object, to be used for logging / Status object attribution.
@@ -547,42 +994,43 @@ def set_many(
         Per-signal settle time to configure during set.
 
     raise_on_set_failure : bool, optional
-        Raise if any of the ``set`` calls fail.
+        Raise if any of the ``set`` calls of the first phase fail.
 
-    Returns
-    -------
-    status : ophyd.Status.StatusBase
-        One Status or AndStatus instance that reflects the completion status of
-        the setting all signal to the provided values.
-    """
-    statuses = []
-    log = owner.log if owner is not None else logger
-    for signal, value in to_set.items():
-        # Set the actual signal value
-        try:
-            try:
-                st = signal.set(value, timeout=timeout, settle_time=settle_time)
-            except TypeError as exc:
-                if "settle_time" in str(exc):
-                    # It's probably a Positioner, which doesn't accept *settle_time*
-                    st = signal.set(value, timeout=timeout)
-                else:
-                    raise
-        except Exception:
-            log.exception("Failed to set %s to %s", signal.name, value)
-            if raise_on_set_failure:
-                raise
-        else:
-            statuses.append(st)
+    use_put_callback : bool, optional
+        Write EPICS signals with a single non-blocking put each, finishing
+        when the IOC reports the put as complete, rather than with ``set``,
+        which waits for the readback to match the setpoint.
 
-    if not statuses:
-        st = ophyd.status.Status(obj=owner)
-        st.set_finished()
-        return st
+    group_by_ioc : bool, optional
+        Work through the phases separately for the signals of each IOC, so
+        that one IOC does not wait on another's previous phase.
 
-    status = statuses[0]
-    for st in statuses[1:]:
-        status = ophyd.status.AndStatus(status, st)
+    fail_on_set_failure : bool, optional
+        Fail the returned status if any of the ``set`` calls raise. By
+        default, these writes are logged and skipped, and only writes that
+        complete unsuccessfully fail the status.
+
+    Returns
+    -------
+    status : SetManyStatus
+        One Status that reflects the completion status of setting all
+        signals to the provided values. Its ``results`` attribute holds the
+        timing and any failure of each write.
+    """
+    if isinstance(to_set, Mapping):
+        phases = [to_set]
+    else:
+        phases = list(to_set)
+    status = SetManyStatus(
+        phases,
+        owner=owner,
+        timeout=timeout,
+        settle_time=settle_time,
+        use_put_callback=use_put_callback,
+        group_by_ioc=group_by_ioc,
+        fail_on_set_failure=fail_on_set_failure,
+    )
+    status.start(raise_on_set_failure=raise_on_set_failure)
     return status
 
 
@@ -620,6 +1068,89 @@ def maybe_make_method(func: Callable | None, owner: object) -> Callable | None:
     return func
 
 
+class DynamicClassCache:
+    """
+    Thread-safe cache of dynamically generated classes.
+
+    Factories that build classes with ``type()`` should route through
+    here so that each distinct shape is only ever created once per
+    process, no matter how many devices request it.
+
+    Keys must be hashable and should include every parameter that
+    affects the generated class, including the requesting base class.
+
+    Attributes
+    ----------
+    hits : int
+        The number of requests that were served from the cache.
+    misses : int
+        The number of requests that had to build a new class.
+    """
+    def __init__(self):
+        self._classes: dict[Hashable, type] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], type]) -> type:
+        """
+        Return the class stored at ``key``, calling ``factory`` to make it
+        if this is the first request.
+
+        Parameters
+        ----------
+        key : hashable
+            The full parameter tuple that identifies the class.
+        factory : callable
+            Zero-argument callable that returns the new class.
+
+        Returns
+        -------
+        cls : type
+            The cached or newly created class.
+        """
+        with self._lock:
+            try:
+                cls = self._classes[key]
+            except KeyError:
+                self.misses += 1
+                cls = factory()
+                self._classes[key] = cls
+            else:
+                self.hits += 1
+        return cls
+
+    def register(self, key: Hashable, cls: type) -> None:
+        """
+        Store a pre-made class at ``key``, replacing any existing entry.
+        """
+        with self._lock:
+            self._classes[key] = cls
+
+    def clear(self) -> None:
+        """Drop all cached classes and reset the counters."""
+        with self._lock:
+            self._classes.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._classes
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} classes={len(self)} "
+            f"hits={self.hits} misses={self.misses}>"
+        )
+
+
+# The process-wide cache shared by all of our dynamic class factories
+dynamic_class_cache = DynamicClassCache()
+
+
 def format_ophyds_to_html(obj, allow_child=False):
     """
     Recursively construct html that contains the output from .status() for
@@ -1,10 +1,8 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
 import re
-import time
 from functools import partial
 
 import qtawesome as qta
@@ -211,7 +209,10 @@ class QminiBase:
     # Save spectra functions
     def save_data(self, **kwargs):
         """
-        Save the spectrum and qmini settings to a text file.
+        Save the spectrum and qmini settings to a file.
+
+        Spectra are saved as JSON text, or as binary ``.npz`` or HDF5 files
+        if picked, see `QminiSpectrometer.save_data`.
         """
 
         file = self.file_dialog()
@@ -220,25 +221,7 @@ class QminiBase:
             # We got cold feet, abort!
             return
 
-        self.device.log.info('Saving spectrum to disk...')
-        # Let's format to JSON for the science folk with sinful f-string mangling
-        settings = ['sensitivity_cal', 'correct_prnu', 'correct_nonlinearity',
-                    'normalize_exposure', 'adjust_offset', 'subtract_dark',
-                    'remove_bad_pixels', 'remove_temp_bad_pixels']
-
-        data = {'timestamp': time.strftime("%Y-%m-%d %H:%M:%S"),
-                'exposure (us)': self.device.exposure.get(),
-                'averages': self.device.exposures_to_average.get(),
-                # Lets do some sneaky conversion to bool from int
-                'settings': {f"{sig}": bool(getattr(self.device, sig).get())
-                             for sig in settings},
-                'wavelength (nm)': [str(x) for x in self.device.wavelengths.get()],
-                'intensity (a.u.)': [str(y) for y in self.device.spectrum.get()]
-                }
-
-        # and let's assume you have permission to save your file where you want to
-        with open(file, 'w') as _f:
-            _f.write(json.dumps(data, indent=4))
+        self.device.save_data(file_dest=file, indent=4)
 
     def file_dialog(self) -> str:
         """
@@ -253,7 +236,8 @@ class QminiBase:
         dialog = QFileDialog(self)
         filename = dialog.getSaveFileName(caption='Select name for file',
                                           dir=os.getcwd(),
-                                          filter='Text files (*.txt, *.csv)',
+                                          filter=('Text files (*.txt *.csv);;'
+                                                  'Spectra (*.npz *.h5 *.hdf5)'),
                                           )
         # We don't care about the filter info, just give us the filename bro
         return filename[0]